@@ -7,179 +7,1912 @@ Install dependencies:
 pip install flask flask-compress requests beautifulsoup4
 """
 
-from flask import Flask, Response, request, render_template_string
+from flask import Flask, Response, request, render_template_string, stream_with_context
 from flask_compress import Compress
-import requests
 import json
+import html
+import io
+import hashlib
+import importlib
+import zlib
 import threading
-from datetime import datetime, timedelta
-from xml.etree.ElementTree import Element, SubElement, tostring
-from xml.dom import minidom
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import lru_cache, partial
+from datetime import datetime, timedelta, timezone
 from urllib.parse import quote, urljoin
 import re
 import time
-from bs4 import BeautifulSoup
 import os
 import pickle
+import sqlite3
+import tempfile
+from array import array
 import signal
 import sys
+import gzip
+try:
+    import brotli
+except ImportError:
+    brotli = None
+try:
+    import lxml  # noqa: F401 - only needed as a BeautifulSoup parser
+except ImportError:
+    lxml = None
+import argparse
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access.
+    
+    Scraping, XML parsing and asyncio are only needed once a chapter has to be
+    fetched, a corpus imported or the ASGI server started, so their imports are
+    kept off the startup path (see benchmarks/bench_startup.py).
+    """
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+    
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+asyncio = LazyModule('asyncio')
+bs4 = LazyModule('bs4')
+requests = LazyModule('requests')
+ElementTree = LazyModule('xml.etree.ElementTree')
 
 app = Flask(__name__)
+# Streamed feeds are compressed incrementally by stream_feed_response; Flask-Compress
+# would otherwise buffer the whole stream before compressing it
+app.config['COMPRESS_STREAMS'] = False
 Compress(app)
 
 # Configuration
 class Config:
-    CACHE_EXPIRY_DAYS = int(os.environ.get('CACHE_EXPIRY_DAYS', 30))
+    CACHE_EXPIRY_DAYS = int(os.environ.get('CACHE_EXPIRY_DAYS', 30))  # soft TTL: refreshed in the background
+    CACHE_HARD_EXPIRY_DAYS = int(os.environ.get('CACHE_HARD_EXPIRY_DAYS', 365))  # past this, callers wait
+    CACHE_REFRESH_WORKERS = int(os.environ.get('CACHE_REFRESH_WORKERS', 2))
+    CACHE_SAVE_DEBOUNCE_SECONDS = float(os.environ.get('CACHE_SAVE_DEBOUNCE_SECONDS', 5))
+    CACHE_SAVE_MAX_DELAY_SECONDS = float(os.environ.get('CACHE_SAVE_MAX_DELAY_SECONDS', 60))
+    SHUTDOWN_FLUSH_SECONDS = float(os.environ.get('SHUTDOWN_FLUSH_SECONDS', 10))
+    CACHE_LOAD_WAIT_SECONDS = float(os.environ.get('CACHE_LOAD_WAIT_SECONDS', 10))  # pickle lookups during startup
+    CACHE_SNAPSHOT_FILE = os.environ.get('CACHE_SNAPSHOT_FILE', 'bible_cache_snapshot.jsonl.gz')  # merged at startup
     MAX_DAYS_TO_GENERATE = int(os.environ.get('MAX_DAYS_TO_GENERATE', 5))
+    # Also the version read from the imported corpus: set it to match what import-corpus loaded
     DEFAULT_BIBLE_VERSION = os.environ.get('DEFAULT_BIBLE_VERSION', 'niv')
     CACHE_FILE = os.environ.get('CACHE_FILE', 'bible_cache.pkl')
+    CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'sqlite')  # 'sqlite' or 'pickle'
+    CACHE_DB_FILE = os.environ.get('CACHE_DB_FILE', 'bible_cache.db')
+    CORPUS_DB_FILE = os.environ.get('CORPUS_DB_FILE', 'bible_corpus.db')
+    CHAPTER_MEMORY_MAX_BYTES = int(os.environ.get('CHAPTER_MEMORY_MAX_BYTES', 32 * 1024 * 1024))
+    CHAPTER_HOT_BYTES = int(os.environ.get('CHAPTER_HOT_BYTES', 8 * 1024 * 1024))
+    FEED_CACHE_MAX_BYTES = int(os.environ.get('FEED_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+    STREAM_FEEDS = os.environ.get('STREAM_FEEDS', 'true').lower() == 'true'
+    FRAGMENT_CACHE_MAX_BYTES = int(os.environ.get('FRAGMENT_CACHE_MAX_BYTES', 16 * 1024 * 1024))  # per cache
+    PRECOMPRESS_FEEDS = os.environ.get('PRECOMPRESS_FEEDS', 'true').lower() == 'true'
+    GZIP_LEVEL = int(os.environ.get('GZIP_LEVEL', 9))
+    BROTLI_QUALITY = int(os.environ.get('BROTLI_QUALITY', 11))
+    WARMER_ENABLED = os.environ.get('WARMER_ENABLED', 'true').lower() == 'true'
+    WARMER_LEAD_MINUTES = int(os.environ.get('WARMER_LEAD_MINUTES', 30))
+    WARMER_ACTIVE_DAYS = int(os.environ.get('WARMER_ACTIVE_DAYS', 7))
+    WARMER_REQUEST_BUDGET = int(os.environ.get('WARMER_REQUEST_BUDGET', 300))
+    WARMER_MAX_FEEDS = int(os.environ.get('WARMER_MAX_FEEDS', 1000))  # least recently polled dropped first
+    ASYNC_FETCH_CONCURRENCY = int(os.environ.get('ASYNC_FETCH_CONCURRENCY', 16))
     PORT = int(os.environ.get('PORT', 5000))
+    WEB_WORKERS = int(os.environ.get('WEB_WORKERS', 2))  # each gets 1/WEB_WORKERS of the upstream budget
+    WEB_THREADS = int(os.environ.get('WEB_THREADS', 8))
+    WEB_TIMEOUT = int(os.environ.get('WEB_TIMEOUT', 120))
+    FEED_DB_FILE = os.environ.get('FEED_DB_FILE', 'bible_feeds.db')
+    SHARED_FEED_CACHE_MAX_BYTES = int(os.environ.get('SHARED_FEED_CACHE_MAX_BYTES', 256 * 1024 * 1024))
+    PREFETCH_WORKERS = int(os.environ.get('PREFETCH_WORKERS', 4))
+    UPSTREAM_REQUESTS_PER_SECOND = float(os.environ.get('UPSTREAM_REQUESTS_PER_SECOND', 2))
+    UPSTREAM_BURST = int(os.environ.get('UPSTREAM_BURST', 4))
+    # Background refreshes of stale chapters get their own, smaller budget on top of the above
+    CACHE_REFRESH_REQUESTS_PER_SECOND = float(os.environ.get('CACHE_REFRESH_REQUESTS_PER_SECOND', 0.5))
+    HTTP_POOL_SIZE = int(os.environ.get('HTTP_POOL_SIZE', 8))
+    HTTP_KEEPALIVE_SECONDS = int(os.environ.get('HTTP_KEEPALIVE_SECONDS', 120))
+    HTTP_CONNECT_TIMEOUT = float(os.environ.get('HTTP_CONNECT_TIMEOUT', 5))
+    BIBLE_GATEWAY_TIMEOUT = float(os.environ.get('BIBLE_GATEWAY_TIMEOUT', 15))
+    BIBLE_API_TIMEOUT = float(os.environ.get('BIBLE_API_TIMEOUT', 10))
+    BREAKER_FAILURE_THRESHOLD = int(os.environ.get('BREAKER_FAILURE_THRESHOLD', 3))
+    BREAKER_RESET_SECONDS = float(os.environ.get('BREAKER_RESET_SECONDS', 60))
+    # Parser for the passage container of scraped pages. lxml is faster but nests unclosed <p>
+    # differently from the reference extractor's html.parser, so it is opt-in
+    PASSAGE_PARSER = os.environ.get('PASSAGE_PARSER', 'html.parser')
+    NEGATIVE_CACHE_SECONDS = int(os.environ.get('NEGATIVE_CACHE_SECONDS', 300))
+    FEED_DEADLINE_SECONDS = float(os.environ.get('FEED_DEADLINE_SECONDS', 20))  # 0 disables
+    PARTIAL_FEED_MAX_AGE = int(os.environ.get('PARTIAL_FEED_MAX_AGE', 60))
+    BATCH_MAX_CHAPTERS = int(os.environ.get('BATCH_MAX_CHAPTERS', 5))  # 1 disables range fetches
+
+class TokenBucket:
+    """Thread-safe token bucket used to pace requests to a single upstream host"""
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def _try_acquire(self):
+        """Consume a token if one is available; otherwise return how long to wait for one"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0
+            return (1 - self.tokens) / self.rate
+    
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            wait = self._try_acquire()
+            if not wait:
+                return
+            time.sleep(wait)
+    
+    async def acquire_async(self):
+        """Like acquire, but yields to the event loop while waiting"""
+        while True:
+            wait = self._try_acquire()
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+class SingleFlight:
+    """Collapse concurrent calls that share a key into a single execution.
+    
+    The first caller for a key runs the function; callers arriving while it is in
+    flight wait for and share its result (or exception).
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = {}
+        self.shared_calls = 0
+    
+    def do(self, key, fn, *args, **kwargs):
+        with self.lock:
+            future = self.in_flight.get(key)
+            if future is not None:
+                self.shared_calls += 1
+                leader = False
+            else:
+                future = Future()
+                self.in_flight[key] = future
+                leader = True
+        
+        if not leader:
+            return future.result()
+        
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self.lock:
+                del self.in_flight[key]
+    
+    def busy(self, key):
+        """Whether a call for key is running right now"""
+        with self.lock:
+            return key in self.in_flight
+
+class CircuitBreaker:
+    """Skips an upstream source after repeated failures instead of waiting out its timeouts.
+    
+    After failure_threshold consecutive failures the breaker opens and allow() answers
+    False. Once reset_timeout seconds have passed, a single caller is let through as a
+    probe (half-open); its success closes the breaker and its failure re-opens it. A
+    probe that never reports back is replaced by another after reset_timeout.
+    """
+    def __init__(self, failure_threshold=3, reset_timeout=60):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.lock = threading.Lock()
+        self.state = 'closed'
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trips = 0
+        self.rejected = 0
+    
+    def allow(self):
+        with self.lock:
+            if self.state == 'closed':
+                return True
+            now = time.monotonic()
+            if now - self.opened_at >= self.reset_timeout:
+                # opened_at doubles as the start of the current probe while half-open
+                self.state = 'half_open'
+                self.opened_at = now
+                return True
+            self.rejected += 1
+            return False
+    
+    def record_success(self):
+        with self.lock:
+            self.state = 'closed'
+            self.failures = 0
+    
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.state == 'half_open' or self.failures >= self.failure_threshold:
+                if self.state != 'open':
+                    self.trips += 1
+                self.state = 'open'
+                self.opened_at = time.monotonic()
+    
+    def stats(self):
+        with self.lock:
+            return {
+                'state': self.state,
+                'consecutive_failures': self.failures,
+                'trips': self.trips,
+                'rejected_calls': self.rejected,
+            }
+
+class UpstreamSession:
+    """Long-lived keep-alive connection pool for one upstream host.
+    
+    A single instance is shared by every request thread: urllib3's pool hands each
+    thread its own connection (blocking when all pool_size are busy) and the cookie
+    jar is internally locked. Connections idle for longer than keepalive seconds are
+    dropped so we never reuse a socket the server has already closed.
+    """
+    def __init__(self, host, pool_size, keepalive, read_timeout, connect_timeout):
+        self.host = host
+        self.pool_size = pool_size
+        self.keepalive = keepalive
+        self.timeout = (connect_timeout, read_timeout)
+        self.lock = threading.Lock()
+        self.session = None  # created on first use so requests isn't imported at startup
+        self.last_used = time.monotonic()
+        self.requests_sent = 0
+        self.retired_connections = 0
+        self.idle_resets = 0
+    
+    def _new_session(self):
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, pool_block=True)
+        session.mount(f"https://{self.host}/", adapter)
+        session.headers['Connection'] = 'keep-alive'
+        return session
+    
+    def _connections_opened(self, session):
+        if session is None:
+            return 0
+        adapter = session.get_adapter(f"https://{self.host}/")
+        pools = adapter.poolmanager.pools
+        return sum(pools[key].num_connections for key in pools.keys())
+    
+    def get(self, url, **kwargs):
+        with self.lock:
+            now = time.monotonic()
+            if self.session is None:
+                self.session = self._new_session()
+            elif now - self.last_used > self.keepalive:
+                # Server has most likely closed our idle sockets; start a fresh pool
+                self.retired_connections += self._connections_opened(self.session)
+                self.session.close()
+                self.session = self._new_session()
+                self.idle_resets += 1
+            self.last_used = now
+            self.requests_sent += 1
+            session = self.session
+        kwargs.setdefault('timeout', self.timeout)
+        return session.get(url, **kwargs)
+    
+    def stats(self):
+        with self.lock:
+            opened = self.retired_connections + self._connections_opened(self.session)
+            return {
+                'requests': self.requests_sent,
+                'connections_opened': opened,
+                'connections_reused': max(self.requests_sent - opened, 0),
+                'idle_resets': self.idle_resets,
+                'pool_size': self.pool_size,
+            }
+
+class CachedChapter:
+    """One chapter held in memory; cold entries keep zlib-compressed UTF-8 instead of a str"""
+    __slots__ = ('data', 'compressed', 'timestamp', 'size')
+    
+    def __init__(self, data, timestamp, compressed=False):
+        self.data = data
+        self.compressed = compressed
+        self.timestamp = timestamp
+        self.size = sys.getsizeof(data)
+    
+    def text(self):
+        return zlib.decompress(self.data).decode('utf-8') if self.compressed else self.data
+    
+    def compress(self):
+        if not self.compressed:
+            self.data = zlib.compress(self.data.encode('utf-8'))
+            self.compressed = True
+            self.size = sys.getsizeof(self.data)
+
+class ChapterMemoryCache:
+    """Byte-bounded in-memory chapter tier.
+    
+    Recently used chapters stay as plain strings in a hot LRU of up to hot_bytes.
+    Entries falling out of it are zlib-compressed into a cold LRU, and the least
+    recently used cold entries are evicted once everything passes max_bytes. A cold
+    hit is decompressed and moved back to the hot LRU. With max_bytes=None nothing
+    is evicted (the pickle backend, where memory holds the only copy).
+    """
+    def __init__(self, max_bytes=None, hot_bytes=8 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.hot_bytes = hot_bytes
+        self.hot = OrderedDict()
+        self.cold = OrderedDict()
+        self.hot_size = 0
+        self.cold_size = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.compressions = 0
+        self.evictions = 0
+    
+    def get(self, key):
+        """Return (text, timestamp) or None"""
+        with self.lock:
+            entry = self.hot.get(key)
+            if entry is not None:
+                self.hot.move_to_end(key)
+                self.hits += 1
+                return entry.data, entry.timestamp
+            entry = self.cold.pop(key, None)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.cold_size -= entry.size
+            text = entry.text()
+            self._insert(key, CachedChapter(text, entry.timestamp))
+            return text, entry.timestamp
+    
+    def put(self, key, text, timestamp, replace=True):
+        with self.lock:
+            if not replace and (key in self.hot or key in self.cold):
+                return
+            self._remove(key)
+            self._insert(key, CachedChapter(text, timestamp))
+    
+    def put_compressed(self, key, data, timestamp, replace=True):
+        """Load an already-compressed entry straight into the cold LRU"""
+        with self.lock:
+            if not replace and (key in self.hot or key in self.cold):
+                return
+            self._remove(key)
+            entry = CachedChapter(data, timestamp, compressed=True)
+            self.cold[key] = entry
+            self.cold_size += entry.size
+            self._evict()
+    
+    def merge(self, key, text, timestamp):
+        """Store text unless the entry already held is at least as new; returns whether it was stored"""
+        with self.lock:
+            current = self.hot.get(key) or self.cold.get(key)
+            if current is not None and current.timestamp >= timestamp:
+                return False
+            self._remove(key)
+            self._insert(key, CachedChapter(text, timestamp))
+            return True
+    
+    def pop(self, key):
+        with self.lock:
+            self._remove(key)
+    
+    def _remove(self, key):
+        entry = self.hot.pop(key, None)
+        if entry is not None:
+            self.hot_size -= entry.size
+        entry = self.cold.pop(key, None)
+        if entry is not None:
+            self.cold_size -= entry.size
+    
+    def _insert(self, key, entry):
+        self.hot[key] = entry
+        self.hot_size += entry.size
+        while self.hot_size > self.hot_bytes and len(self.hot) > 1:
+            cold_key, cold_entry = self.hot.popitem(last=False)
+            self.hot_size -= cold_entry.size
+            cold_entry.compress()
+            self.compressions += 1
+            self.cold[cold_key] = cold_entry
+            self.cold_size += cold_entry.size
+        self._evict()
+    
+    def _evict(self):
+        if self.max_bytes is None:
+            return
+        while self.hot_size + self.cold_size > self.max_bytes and (self.cold or len(self.hot) > 1):
+            source = self.cold if self.cold else self.hot
+            _, evicted = source.popitem(last=False)
+            if source is self.cold:
+                self.cold_size -= evicted.size
+            else:
+                self.hot_size -= evicted.size
+            self.evictions += 1
+    
+    def entries(self):
+        """Snapshot of (key, data, compressed, timestamp), cold first.
+        
+        The tuples are built under the lock: a CachedChapter read afterwards could be
+        compressed by a concurrent insert between reading its data and its flag.
+        """
+        with self.lock:
+            return [(key, entry.data, entry.compressed, entry.timestamp)
+                    for entries in (self.cold, self.hot) for key, entry in entries.items()]
+    
+    def __len__(self):
+        return len(self.hot) + len(self.cold)
+    
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self.hot) + len(self.cold),
+                'hot_entries': len(self.hot),
+                'cold_entries': len(self.cold),
+                'bytes': self.hot_size + self.cold_size,
+                'hot_bytes': self.hot_size,
+                'max_bytes': self.max_bytes,
+                'hit_ratio': round(self.hits / lookups, 3) if lookups else None,
+                'hits': self.hits,
+                'misses': self.misses,
+                'compressions': self.compressions,
+                'evictions': self.evictions,
+            }
+
+class StaleRefresher:
+    """Small worker pool that refreshes stale cache entries off the request path.
+    
+    The owning cache hands over keys whose soft TTL has passed; handler(key) is
+    set by the text provider and re-fetches the chapter. Each key is queued at most
+    once at a time.
+    """
+    def __init__(self, workers=2):
+        self.handler = None
+        self.workers = workers
+        self.pool = None
+        self.lock = threading.Lock()
+        self.in_flight = set()
+        self.scheduled = 0
+        self.failed = 0
+    
+    def schedule(self, key):
+        if self.handler is None:
+            return
+        with self.lock:
+            if key in self.in_flight:
+                return
+            self.in_flight.add(key)
+            self.scheduled += 1
+            if self.pool is None:
+                self.pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='cache-refresh')
+        self.pool.submit(self._refresh, key)
+    
+    def _refresh(self, key):
+        try:
+            self.handler(key)
+        except Exception as e:
+            self.failed += 1
+            print(f"Background refresh of {key} failed: {e}")
+        finally:
+            with self.lock:
+                self.in_flight.discard(key)
+    
+    def stats(self):
+        with self.lock:
+            return {'in_flight': len(self.in_flight), 'scheduled': self.scheduled, 'failed': self.failed}
+
+def iter_pickle_entries(cache):
+    """(key, data, compressed, timestamp) for a pickled chapter cache.
+    
+    Reads both the original {'data', 'timestamp'} dict entries and the compact
+    (data, compressed, timestamp) tuples written now.
+    """
+    for key, entry in cache.items():
+        if isinstance(entry, dict):
+            yield key, entry['data'], False, entry['timestamp'].timestamp()
+        else:
+            yield (key, *entry)
+
+SNAPSHOT_FORMAT = 'bible-rss-chapter-cache'
+SNAPSHOT_VERSION = 1
+
+@contextmanager
+def atomic_file(path):
+    """Write path through a private temp file in the same directory.
+    
+    The temp file is fsynced and renamed over path only once the block succeeds, so
+    readers never see a partial file, and each process (and each save) has its own
+    temp file, so concurrent writers can't interleave into one.
+    """
+    fd, temp_file = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                                     prefix=f".{os.path.basename(path)}.")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, path)
+    except BaseException:
+        os.unlink(temp_file)
+        raise
+
+def write_snapshot(path, entries):
+    """Write (key, text, timestamp) entries to a gzipped JSON-lines snapshot; returns the count.
+    
+    The first line is a header naming the format and version, then one
+    [key, timestamp, text] array per chapter. The file is written next to path
+    and renamed into place.
+    """
+    count = 0
+    with atomic_file(path) as raw, gzip.open(raw, 'wt', encoding='utf-8', compresslevel=9) as f:
+        header = {'format': SNAPSHOT_FORMAT, 'version': SNAPSHOT_VERSION, 'created': datetime.now().isoformat()}
+        f.write(json.dumps(header) + '\n')
+        for key, text, timestamp in entries:
+            f.write(json.dumps([key, timestamp, text], ensure_ascii=False) + '\n')
+            count += 1
+    return count
+
+def read_snapshot(path):
+    """Yield (key, text, timestamp) from a snapshot written by write_snapshot"""
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        header = json.loads(f.readline() or '{}')
+        if header.get('format') != SNAPSHOT_FORMAT:
+            raise ValueError(f"{path} is not a chapter cache snapshot")
+        if header.get('version') != SNAPSHOT_VERSION:
+            raise ValueError(f"{path} has snapshot version {header.get('version')}, expected {SNAPSHOT_VERSION}")
+        for line in f:
+            key, timestamp, text = json.loads(line)
+            yield key, text, timestamp
 
 class PersistentCache:
-    def __init__(self, cache_file='bible_cache.pkl', expiry_days=30):
+    """Chapter cache held in memory and pickled to cache_file.
+    
+    Requests never touch the disk: set() only counts the change and wakes a
+    background saver thread. The saver waits until changes have been quiet for
+    save_debounce seconds (but never holds them longer than max_delay), snapshots
+    the entries under the memory lock and writes them to a temp file that is then
+    renamed over cache_file, so readers of the file never see a torn write.
+    
+    The file is read by a background thread so startup doesn't wait for it. A
+    lookup that misses before loading has finished waits for the loader (the
+    pickle can't be read one key at a time); loaded is set once it is done.
+    Expired entries are dropped when they are looked up or the cache is saved.
+    """
+    def __init__(self, cache_file='bible_cache.pkl', expiry_days=30, hard_expiry_days=365,
+                 save_debounce=5, max_delay=60, snapshot_file=None):
         self.cache_file = cache_file
+        self.snapshot_file = snapshot_file
         self.expiry_delta = timedelta(days=expiry_days)
-        self.cache = self._load_cache()
-        self.unsaved_changes = False
+        self.hard_expiry_delta = timedelta(days=max(hard_expiry_days, expiry_days))
+        self.refresher = StaleRefresher(Config.CACHE_REFRESH_WORKERS)
+        self.memory = ChapterMemoryCache(None, Config.CHAPTER_HOT_BYTES)
+        self.save_debounce = save_debounce
+        self.max_delay = max_delay
+        self.lock = threading.Lock()
+        self.save_lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.saver = None
+        self.pending_changes = 0
+        self.first_change = None
+        self.last_change = None
+        self.saves = 0
+        self.save_errors = 0
+        self.last_save = None
+        self.last_save_seconds = None
+        self.loaded = threading.Event()
+        threading.Thread(target=self._load_cache, name='cache-loader', daemon=True).start()
     
     def _load_cache(self):
-        if os.path.exists(self.cache_file):
-            try:
+        try:
+            if os.path.exists(self.cache_file):
                 with open(self.cache_file, 'rb') as f:
                     cache = pickle.load(f)
-                # Clean expired entries
-                now = datetime.now()
-                cleaned = {k: v for k, v in cache.items() 
-                          if now - v['timestamp'] < self.expiry_delta}
-                print(f"Loaded cache with {len(cleaned)} valid entries")
-                return cleaned
+                # Chapters set since startup are newer than anything in the file
+                for key, data, compressed, timestamp in iter_pickle_entries(cache):
+                    if compressed:
+                        self.memory.put_compressed(key, data, timestamp, replace=False)
+                    else:
+                        self.memory.put(key, data, timestamp, replace=False)
+                print(f"Loaded cache with {len(self.memory)} entries")
+        except Exception as e:
+            print(f"Error loading cache: {e}")
+        if self.snapshot_file and os.path.exists(self.snapshot_file):
+            try:
+                merged = self._merge(read_snapshot(self.snapshot_file))
+                print(f"Merged {merged} entries from snapshot {self.snapshot_file}")
             except Exception as e:
-                print(f"Error loading cache: {e}")
-                return {}
-        return {}
+                print(f"Error loading snapshot {self.snapshot_file}: {e}")
+        self.loaded.set()
     
-    def get(self, key):
-        if key in self.cache:
-            entry = self.cache[key]
-            if datetime.now() - entry['timestamp'] < self.expiry_delta:
-                return entry['data']
+    def get(self, key, refresh=True):
+        """Cached text for key, or None; a stale hit is refreshed in the background unless refresh=False"""
+        entry = self.memory.get(key)
+        if entry is None and not self.loaded.is_set():
+            self.loaded.wait(Config.CACHE_LOAD_WAIT_SECONDS)
+            entry = self.memory.get(key)
+        if entry is not None:
+            data, timestamp = entry
+            age = datetime.now() - datetime.fromtimestamp(timestamp)
+            if age < self.expiry_delta:
+                return data
+            elif age < self.hard_expiry_delta:
+                # Stale: serve it now, refresh in the background
+                if refresh:
+                    self.refresher.schedule(key)
+                return data
             else:
                 # Remove expired entry
-                del self.cache[key]
-                self.unsaved_changes = True
+                self.memory.pop(key)
+                self._mark_dirty()
         return None
     
     def set(self, key, value):
-        self.cache[key] = {
-            'data': value,
-            'timestamp': datetime.now()
-        }
-        self.unsaved_changes = True
-        # Save every 10 changes
-        if len(self.cache) % 10 == 0:
+        self.memory.put(key, value, datetime.now().timestamp())
+        self._mark_dirty()
+    
+    def snapshot_entries(self):
+        """(key, text, timestamp) for every entry that hasn't hard-expired"""
+        self.loaded.wait()
+        cutoff = (datetime.now() - self.hard_expiry_delta).timestamp()
+        return [(key, zlib.decompress(data).decode('utf-8') if compressed else data, timestamp)
+                for key, data, compressed, timestamp in self.memory.entries() if timestamp > cutoff]
+    
+    def merge_entries(self, entries):
+        """Add (key, text, timestamp) entries, keeping whichever copy of a key is newer"""
+        self.loaded.wait()
+        return self._merge(entries)
+    
+    def _merge(self, entries):
+        cutoff = (datetime.now() - self.hard_expiry_delta).timestamp()
+        merged = sum(1 for key, text, timestamp in entries
+                     if timestamp > cutoff and self.memory.merge(key, text, timestamp))
+        if merged:
+            self._mark_dirty()
+        return merged
+    
+    def _mark_dirty(self):
+        with self.lock:
+            now = time.monotonic()
+            if not self.pending_changes:
+                self.first_change = now
+            self.pending_changes += 1
+            self.last_change = now
+            # A saver started before a fork does not exist in the child
+            if self.saver is None or not self.saver.is_alive():
+                self.saver = threading.Thread(target=self._save_loop, name='cache-saver', daemon=True)
+                self.saver.start()
+        self.wakeup.set()
+    
+    def _save_loop(self):
+        while True:
+            self.wakeup.wait()
+            self.wakeup.clear()
+            # Debounce: let a burst of changes finish, but don't starve under constant writes
+            while True:
+                with self.lock:
+                    if not self.pending_changes:
+                        break
+                    now = time.monotonic()
+                    quiet = now - self.last_change
+                    waited = now - self.first_change
+                    if quiet >= self.save_debounce or waited >= self.max_delay:
+                        break
+                    delay = min(self.save_debounce - quiet, self.max_delay - waited)
+                time.sleep(delay)
             self._save_cache()
     
     def _save_cache(self):
+        # Saving before the file is loaded would overwrite it with just the new entries
+        self.loaded.wait()
+        with self.save_lock:
+            with self.lock:
+                saved_changes = self.pending_changes
+            if not saved_changes:
+                return
+            started = time.monotonic()
+            cutoff = (datetime.now() - self.hard_expiry_delta).timestamp()
+            entries = {key: (data, compressed, timestamp)
+                       for key, data, compressed, timestamp in self.memory.entries() if timestamp > cutoff}
+            try:
+                with atomic_file(self.cache_file) as f:
+                    pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as e:
+                self.save_errors += 1
+                print(f"Error saving cache: {e}")
+                return
+            with self.lock:
+                # Changes made while we were writing stay pending for the next save
+                self.pending_changes -= saved_changes
+                if self.pending_changes:
+                    self.first_change = started
+                    self.wakeup.set()
+                self.saves += 1
+                self.last_save = datetime.now()
+                self.last_save_seconds = time.monotonic() - started
+            print(f"Saved cache with {len(entries)} entries")
+    
+    def force_save(self, timeout=None):
+        """Write pending changes now; with a timeout, stop waiting after that many seconds"""
+        if timeout is None:
+            self._save_cache()
+            return
+        writer = threading.Thread(target=self._save_cache, name='cache-flush', daemon=True)
+        writer.start()
+        writer.join(timeout)
+        if writer.is_alive():
+            print(f"Cache flush did not finish within {timeout}s; the previous cache file is kept")
+    
+    def persistence_stats(self):
+        with self.lock:
+            return {
+                'pending_changes': self.pending_changes,
+                'saves': self.saves,
+                'save_errors': self.save_errors,
+                'last_save': self.last_save.isoformat() if self.last_save else None,
+                'last_save_seconds': round(self.last_save_seconds, 3) if self.last_save_seconds is not None else None,
+            }
+    
+    def close(self):
+        self.force_save()
+    
+    def __len__(self):
+        return len(self.memory)
+
+class SQLiteCache:
+    """PersistentCache-compatible chapter store backed by SQLite in WAL mode.
+    
+    Every set() commits a single row, so writes cost the same regardless of cache
+    size and a crash loses at most the entry being written. Each thread gets its
+    own connection; WAL lets readers proceed while another thread writes.
+    
+    Lookups go straight to the table, so the one-off pickle migration and the
+    purge of expired rows run in a background thread after startup.
+    """
+    def __init__(self, db_file='bible_cache.db', expiry_days=30, migrate_from=None, hard_expiry_days=365,
+                 snapshot_file=None):
+        self.db_file = db_file
+        self.expiry_delta = timedelta(days=expiry_days)
+        self.hard_expiry_delta = timedelta(days=max(hard_expiry_days, expiry_days))
+        self.refresher = StaleRefresher(Config.CACHE_REFRESH_WORKERS)
+        self.local = threading.local()
+        # Hot chapters are answered from memory without a query
+        self.memory = ChapterMemoryCache(Config.CHAPTER_MEMORY_MAX_BYTES, Config.CHAPTER_HOT_BYTES)
+        conn = self._conn()
+        conn.execute("""CREATE TABLE IF NOT EXISTS chapters (
+            key TEXT PRIMARY KEY,
+            data TEXT NOT NULL,
+            timestamp REAL NOT NULL
+        )""")
+        conn.execute("CREATE INDEX IF NOT EXISTS chapters_timestamp ON chapters (timestamp)")
+        self.loaded = threading.Event()
+        threading.Thread(target=self._finish_loading, args=(migrate_from, snapshot_file), name='cache-loader',
+                         daemon=True).start()
+    
+    def _finish_loading(self, migrate_from, snapshot_file):
         try:
-            with open(self.cache_file, 'wb') as f:
-                pickle.dump(self.cache, f)
-            self.unsaved_changes = False
-            print(f"Saved cache with {len(self.cache)} entries")
+            if migrate_from:
+                self._migrate_pickle(migrate_from)
+            if snapshot_file and os.path.exists(snapshot_file):
+                try:
+                    merged = self.merge_entries(read_snapshot(snapshot_file))
+                    print(f"Merged {merged} entries from snapshot {snapshot_file}")
+                except (OSError, EOFError, ValueError) as e:
+                    print(f"Error loading snapshot {snapshot_file}: {e}")
+            self.purge_expired()
+            print(f"Opened cache database {self.db_file} with {len(self)} valid entries")
+        except sqlite3.Error as e:
+            print(f"Error preparing cache database: {e}")
+        finally:
+            self.close()
+            self.loaded.set()
+    
+    def _conn(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_file, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self.local.conn = conn
+        return conn
+    
+    def _migrate_pickle(self, pickle_file):
+        """Import an existing pickle cache the first time the database is created"""
+        conn = self._conn()
+        if not os.path.exists(pickle_file) or conn.execute("SELECT 1 FROM chapters LIMIT 1").fetchone():
+            return
+        try:
+            with open(pickle_file, 'rb') as f:
+                cache = pickle.load(f)
+            rows = [(key, zlib.decompress(data).decode('utf-8') if compressed else data, timestamp)
+                    for key, data, compressed, timestamp in iter_pickle_entries(cache)]
+            with conn:
+                conn.execute("BEGIN")
+                conn.executemany("INSERT OR REPLACE INTO chapters (key, data, timestamp) VALUES (?, ?, ?)", rows)
+            print(f"Migrated {len(rows)} entries from {pickle_file}")
         except Exception as e:
-            print(f"Error saving cache: {e}")
+            print(f"Error migrating pickle cache: {e}")
     
-    def force_save(self):
-        if self.unsaved_changes:
-            self._save_cache()
+    def get(self, key, refresh=True):
+        """Cached text for key, or None; a stale hit is refreshed in the background unless refresh=False"""
+        row = self.memory.get(key)
+        if row is None:
+            row = self._conn().execute("SELECT data, timestamp FROM chapters WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self.memory.put(key, *row)
+        data, timestamp = row
+        age = datetime.now() - datetime.fromtimestamp(timestamp)
+        if age < self.expiry_delta:
+            return data
+        if age < self.hard_expiry_delta:
+            # Stale: serve it now, refresh in the background
+            if refresh:
+                self.refresher.schedule(key)
+            return data
+        # Remove expired entry
+        self.memory.pop(key)
+        self._conn().execute("DELETE FROM chapters WHERE key = ?", (key,))
+        return None
+    
+    def set(self, key, value):
+        timestamp = datetime.now().timestamp()
+        self._conn().execute("INSERT OR REPLACE INTO chapters (key, data, timestamp) VALUES (?, ?, ?)",
+                             (key, value, timestamp))
+        self.memory.put(key, value, timestamp)
+    
+    def snapshot_entries(self):
+        """(key, text, timestamp) for every row that hasn't hard-expired"""
+        self.loaded.wait()
+        cutoff = (datetime.now() - self.hard_expiry_delta).timestamp()
+        return self._conn().execute("SELECT key, data, timestamp FROM chapters WHERE timestamp > ? ORDER BY key",
+                                    (cutoff,)).fetchall()
+    
+    def merge_entries(self, entries):
+        """Add (key, text, timestamp) entries, keeping whichever copy of a key is newer"""
+        cutoff = (datetime.now() - self.hard_expiry_delta).timestamp()
+        rows = [(key, text, timestamp) for key, text, timestamp in entries if timestamp > cutoff]
+        conn = self._conn()
+        before = conn.total_changes
+        with conn:
+            conn.execute("BEGIN")
+            conn.executemany("""INSERT INTO chapters (key, data, timestamp) VALUES (?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET data = excluded.data, timestamp = excluded.timestamp
+                WHERE excluded.timestamp > chapters.timestamp""", rows)
+        # The memory tier may hold an older copy of a replaced row
+        for key, _, _ in rows:
+            self.memory.pop(key)
+        return conn.total_changes - before
+    
+    def purge_expired(self):
+        cutoff = (datetime.now() - self.hard_expiry_delta).timestamp()
+        self._conn().execute("DELETE FROM chapters WHERE timestamp < ?", (cutoff,))
+    
+    def force_save(self, timeout=None):
+        # Rows are committed as they are written; just fold the WAL back into the database
+        try:
+            self._conn().execute("PRAGMA wal_checkpoint(PASSIVE)")
+        except sqlite3.Error as e:
+            print(f"Error checkpointing cache: {e}")
+    
+    def persistence_stats(self):
+        return {'pending_changes': 0}  # every set() is its own committed transaction
+    
+    def close(self):
+        """Close this thread's connection (SQLite handles must not be carried across fork)"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self.local.conn = None
+    
+    def __len__(self):
+        return self._conn().execute("SELECT COUNT(*) FROM chapters").fetchone()[0]
+
+class RenderedFeed:
+    """A rendered feed document with its HTTP validators and pre-compressed variants"""
+    __slots__ = ('body', 'etag', 'last_modified', 'encodings')
+    
+    def __init__(self, body):
+        self.body = body
+        self.etag = hashlib.sha1(body).hexdigest()
+        self.last_modified = datetime.utcnow().replace(microsecond=0)
+        self.encodings = {}
+    
+    def compress(self):
+        """Return the body's compressed variants, by content coding.
+        
+        Compressed once at a high level and served as-is until the reading day changes;
+        slow at these levels, so FeedCache runs it in the background.
+        """
+        encodings = {'gzip': gzip.compress(self.body, compresslevel=Config.GZIP_LEVEL, mtime=0)}
+        if brotli is not None:
+            encodings['br'] = brotli.compress(self.body, quality=Config.BROTLI_QUALITY)
+        return encodings
+    
+    @classmethod
+    def restore(cls, body, etag, last_modified, encodings):
+        """Rebuild an entry rendered by another process without hashing or compressing again"""
+        entry = cls.__new__(cls)
+        entry.body = body
+        entry.etag = etag
+        entry.last_modified = last_modified
+        entry.encodings = encodings
+        return entry
+    
+    @property
+    def size(self):
+        return len(self.body) + sum(len(data) for data in self.encodings.values())
+
+class FeedCache:
+    """LRU of rendered feeds, bounded by the total size of the stored bodies.
+    
+    With a shared store attached (multi-process mode) a local miss falls through to
+    it, so a feed rendered by one worker is served by all of them. With precompress,
+    new entries are compressed on a background thread and served uncompressed until
+    that finishes, keeping the compression off the request path.
+    """
+    def __init__(self, max_bytes, shared=None, precompress=False):
+        self.max_bytes = max_bytes
+        self.shared = shared
+        self.compress_pool = (ThreadPoolExecutor(max_workers=1, thread_name_prefix='compress')
+                              if precompress else None)
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+        if self.shared is not None:
+            entry = self.shared.get(key)
+            if entry is not None:
+                self._store(key, entry)
+            return entry
+        return None
+    
+    def peek(self, key):
+        """Whether key is held in this process's memory; never touches the shared store"""
+        with self.lock:
+            return key in self.entries
+    
+    def put(self, key, body):
+        entry = RenderedFeed(body)
+        if self.shared is not None:
+            self.shared.put(key, entry)
+        self._store(key, entry)
+        if self.compress_pool is not None:
+            self.compress_pool.submit(self._compress, key, entry)
+        return entry
+    
+    def _compress(self, key, entry):
+        try:
+            encodings = entry.compress()
+        except Exception as e:
+            print(f"Error compressing feed: {e}")
+            return
+        with self.lock:
+            # Swapped in whole, so a concurrent reader sees either none or all of the variants
+            entry.encodings = encodings
+            if self.entries.get(key) is entry:
+                self.size += sum(len(data) for data in encodings.values())
+                while self.size > self.max_bytes:
+                    _, evicted = self.entries.popitem(last=False)
+                    self.size -= evicted.size
+                    self.evictions += 1
+        if self.shared is not None:
+            self.shared.put(key, entry)
+    
+    def _store(self, key, entry):
+        if entry.size > self.max_bytes:
+            return
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.size -= old.size
+            self.entries[key] = entry
+            self.size += entry.size
+            while self.size > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= evicted.size
+                self.evictions += 1
+    
+    def stats(self):
+        with self.lock:
+            stats = {
+                'entries': len(self.entries),
+                'bytes': self.size,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+        if self.shared is not None:
+            stats['shared'] = self.shared.stats()
+        return stats
+
+class SharedFeedStore:
+    """Rendered feeds (with their compressed variants) in SQLite, shared by worker processes.
+    
+    Feeds are deterministic for a given key and reading day, so entries never need
+    invalidating; the store is bounded by total size, dropping the oldest first.
+    Also records which feeds are active so a single warmer can see every worker's traffic.
+    """
+    def __init__(self, db_file='bible_feeds.db', max_bytes=256 * 1024 * 1024, active_trim_seconds=300):
+        self.db_file = db_file
+        self.max_bytes = max_bytes
+        # touch_feed caps active_feeds at most this often per process rather than on every call
+        self.active_trim_seconds = active_trim_seconds
+        self.active_trimmed = None
+        self.local = threading.local()
+        self.hits = 0
+        self.misses = 0
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("""CREATE TABLE IF NOT EXISTS feeds (
+            key TEXT PRIMARY KEY,
+            body BLOB NOT NULL,
+            gzip BLOB,
+            br BLOB,
+            etag TEXT NOT NULL,
+            last_modified REAL NOT NULL,
+            size INTEGER NOT NULL,
+            stored REAL NOT NULL
+        )""")
+        conn.execute("CREATE INDEX IF NOT EXISTS feeds_stored ON feeds (stored)")
+        conn.execute("""CREATE TABLE IF NOT EXISTS active_feeds (
+            key TEXT PRIMARY KEY,
+            last_seen REAL NOT NULL
+        )""")
+        # Running total of feeds.size, kept by triggers so every process sees the same figure
+        # without summing the table on each put
+        conn.execute("""CREATE TABLE IF NOT EXISTS feeds_size (
+            id INTEGER PRIMARY KEY CHECK (id = 0),
+            bytes INTEGER NOT NULL
+        )""")
+        conn.execute("INSERT OR IGNORE INTO feeds_size (id, bytes) "
+                     "SELECT 0, COALESCE(SUM(size), 0) FROM feeds")
+        conn.execute("""CREATE TRIGGER IF NOT EXISTS feeds_size_insert AFTER INSERT ON feeds BEGIN
+            UPDATE feeds_size SET bytes = bytes + new.size WHERE id = 0;
+        END""")
+        conn.execute("""CREATE TRIGGER IF NOT EXISTS feeds_size_delete AFTER DELETE ON feeds BEGIN
+            UPDATE feeds_size SET bytes = bytes - old.size WHERE id = 0;
+        END""")
+        conn.execute("COMMIT")
+    
+    def _conn(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_file, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self.local.conn = conn
+        return conn
+    
+    def get(self, key):
+        row = self._conn().execute("SELECT body, gzip, br, etag, last_modified FROM feeds WHERE key = ?",
+                                   (repr(key),)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        body, gzip_body, br_body, etag, last_modified = row
+        encodings = {name: data for name, data in (('gzip', gzip_body), ('br', br_body)) if data is not None}
+        return RenderedFeed.restore(body, etag, datetime.utcfromtimestamp(last_modified), encodings)
+    
+    def put(self, key, entry):
+        if entry.size > self.max_bytes:
+            return
+        conn = self._conn()
+        last_modified = entry.last_modified.replace(tzinfo=timezone.utc).timestamp()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Delete and insert rather than INSERT OR REPLACE, whose implicit delete skips the size trigger
+            conn.execute("DELETE FROM feeds WHERE key = ?", (repr(key),))
+            conn.execute("INSERT INTO feeds (key, body, gzip, br, etag, last_modified, size, stored) "
+                         "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                         (repr(key), entry.body, entry.encodings.get('gzip'), entry.encodings.get('br'),
+                          entry.etag, last_modified, entry.size, time.time()))
+            # Drop the oldest entries until the rest fit in max_bytes
+            total = conn.execute("SELECT bytes FROM feeds_size WHERE id = 0").fetchone()[0]
+            if total > self.max_bytes:
+                stale = []
+                for old_key, size in conn.execute("SELECT key, size FROM feeds ORDER BY stored"):
+                    if total <= self.max_bytes:
+                        break
+                    stale.append((old_key,))
+                    total -= size
+                conn.executemany("DELETE FROM feeds WHERE key = ?", stale)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    
+    def touch_feed(self, key, when, max_feeds=None):
+        conn = self._conn()
+        conn.execute("INSERT OR REPLACE INTO active_feeds (key, last_seen) VALUES (?, ?)",
+                     (json.dumps(key), when.timestamp()))
+        now = time.monotonic()
+        if max_feeds is not None and (self.active_trimmed is None
+                                      or now - self.active_trimmed >= self.active_trim_seconds):
+            self.active_trimmed = now
+            conn.execute("DELETE FROM active_feeds WHERE key NOT IN "
+                         "(SELECT key FROM active_feeds ORDER BY last_seen DESC LIMIT ?)", (max_feeds,))
+    
+    def active_feeds(self, cutoff):
+        """Feeds any worker has served since cutoff, as {key tuple: last_seen}"""
+        conn = self._conn()
+        conn.execute("DELETE FROM active_feeds WHERE last_seen < ?", (cutoff.timestamp(),))
+        return {tuple(json.loads(key)): datetime.fromtimestamp(last_seen)
+                for key, last_seen in conn.execute("SELECT key, last_seen FROM active_feeds")}
+    
+    def close(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self.local.conn = None
+    
+    def stats(self):
+        conn = self._conn()
+        entries = conn.execute("SELECT COUNT(*) FROM feeds").fetchone()[0]
+        size = conn.execute("SELECT bytes FROM feeds_size WHERE id = 0").fetchone()[0]
+        return {'entries': entries, 'bytes': size, 'max_bytes': self.max_bytes,
+                'hits': self.hits, 'misses': self.misses}
+
+class LRUCache:
+    """Small thread-safe LRU bounded by the total size its callers report for the values"""
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+    
+    def put(self, key, value, size):
+        if size > self.max_bytes:
+            return
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.size -= old[1]
+            self.entries[key] = (value, size)
+            self.size += size
+            while self.size > self.max_bytes:
+                _, (_, evicted_size) = self.entries.popitem(last=False)
+                self.size -= evicted_size
+    
+    def stats(self):
+        with self.lock:
+            return {'entries': len(self.entries), 'bytes': self.size, 'max_bytes': self.max_bytes,
+                    'hits': self.hits, 'misses': self.misses}
+
+class NegativeCache:
+    """Short-lived record of chapters no upstream source could supply.
+    
+    While an entry is fresh, readers get the fallback text without another upstream
+    attempt. Once it expires, the next reader still gets the fallback immediately and
+    is told to start one background retry; the entry is extended meanwhile.
+    """
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.retries = 0
+    
+    def add(self, key):
+        with self.lock:
+            self.entries[key] = time.monotonic() + self.ttl
+    
+    def discard(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+    
+    def __contains__(self, key):
+        with self.lock:
+            return key in self.entries
+    
+    def check(self, key):
+        """None if key is not negative-cached, else whether the caller should retry it now"""
+        with self.lock:
+            expires = self.entries.get(key)
+            if expires is None:
+                return None
+            now = time.monotonic()
+            if now < expires:
+                return False
+            self.entries[key] = now + self.ttl
+            self.retries += 1
+            return True
+    
+    def stats(self):
+        with self.lock:
+            return {'entries': len(self.entries), 'ttl_seconds': self.ttl, 'retries': self.retries}
+
+def create_cache():
+    """Build the chapter cache selected by Config.CACHE_BACKEND"""
+    if Config.CACHE_BACKEND == 'pickle':
+        return PersistentCache(Config.CACHE_FILE, Config.CACHE_EXPIRY_DAYS, Config.CACHE_HARD_EXPIRY_DAYS,
+                               Config.CACHE_SAVE_DEBOUNCE_SECONDS, Config.CACHE_SAVE_MAX_DELAY_SECONDS,
+                               snapshot_file=Config.CACHE_SNAPSHOT_FILE)
+    return SQLiteCache(Config.CACHE_DB_FILE, Config.CACHE_EXPIRY_DAYS, migrate_from=Config.CACHE_FILE,
+                       hard_expiry_days=Config.CACHE_HARD_EXPIRY_DAYS, snapshot_file=Config.CACHE_SNAPSHOT_FILE)
+
+def export_snapshot(path, cache):
+    """Write the chapter cache to a snapshot that new deployments can start from"""
+    count = write_snapshot(path, cache.snapshot_entries())
+    print(f"Exported {count} chapters to {path} ({os.path.getsize(path) / 1024:.0f} KB)")
+    return count
+
+def import_snapshot(paths, cache):
+    """Merge snapshot files into the chapter cache; newer entries win"""
+    merged = 0
+    for path in paths:
+        count = cache.merge_entries(read_snapshot(path))
+        print(f"Merged {count} chapters from {path}")
+        merged += count
+    cache.force_save()
+    return merged
+
+# Book codes (as used by eBible.org and USFM \id lines), keyed by the book names used in reading plans
+BOOK_FILENAMES = {
+    'Genesis': 'GEN', 'Exodus': 'EXO', 'Leviticus': 'LEV', 'Numbers': 'NUM',
+    'Deuteronomy': 'DEU', 'Joshua': 'JOS', 'Judges': 'JDG', 'Ruth': 'RUT',
+    '1 Samuel': '1SA', '2 Samuel': '2SA', '1 Kings': '1KI', '2 Kings': '2KI',
+    '1 Chronicles': '1CH', '2 Chronicles': '2CH', 'Ezra': 'EZR', 'Nehemiah': 'NEH',
+    'Esther': 'EST', 'Job': 'JOB', 'Psalms': 'PSA', 'Proverbs': 'PRO',
+    'Ecclesiastes': 'ECC', 'Song of Solomon': 'SNG', 'Isaiah': 'ISA',
+    'Jeremiah': 'JER', 'Lamentations': 'LAM', 'Ezekiel': 'EZK', 'Daniel': 'DAN',
+    'Hosea': 'HOS', 'Joel': 'JOL', 'Amos': 'AMO', 'Obadiah': 'OBA', 'Jonah': 'JON',
+    'Micah': 'MIC', 'Nahum': 'NAM', 'Habakkuk': 'HAB', 'Zephaniah': 'ZEP',
+    'Haggai': 'HAG', 'Zechariah': 'ZEC', 'Malachi': 'MAL',
+    'Matthew': 'MAT', 'Mark': 'MRK', 'Luke': 'LUK', 'John': 'JHN',
+    'Acts': 'ACT', 'Romans': 'ROM', '1 Corinthians': '1CO', '2 Corinthians': '2CO',
+    'Galatians': 'GAL', 'Ephesians': 'EPH', 'Philippians': 'PHP', 'Colossians': 'COL',
+    '1 Thessalonians': '1TH', '2 Thessalonians': '2TH', '1 Timothy': '1TI',
+    '2 Timothy': '2TI', 'Titus': 'TIT', 'Philemon': 'PHM', 'Hebrews': 'HEB',
+    'James': 'JAS', '1 Peter': '1PE', '2 Peter': '2PE', '1 John': '1JN',
+    '2 John': '2JN', '3 John': '3JN', 'Jude': 'JUD', 'Revelation': 'REV'
+}
+
+# Canonical Protestant order, used to resolve numbered books (e.g. Zefania bnumber="1")
+CANONICAL_BOOK_CODES = [
+    'GEN', 'EXO', 'LEV', 'NUM', 'DEU', 'JOS', 'JDG', 'RUT', '1SA', '2SA', '1KI', '2KI',
+    '1CH', '2CH', 'EZR', 'NEH', 'EST', 'JOB', 'PSA', 'PRO', 'ECC', 'SNG', 'ISA', 'JER',
+    'LAM', 'EZK', 'DAN', 'HOS', 'JOL', 'AMO', 'OBA', 'JON', 'MIC', 'NAM', 'HAB', 'ZEP',
+    'HAG', 'ZEC', 'MAL', 'MAT', 'MRK', 'LUK', 'JHN', 'ACT', 'ROM', '1CO', '2CO', 'GAL',
+    'EPH', 'PHP', 'COL', '1TH', '2TH', '1TI', '2TI', 'TIT', 'PHM', 'HEB', 'JAS', '1PE',
+    '2PE', '1JN', '2JN', '3JN', 'JUD', 'REV',
+]
+
+OSIS_BOOK_CODES = dict(zip([
+    'Gen', 'Exod', 'Lev', 'Num', 'Deut', 'Josh', 'Judg', 'Ruth', '1Sam', '2Sam', '1Kgs', '2Kgs',
+    '1Chr', '2Chr', 'Ezra', 'Neh', 'Esth', 'Job', 'Ps', 'Prov', 'Eccl', 'Song', 'Isa', 'Jer',
+    'Lam', 'Ezek', 'Dan', 'Hos', 'Joel', 'Amos', 'Obad', 'Jonah', 'Mic', 'Nah', 'Hab', 'Zeph',
+    'Hag', 'Zech', 'Mal', 'Matt', 'Mark', 'Luke', 'John', 'Acts', 'Rom', '1Cor', '2Cor', 'Gal',
+    'Eph', 'Phil', 'Col', '1Thess', '2Thess', '1Tim', '2Tim', 'Titus', 'Phlm', 'Heb', 'Jas', '1Pet',
+    '2Pet', '1John', '2John', '3John', 'Jude', 'Rev',
+], CANONICAL_BOOK_CODES))
+
+USFM_NOTE_RE = re.compile(r'\\(f|fe|x|ef|ex)\s.*?\\\1\*', re.DOTALL)
+USFM_WORD_ATTR_RE = re.compile(r'\|[^\\]*?(?=\\w\*|\\\+w\*)')
+USFM_MARKER_RE = re.compile(r'\\\+?[a-z]+[0-9]*\*?')
+
+def _resolve_book_code(book):
+    """Map a book name, USFM code or OSIS abbreviation to our book code"""
+    book = str(book).strip()
+    if book in BOOK_FILENAMES:
+        return BOOK_FILENAMES[book]
+    if book == 'Psalm':
+        return 'PSA'
+    if book.upper() in CANONICAL_BOOK_CODES:
+        return book.upper()
+    if book in OSIS_BOOK_CODES:
+        return OSIS_BOOK_CODES[book]
+    if book.isdigit() and 1 <= int(book) <= len(CANONICAL_BOOK_CODES):
+        return CANONICAL_BOOK_CODES[int(book) - 1]
+    return None
+
+def parse_usfm(text):
+    """Yield (book_code, chapter, verse, text) from a USFM document"""
+    text = USFM_NOTE_RE.sub('', text)
+    text = USFM_WORD_ATTR_RE.sub('', text)
+    book_code, chapter = None, None
+    verse, verse_parts = None, []
+    
+    def finish():
+        verse_text = ' '.join(' '.join(verse_parts).split())
+        if book_code and chapter and verse and verse_text:
+            return (book_code, chapter, verse, verse_text)
+    
+    for line in text.splitlines():
+        line = line.strip()
+        marker, _, rest = line.partition(' ')
+        if marker == '\\id':
+            done = finish()
+            if done:
+                yield done
+            book_code, chapter, verse, verse_parts = _resolve_book_code(rest.split()[0]) if rest else None, None, None, []
+        elif marker == '\\c':
+            done = finish()
+            if done:
+                yield done
+            number = rest.split()[0] if rest.split() else ''
+            if not number.isdigit():
+                # Without a usable number the verses that follow can't be placed; drop them
+                print(f"Ignoring USFM chapter marker without a number: {line!r}")
+                chapter = None
+            else:
+                chapter = int(number)
+            verse, verse_parts = None, []
+        elif marker in ('\\h', '\\toc1', '\\toc2', '\\toc3', '\\mt', '\\mt1', '\\mt2', '\\s', '\\s1', '\\s2',
+                        '\\ms', '\\ms1', '\\mr', '\\r', '\\d', '\\ide', '\\rem', '\\cl', '\\sp'):
+            # Headings and metadata are not part of the verse text
+            continue
+        else:
+            # A line can hold several \v markers
+            for segment in re.split(r'(?=\\v\s)', line):
+                if segment.startswith('\\v '):
+                    done = finish()
+                    if done:
+                        yield done
+                    number, _, segment = segment[3:].strip().partition(' ')
+                    verse, verse_parts = number, []
+                cleaned = USFM_MARKER_RE.sub(' ', segment).strip()
+                if cleaned and verse:
+                    verse_parts.append(cleaned)
+    done = finish()
+    if done:
+        yield done
+
+def _local_name(tag):
+    return tag.rsplit('}', 1)[-1]
+
+def parse_osis(root):
+    """Yield (book_code, chapter, verse, text) from an OSIS document.
+    
+    Handles both container verses (<verse osisID="Gen.1.1">...</verse>) and
+    milestone verses (<verse sID="..."/> ... <verse eID="..."/>). Notes and
+    headings are skipped.
+    """
+    verses = {}
+    order = []
+    current = [None]
+    
+    def add(text):
+        if current[0] and text:
+            if current[0] not in verses:
+                verses[current[0]] = []
+                order.append(current[0])
+            verses[current[0]].append(text)
+    
+    def walk(elem):
+        tag = _local_name(elem.tag)
+        if tag in ('note', 'title'):
+            return
+        if tag == 'verse':
+            if elem.get('eID'):
+                current[0] = None
+                return
+            osis_id = (elem.get('osisID') or elem.get('sID') or '').split()
+            current[0] = osis_id[0] if osis_id else None
+            add(elem.text)
+            for child in elem:
+                walk(child)
+                add(child.tail)
+            if not elem.get('sID') and (elem.text or len(elem)):
+                current[0] = None
+            return
+        add(elem.text)
+        for child in elem:
+            walk(child)
+            add(child.tail)
+    
+    walk(root)
+    for osis_id in order:
+        parts = osis_id.split('.')
+        if len(parts) < 3:
+            continue
+        book_code = _resolve_book_code(parts[0])
+        verse_text = ' '.join(''.join(verses[osis_id]).split())
+        if book_code and verse_text:
+            yield (book_code, int(parts[1]), parts[2], verse_text)
+
+def parse_zefania(root):
+    """Yield (book_code, chapter, verse, text) from a Zefania XML bible"""
+    for book in root.iter('BIBLEBOOK'):
+        book_code = _resolve_book_code(book.get('bnumber') or book.get('bname') or '')
+        if not book_code:
+            continue
+        for chapter in book.iter('CHAPTER'):
+            for verse in chapter.iter('VERS'):
+                parts = [verse.text or '']
+                for child in verse:
+                    if child.tag not in ('NOTE', 'XREF'):
+                        parts.append(''.join(child.itertext()))
+                    parts.append(child.tail or '')
+                verse_text = ' '.join(''.join(parts).split())
+                if verse_text:
+                    yield (book_code, int(chapter.get('cnumber')), verse.get('vnumber'), verse_text)
+
+def parse_json_verses(data):
+    """Yield (book_code, chapter, verse, text) from a JSON verse dump.
+    
+    Accepts a list of verse objects shaped like the labs.bible.org API
+    ({bookname, chapter, verse, text}; 'book' is accepted too), optionally
+    wrapped in {"verses": [...]}.
+    """
+    if isinstance(data, dict):
+        data = data.get('verses', [])
+    for verse in data:
+        book_code = _resolve_book_code(verse.get('bookname') or verse.get('book') or '')
+        verse_text = ' '.join(str(verse.get('text', '')).split())
+        if book_code and verse_text:
+            yield (book_code, int(verse['chapter']), str(verse['verse']), verse_text)
+
+def corpus_version(root):
+    """Translation an OSIS (osisIDWork) or Zefania (INFORMATION/identifier) document names, or None"""
+    if _local_name(root.tag) == 'XMLBIBLE':
+        identifier = root.find('INFORMATION/identifier')
+        work = identifier.text if identifier is not None else None
+    else:
+        osis_text = next((elem for elem in root.iter() if _local_name(elem.tag) == 'osisText'), None)
+        work = osis_text.get('osisIDWork') if osis_text is not None else None
+    # osisIDWork may be qualified, e.g. "Bible.en.KJV"
+    work = (work or '').strip().rsplit('.', 1)[-1]
+    return work.lower() or None
+
+def read_corpus_file(path, corpus_format=None):
+    """Parse one corpus file, detecting the format from its extension or root element.
+    
+    Returns (verses, version), where version is the translation the file's metadata
+    names, or None (USFM and JSON files carry none).
+    """
+    if corpus_format is None:
+        ext = os.path.splitext(path)[1].lower()
+        corpus_format = {'.usfm': 'usfm', '.sfm': 'usfm', '.json': 'json'}.get(ext, 'xml')
+    if corpus_format == 'usfm':
+        with open(path, encoding='utf-8-sig') as f:
+            return list(parse_usfm(f.read())), None
+    if corpus_format == 'json':
+        with open(path, encoding='utf-8-sig') as f:
+            return list(parse_json_verses(json.load(f))), None
+    root = ElementTree.parse(path).getroot()
+    if corpus_format == 'zefania' or _local_name(root.tag) == 'XMLBIBLE':
+        return list(parse_zefania(root)), corpus_version(root)
+    return list(parse_osis(root)), corpus_version(root)
+
+class CorpusStore:
+    """Locally imported Bible translations, one row per chapter.
+    
+    Unlike the chapter cache these rows never expire; the text provider reads
+    them before going to the network.
+    """
+    def __init__(self, db_file='bible_corpus.db'):
+        self.db_file = db_file
+        self.local = threading.local()
+        self.enabled = os.path.exists(db_file)
+        if self.enabled:
+            self._create_schema()
+    
+    def _conn(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_file, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self.local.conn = conn
+        return conn
+    
+    def _create_schema(self):
+        self._conn().execute("""CREATE TABLE IF NOT EXISTS corpus (
+            version TEXT NOT NULL,
+            book TEXT NOT NULL,
+            chapter INTEGER NOT NULL,
+            text TEXT NOT NULL,
+            PRIMARY KEY (version, book, chapter)
+        )""")
+    
+    def get(self, version, book_code, chapter):
+        if not self.enabled:
+            return None
+        row = self._conn().execute("SELECT text FROM corpus WHERE version = ? AND book = ? AND chapter = ?",
+                                   (version, book_code, chapter)).fetchone()
+        return row[0] if row else None
+    
+    def import_verses(self, version, verses):
+        """Group (book_code, chapter, verse, text) tuples into chapters and store them in one transaction"""
+        if not self.enabled:
+            self._create_schema()
+            self.enabled = True
+        chapters = {}
+        for book_code, chapter, verse, verse_text in verses:
+            chapters.setdefault((book_code, chapter), []).append(f"{verse}. {verse_text}")
+        conn = self._conn()
+        with conn:
+            conn.execute("BEGIN")
+            conn.executemany("INSERT OR REPLACE INTO corpus (version, book, chapter, text) VALUES (?, ?, ?, ?)",
+                             [(version, book_code, chapter, "\n".join(lines))
+                              for (book_code, chapter), lines in chapters.items()])
+        return len(chapters)
+    
+    def close(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self.local.conn = None
+    
+    def __len__(self):
+        if not self.enabled:
+            return 0
+        return self._conn().execute("SELECT COUNT(*) FROM corpus").fetchone()[0]
+
+def import_corpus(paths, version=None, corpus_format=None, db_file=None):
+    """Bulk-load translation files (or directories of them) into the local corpus.
+    
+    Without a version each file is filed under the translation its metadata names;
+    if any file names none, nothing is imported and ValueError is raised.
+    """
+    store = CorpusStore(db_file or Config.CORPUS_DB_FILE)
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(os.path.join(root, name) for root, _, names in os.walk(path) for name in sorted(names))
+        else:
+            files.append(path)
+    
+    by_version = {}
+    unlabelled = []
+    for path in files:
+        try:
+            parsed, declared = read_corpus_file(path, corpus_format)
+        except Exception as e:
+            print(f"Skipping {path}: {e}")
+            continue
+        file_version = version.lower() if version else declared
+        if not file_version:
+            unlabelled.append(path)
+            continue
+        if declared and declared != file_version:
+            print(f"Warning: {path} says it is {declared.upper()}, importing it as {file_version.upper()}")
+        print(f"Read {len(parsed)} verses of {file_version.upper()} from {path}")
+        by_version.setdefault(file_version, []).extend(parsed)
+    if unlabelled:
+        raise ValueError(f"No translation named in the metadata of {', '.join(unlabelled)}; pass --version")
+    
+    imported = 0
+    for file_version, verses in by_version.items():
+        count = store.import_verses(file_version, verses)
+        print(f"Imported {count} chapters of {file_version.upper()} into {store.db_file}")
+        if file_version != Config.DEFAULT_BIBLE_VERSION.lower():
+            # Feeds only read the corpus for the configured version
+            print(f"Warning: feeds serve {Config.DEFAULT_BIBLE_VERSION.upper()}, so {file_version.upper()} "
+                  f"will not be used; set DEFAULT_BIBLE_VERSION={file_version} to serve it")
+        imported += count
+    return imported
+
+PASSAGE_SKIP_TAGS = ('sup', 'div')
+PASSAGE_SKIP_CLASSES = frozenset(('footnote', 'crossreference'))
+
+# A class attribute naming passage-text among its classes (not passage-text-notice)
+PASSAGE_CLASS_RE = re.compile(rb'class\s*=\s*["\']?[^"\'>]*\bpassage-text(?![\w-])')
+
+def has_passage_class(value):
+    # While parsing, the strainer sees the raw attribute ("passage-text result-text-style-normal"),
+    # so class_='passage-text' alone would miss containers with more than one class
+    return value is not None and 'passage-text' in value.split()
+
+@lru_cache(maxsize=None)
+def passage_strainer():
+    """Scraped pages are only parsed as far as the passage container"""
+    return bs4.SoupStrainer('div', class_=has_passage_class)
+
+# Verse spans carry their reference as a class, e.g. "text John-3-16" or "text 1Cor-13-4"
+VERSE_CLASS_RE = re.compile(r'^\w+-(\d+)-\d+$')
+
+def passage_paragraphs(container, with_chapters=False):
+    """Text of every <p> under container, leaving out footnotes and cross-references.
+    
+    Gives the same strings as decomposing each sup/div with class footnote or
+    crossreference and calling get_text().strip() on the remaining <p> elements,
+    but in a single walk that leaves the tree untouched. With with_chapters, returns
+    (text, chapter) pairs, chapter being that of the paragraph's first verse span or None.
+    """
+    paragraphs = []
+    tag_type = bs4.Tag
+    string_types = (bs4.NavigableString, bs4.CData)
+    
+    def walk(node, open_paragraphs):
+        for child in node.children:
+            if isinstance(child, tag_type):
+                classes = child.get('class') or ()
+                if child.name in PASSAGE_SKIP_TAGS and PASSAGE_SKIP_CLASSES.intersection(classes):
+                    continue
+                if with_chapters and 'text' in classes:
+                    for paragraph in open_paragraphs:
+                        if paragraph[1] is None:
+                            paragraph[1] = next((int(match.group(1)) for match in map(VERSE_CLASS_RE.match, classes)
+                                                 if match), None)
+                if child.name == 'p':
+                    paragraph = [[], None]
+                    paragraphs.append(paragraph)
+                    walk(child, open_paragraphs + (paragraph,))
+                else:
+                    walk(child, open_paragraphs)
+            elif type(child) in string_types:
+                # Nested paragraphs: the text belongs to every enclosing <p>, as with get_text()
+                for paragraph in open_paragraphs:
+                    paragraph[0].append(child)
+    
+    walk(container, ())
+    if with_chapters:
+        return [(''.join(parts).strip(), chapter) for parts, chapter in paragraphs]
+    return [''.join(parts).strip() for parts, _ in paragraphs]
+
+# Start of the placeholder shown when no source could supply a chapter
+FALLBACK_MARKER = "[Bible text temporarily unavailable"
+# Shown in link-only items whose chapters missed the feed deadline
+PENDING_MARKER = "Full text is still loading"
 
 class BibleTextProvider:
     def __init__(self):
-        self.cache = PersistentCache(Config.CACHE_FILE, Config.CACHE_EXPIRY_DAYS)
+        self.cache = create_cache()
+        self.cache.refresher.handler = self.refresh_cached_chapter
+        self.corpus = CorpusStore(Config.CORPUS_DB_FILE)
         self.base_urls = {
             'web': 'https://ebible.org/web/',  # World English Bible
             'asv': 'https://ebible.org/asv/',  # American Standard Version
         }
         self.version = Config.DEFAULT_BIBLE_VERSION
+        # One bucket per upstream host keeps us polite without serializing every fetch
+        self.rate_limiters = {
+            host: TokenBucket(Config.UPSTREAM_REQUESTS_PER_SECOND, Config.UPSTREAM_BURST)
+            for host in ('www.biblegateway.com', 'labs.bible.org')
+        }
+        self.refresh_limiter = TokenBucket(Config.CACHE_REFRESH_REQUESTS_PER_SECOND, 1)
+        self.sessions = {
+            'www.biblegateway.com': UpstreamSession('www.biblegateway.com', Config.HTTP_POOL_SIZE,
+                                                    Config.HTTP_KEEPALIVE_SECONDS, Config.BIBLE_GATEWAY_TIMEOUT,
+                                                    Config.HTTP_CONNECT_TIMEOUT),
+            'labs.bible.org': UpstreamSession('labs.bible.org', Config.HTTP_POOL_SIZE,
+                                              Config.HTTP_KEEPALIVE_SECONDS, Config.BIBLE_API_TIMEOUT,
+                                              Config.HTTP_CONNECT_TIMEOUT),
+        }
+        self.breakers = {
+            host: CircuitBreaker(Config.BREAKER_FAILURE_THRESHOLD, Config.BREAKER_RESET_SECONDS)
+            for host in ('www.biblegateway.com', 'labs.bible.org')
+        }
+        # Fallback text is remembered here briefly instead of in the chapter cache
+        self.negative_cache = NegativeCache(Config.NEGATIVE_CACHE_SECONDS)
+        self.fetch_flight = SingleFlight()
+        # Chapters the ASGI front end is already fetching on its event loop, as Futures
+        self.async_fetches = {}
+        self.prefetch_pool = ThreadPoolExecutor(max_workers=Config.PREFETCH_WORKERS,
+                                                thread_name_prefix='prefetch')
+
+    def split_rate_limits(self, processes):
+        """Give each of several worker processes an equal share of the per-host upstream budget"""
+        rate = Config.UPSTREAM_REQUESTS_PER_SECOND / processes
+        burst = max(1, Config.UPSTREAM_BURST // processes)
+        self.rate_limiters = {host: TokenBucket(rate, burst) for host in self.rate_limiters}
+        self.refresh_limiter = TokenBucket(Config.CACHE_REFRESH_REQUESTS_PER_SECOND / processes, 1)
+        return rate, burst
 
     def get_book_filename(self, book_name):
         """Convert book name to filename used by eBible.org"""
-        book_mapping = {
-            'Genesis': 'GEN', 'Exodus': 'EXO', 'Leviticus': 'LEV', 'Numbers': 'NUM',
-            'Deuteronomy': 'DEU', 'Joshua': 'JOS', 'Judges': 'JDG', 'Ruth': 'RUT',
-            '1 Samuel': '1SA', '2 Samuel': '2SA', '1 Kings': '1KI', '2 Kings': '2KI',
-            '1 Chronicles': '1CH', '2 Chronicles': '2CH', 'Ezra': 'EZR', 'Nehemiah': 'NEH',
-            'Esther': 'EST', 'Job': 'JOB', 'Psalms': 'PSA', 'Proverbs': 'PRO',
-            'Ecclesiastes': 'ECC', 'Song of Solomon': 'SNG', 'Isaiah': 'ISA',
-            'Jeremiah': 'JER', 'Lamentations': 'LAM', 'Ezekiel': 'EZK', 'Daniel': 'DAN',
-            'Hosea': 'HOS', 'Joel': 'JOL', 'Amos': 'AMO', 'Obadiah': 'OBA', 'Jonah': 'JON',
-            'Micah': 'MIC', 'Nahum': 'NAM', 'Habakkuk': 'HAB', 'Zephaniah': 'ZEP',
-            'Haggai': 'HAG', 'Zechariah': 'ZEC', 'Malachi': 'MAL',
-            'Matthew': 'MAT', 'Mark': 'MRK', 'Luke': 'LUK', 'John': 'JHN',
-            'Acts': 'ACT', 'Romans': 'ROM', '1 Corinthians': '1CO', '2 Corinthians': '2CO',
-            'Galatians': 'GAL', 'Ephesians': 'EPH', 'Philippians': 'PHP', 'Colossians': 'COL',
-            '1 Thessalonians': '1TH', '2 Thessalonians': '2TH', '1 Timothy': '1TI',
-            '2 Timothy': '2TI', 'Titus': 'TIT', 'Philemon': 'PHM', 'Hebrews': 'HEB',
-            'James': 'JAS', '1 Peter': '1PE', '2 Peter': '2PE', '1 John': '1JN',
-            '2 John': '2JN', '3 John': '3JN', 'Jude': 'JUD', 'Revelation': 'REV'
+        return BOOK_FILENAMES.get(book_name, book_name.upper()[:3])
+
+    GATEWAY_HEADERS = {'User-Agent': 'Mozilla/5.0 (compatible; BibleRSSReader/1.0)'}
+    API_URL = "https://labs.bible.org/api/"
+
+    def gateway_url(self, book, chapter):
+        return f"https://www.biblegateway.com/passage/?search={quote(book)}+{chapter}&version=NIV&interface=print"
+
+    def api_params(self, book, chapter):
+        # Use type=json to get JSON response (not HTML which is default)
+        return {
+            'passage': f"{book} {chapter}",
+            'type': 'json',  # Critical: without this, returns HTML
+            'formatting': 'plain'
         }
-        return book_mapping.get(book_name, book_name.upper()[:3])
+
+    def extract_passage_text(self, content):
+        """Pull the verse paragraphs out of a Bible Gateway print page.
+        
+        Only the passage container is parsed, and footnotes and cross-references are
+        skipped while its paragraphs are read. Pages without usable verse paragraphs
+        go through extract_passage_text_full, which parses the whole page.
+        """
+        if not PASSAGE_CLASS_RE.search(content):
+            # No container to strain for; don't parse the page twice
+            return self.extract_passage_text_full(content)
+        soup = bs4.BeautifulSoup(content, Config.PASSAGE_PARSER, parse_only=passage_strainer())
+        passage_div = soup.find('div', class_='passage-text')
+        if passage_div:
+            verses = [text for text in passage_paragraphs(passage_div) if text]
+            if verses:
+                return "\n\n".join(verses)
+        return self.extract_passage_text_full(content)
+
+    def extract_passage_chapters(self, content):
+        """Split a multi-chapter Bible Gateway page into {chapter: text}.
+        
+        Each paragraph belongs to the chapter of its first verse span (class
+        "text John-2-1"); paragraphs without one stay with the chapter before them.
+        """
+        soup = bs4.BeautifulSoup(content, Config.PASSAGE_PARSER, parse_only=passage_strainer())
+        passage_div = soup.find('div', class_='passage-text')
+        if not passage_div:
+            return {}
+        paragraphs = passage_paragraphs(passage_div, with_chapters=True)
+        chapter = next((chapter for _, chapter in paragraphs if chapter is not None), None)
+        if chapter is None:
+            return {}
+        verses = {}
+        for text, paragraph_chapter in paragraphs:
+            if paragraph_chapter is not None:
+                chapter = paragraph_chapter
+            if text:
+                verses.setdefault(chapter, []).append(text)
+        return {chapter: "\n\n".join(texts) for chapter, texts in verses.items()}
+
+    def extract_passage_text_full(self, content):
+        """Reference extractor: parse the whole page, decompose footnotes, then try other selectors"""
+        soup = bs4.BeautifulSoup(content, 'html.parser')
+        
+        # Find the passage text
+        passage_div = soup.find('div', class_='passage-text')
+        if passage_div:
+            # Remove footnotes and cross-references
+            for unwanted in passage_div.find_all(['sup', 'div'], class_=['footnote', 'crossreference']):
+                unwanted.decompose()
+            
+            # Extract verse text
+            verses = []
+            for p in passage_div.find_all('p'):
+                text = p.get_text().strip()
+                if text:
+                    verses.append(text)
+            
+            if verses:
+                return "\n\n".join(verses)
+        
+        # Fallback: try different selectors
+        content_selectors = ['.passage-content', '.passage', '.text']
+        for selector in content_selectors:
+            content = soup.select_one(selector)
+            if content:
+                text = content.get_text().strip()
+                if len(text) > 100:  # Reasonable chapter length
+                    return text
+        return None
+
+    def format_api_verses(self, data, book, chapter):
+        """Format the labs.bible.org verse list as numbered lines"""
+        # API returns array of verse objects
+        if data and isinstance(data, list) and len(data) > 0:
+            verses = []
+            for verse_data in data:
+                # API returns: {bookname, chapter, verse, text}
+                verse_num = verse_data.get('verse', '')
+                verse_text = verse_data.get('text', '').strip()
+                
+                if verse_text:
+                    # Format with verse numbers for readability
+                    verses.append(f"{verse_num}. {verse_text}")
+            
+            if verses:
+                print(f"Successfully fetched {book} {chapter} from API ({len(verses)} verses)")
+                return "\n".join(verses)
+        else:
+            print(f"API returned empty or invalid data structure for {book} {chapter}")
+        return None
 
     def fetch_chapter_text_web(self, book, chapter):
         """Fetch chapter text from web sources (primary method)"""
+        return self.fetch_gateway_passage(book, chapter, self.extract_passage_text)
+
+    def fetch_chapter_range_web(self, book, first, last):
+        """Fetch consecutive chapters from one Bible Gateway page; returns {chapter: text}"""
+        return self.fetch_gateway_passage(book, f"{first}-{last}", self.extract_passage_chapters) or {}
+
+    def fetch_gateway_passage(self, book, passage, extract):
+        """GET the Bible Gateway print page for passage ('3' or '1-3') and run extract on its body"""
+        breaker = self.breakers['www.biblegateway.com']
+        if not breaker.allow():
+            return None
+        response = None
         try:
             # Try Bible Gateway first - most reliable
-            bg_url = f"https://www.biblegateway.com/passage/?search={quote(book)}+{chapter}&version=NIV&interface=print"
-            headers = {'User-Agent': 'Mozilla/5.0 (compatible; BibleRSSReader/1.0)'}
-            response = requests.get(bg_url, headers=headers, timeout=15)
+            self.rate_limiters['www.biblegateway.com'].acquire()
+            response = self.sessions['www.biblegateway.com'].get(self.gateway_url(book, passage),
+                                                                 headers=self.GATEWAY_HEADERS)
+            self.record_upstream_status(breaker, response.status_code)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Find the passage text
-                passage_div = soup.find('div', class_='passage-text')
-                if passage_div:
-                    # Remove footnotes and cross-references
-                    for unwanted in passage_div.find_all(['sup', 'div'], class_=['footnote', 'crossreference']):
-                        unwanted.decompose()
-                    
-                    # Extract verse text
-                    verses = []
-                    for p in passage_div.find_all('p'):
-                        text = p.get_text().strip()
-                        if text:
-                            verses.append(text)
-                    
-                    if verses:
-                        return "\n\n".join(verses)
-                
-                # Fallback: try different selectors
-                content_selectors = ['.passage-content', '.passage', '.text']
-                for selector in content_selectors:
-                    content = soup.select_one(selector)
-                    if content:
-                        text = content.get_text().strip()
-                        if len(text) > 100:  # Reasonable chapter length
-                            return text
+                return extract(response.content)
+        except requests.exceptions.RequestException as e:
+            breaker.record_failure()
+            print(f"Error fetching from Bible Gateway for {book} {passage}: {e}")
         except Exception as e:
-            print(f"Error fetching from Bible Gateway for {book} {chapter}: {e}")
+            # Failing before an answer came back counts against the source; a bad page was already recorded
+            if response is None:
+                breaker.record_failure()
+            print(f"Error fetching from Bible Gateway for {book} {passage}: {e}")
         
         return None
 
+    def record_upstream_status(self, breaker, status_code):
+        # Server errors and throttling mean the source is unhealthy; anything else means it answered
+        if status_code >= 500 or status_code == 429:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
     def fetch_chapter_text_api(self, book, chapter):
         """Fetch chapter text using Bible API (fallback method)"""
+        data = self.fetch_api_verses(book, chapter)
+        return self.format_api_verses(data, book, chapter) if data is not None else None
+
+    def fetch_chapter_range_api(self, book, first, last):
+        """Fetch consecutive chapters with one API call, split on each verse's chapter field"""
+        data = self.fetch_api_verses(book, f"{first}-{last}")
+        if not data or not isinstance(data, list):
+            return {}
+        by_chapter = {}
+        for verse_data in data:
+            try:
+                by_chapter.setdefault(int(verse_data.get('chapter')), []).append(verse_data)
+            except (TypeError, ValueError):
+                continue
+        texts = {}
+        for chapter, verses in by_chapter.items():
+            text = self.format_api_verses(verses, book, chapter)
+            if text:
+                texts[chapter] = text
+        return texts
+
+    def fetch_api_verses(self, book, passage):
+        """Return the labs.bible.org verse list for passage ('3' or '1-3'), or None"""
+        breaker = self.breakers['labs.bible.org']
+        if not breaker.allow():
+            return None
+        response = None
         try:
             # Try labs.bible.org API as fallback
             # This returns NET Bible translation
-            api_url = "https://labs.bible.org/api/"
-            
-            # Use type=json to get JSON response (not HTML which is default)
-            params = {
-                'passage': f"{book} {chapter}",
-                'type': 'json',  # Critical: without this, returns HTML
-                'formatting': 'plain'
-            }
-            
-            response = requests.get(api_url, params=params, timeout=10)
+            self.rate_limiters['labs.bible.org'].acquire()
+            response = self.sessions['labs.bible.org'].get(self.API_URL, params=self.api_params(book, passage))
+            self.record_upstream_status(breaker, response.status_code)
             
             if response.status_code == 200:
                 # Check content type - API should return application/json
@@ -188,48 +1921,102 @@ class BibleTextProvider:
                 # Try to parse as JSON regardless of content-type header
                 # (some servers misconfigure headers)
                 try:
-                    data = response.json()
+                    return response.json()
                     
-                    # API returns array of verse objects
-                    if data and isinstance(data, list) and len(data) > 0:
-                        verses = []
-                        for verse_data in data:
-                            # API returns: {bookname, chapter, verse, text}
-                            verse_num = verse_data.get('verse', '')
-                            verse_text = verse_data.get('text', '').strip()
-                            
-                            if verse_text:
-                                # Format with verse numbers for readability
-                                verses.append(f"{verse_num}. {verse_text}")
-                        
-                        if verses:
-                            result = "\n".join(verses)
-                            print(f"Successfully fetched {book} {chapter} from API ({len(verses)} verses)")
-                            return result
-                    else:
-                        print(f"API returned empty or invalid data structure for {book} {chapter}")
-                        
                 except json.JSONDecodeError as e:
                     # If JSON parsing fails, the API might have returned HTML
-                    print(f"API returned invalid JSON for {book} {chapter}: {e}")
+                    print(f"API returned invalid JSON for {book} {passage}: {e}")
                     print(f"Content-Type was: {content_type}")
                     print(f"First 200 chars: {response.text[:200]}")
                     
         except requests.exceptions.Timeout:
-            print(f"API timeout for {book} {chapter}")
+            breaker.record_failure()
+            print(f"API timeout for {book} {passage}")
         except requests.exceptions.RequestException as e:
-            print(f"API request error for {book} {chapter}: {e}")
+            breaker.record_failure()
+            print(f"API request error for {book} {passage}: {e}")
         except Exception as e:
-            print(f"Unexpected API error for {book} {chapter}: {e}")
+            if response is None:
+                breaker.record_failure()
+            print(f"Unexpected API error for {book} {passage}: {e}")
         
         return None
 
+    async def fetch_chapter_text_web_async(self, client, book, chapter):
+        """Async counterpart of fetch_chapter_text_web, used by the ASGI server"""
+        breaker = self.breakers['www.biblegateway.com']
+        if not breaker.allow():
+            return None
+        try:
+            await self.rate_limiters['www.biblegateway.com'].acquire_async()
+            response = await client.get(self.gateway_url(book, chapter), headers=self.GATEWAY_HEADERS,
+                                        timeout=Config.BIBLE_GATEWAY_TIMEOUT)
+        except Exception as e:
+            breaker.record_failure()
+            print(f"Error fetching from Bible Gateway for {book} {chapter}: {e}")
+            return None
+        self.record_upstream_status(breaker, response.status_code)
+        if response.status_code == 200:
+            try:
+                # Parsing is CPU-bound; keep it off the event loop
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(None, self.extract_passage_text, response.content)
+            except Exception as e:
+                print(f"Error parsing Bible Gateway page for {book} {chapter}: {e}")
+        return None
+
+    async def fetch_chapter_text_api_async(self, client, book, chapter):
+        """Async counterpart of fetch_chapter_text_api, used by the ASGI server"""
+        breaker = self.breakers['labs.bible.org']
+        if not breaker.allow():
+            return None
+        try:
+            await self.rate_limiters['labs.bible.org'].acquire_async()
+            response = await client.get(self.API_URL, params=self.api_params(book, chapter),
+                                        timeout=Config.BIBLE_API_TIMEOUT)
+        except Exception as e:
+            breaker.record_failure()
+            print(f"API request error for {book} {chapter}: {e}")
+            return None
+        self.record_upstream_status(breaker, response.status_code)
+        if response.status_code == 200:
+            try:
+                return self.format_api_verses(response.json(), book, chapter)
+            except Exception as e:
+                print(f"API returned invalid JSON for {book} {chapter}: {e}")
+        return None
+
+    async def get_chapter_text_async(self, client, book, chapter):
+        """Async counterpart of get_chapter_text: local corpus, then cache, then upstream.
+        
+        The corpus and cache are SQLite (or may wait on the pickle loader), so every
+        lookup and store runs in the default executor; only the HTTP requests and
+        rate-limit waits stay on the event loop.
+        """
+        cache_key = f"{book}_{chapter}_{self.version}"
+        loop = asyncio.get_running_loop()
+        cached_text = await loop.run_in_executor(None, self._local_chapter_text, book, chapter, cache_key)
+        if cached_text:
+            return cached_text
+        fallback_text = self.check_negative_cache(book, chapter, cache_key)
+        if fallback_text:
+            return fallback_text
+        
+        print(f"Fetching {book} {chapter} (async)...")
+        text = (await self.fetch_chapter_text_web_async(client, book, chapter)
+                or await self.fetch_chapter_text_api_async(client, book, chapter))
+        return await loop.run_in_executor(None, self.store_fetch_result, book, chapter, cache_key, text)
+    
+    def _local_chapter_text(self, book, chapter, cache_key):
+        return (self.corpus.get(self.version, self.get_book_filename(book), chapter)
+                or self.cache.get(cache_key))
+
     def get_fallback_text(self, book, chapter):
         """Generate fallback content when text can't be fetched"""
         return f"""
 {book} Chapter {chapter}
 
-[Bible text temporarily unavailable - please read from your preferred Bible]
+{FALLBACK_MARKER} - please read from your preferred Bible]
 
 📖 Read online at:
 • Bible Gateway: https://www.biblegateway.com/passage/?search={quote(book)}+{chapter}&version=NIV
@@ -251,7 +2038,26 @@ Today's Reading: {book} {chapter}
         """Get the full text of a Bible chapter"""
         cache_key = f"{book}_{chapter}_{self.version}"
         
-        # Check cache first
+        # An imported local corpus beats both the cache and the network
+        corpus_text = self.corpus.get(self.version, self.get_book_filename(book), chapter)
+        if corpus_text:
+            return corpus_text
+        
+        # Check cache next
+        cached_text = self.cache.get(cache_key)
+        if cached_text:
+            return cached_text
+        
+        # Recently unavailable everywhere: answer with the fallback instead of waiting on upstream again
+        fallback_text = self.check_negative_cache(book, chapter, cache_key)
+        if fallback_text:
+            return fallback_text
+        
+        # Only one thread fetches a given chapter; the rest wait for its result
+        return self.fetch_flight.do(cache_key, self._fetch_chapter_text, book, chapter, cache_key)
+
+    def _fetch_chapter_text(self, book, chapter, cache_key):
+        # Another flight may have filled the cache between our miss and taking the lead
         cached_text = self.cache.get(cache_key)
         if cached_text:
             return cached_text
@@ -265,17 +2071,280 @@ Today's Reading: {book} {chapter}
         if not text:
             text = self.fetch_chapter_text_api(book, chapter)
         
-        # If all else fails, use fallback
+        return self.store_fetch_result(book, chapter, cache_key, text)
+
+    def store_fetch_result(self, book, chapter, cache_key, text):
+        """Cache fetched text, or negative-cache the chapter and return the fallback if every source failed"""
         if not text:
-            text = self.get_fallback_text(book, chapter)
-        
-        # Cache the result
+            # Only remembered for NEGATIVE_CACHE_SECONDS, so an outage doesn't pin placeholders for weeks
+            self.negative_cache.add(cache_key)
+            return self.get_fallback_text(book, chapter)
+        self.negative_cache.discard(cache_key)
         self.cache.set(cache_key, text)
+        return text
+
+    def check_negative_cache(self, book, chapter, cache_key):
+        """Fallback text for a negative-cached chapter (starting a background retry once it expires), else None"""
+        retry = self.negative_cache.check(cache_key)
+        if retry is None:
+            return None
+        if retry:
+            print(f"Retrying {book} {chapter} in the background...")
+            self.prefetch_pool.submit(self.fetch_flight.do, cache_key, self._fetch_chapter_text,
+                                      book, chapter, cache_key)
+        return self.get_fallback_text(book, chapter)
+
+    def refresh_cached_chapter(self, cache_key):
+        """Re-fetch a chapter whose cache entry went stale; on failure the stale text stays"""
+        book, chapter, version = cache_key.rsplit('_', 2)
+        if version != self.version:
+            return
+        chapter = int(chapter)
+        # Readers are already being served the stale text, so refreshes are held to a small share of the budget
+        self.refresh_limiter.acquire()
+        print(f"Refreshing stale {book} {chapter}...")
+        text = self.fetch_chapter_text_web(book, chapter) or self.fetch_chapter_text_api(book, chapter)
+        if text:
+            self.cache.set(cache_key, text)
+
+    def get_chapter_range(self, book, chapters):
+        """Get consecutive chapters of one book, fetching the uncached ones with one request per source.
         
-        # Add a small delay to be respectful to servers
-        time.sleep(0.5)
+        Returns {chapter: text} for the chapters it has text for. Chapters the range
+        responses did not cover, or that a single-chapter fetch already has in flight,
+        are left out for the caller to fetch with get_chapter_text.
+        """
+        key = f"{book}_{chapters[0]}-{chapters[-1]}_{self.version}"
+        return self.fetch_flight.do(key, self._fetch_chapter_range, book, chapters)
+
+    def _fetch_chapter_range(self, book, chapters):
+        texts = {}
+        missing = []
+        for chapter in chapters:
+            cache_key = f"{book}_{chapter}_{self.version}"
+            cached_text = self.cache.get(cache_key)
+            if cached_text:
+                texts[chapter] = cached_text
+            elif not self.fetch_flight.busy(cache_key):
+                missing.append(chapter)
+        
+        # Chapters already being fetched on their own trim the range at either end
+        if len(missing) > 1:
+            print(f"Fetching {book} {missing[0]}-{missing[-1]}...")
+            fetched = self.fetch_chapter_range_web(book, missing[0], missing[-1])
+            remaining = [chapter for chapter in missing if not fetched.get(chapter)]
+            if len(remaining) > 1:
+                fetched.update(self.fetch_chapter_range_api(book, remaining[0], remaining[-1]))
+            for chapter in missing:
+                if fetched.get(chapter):
+                    texts[chapter] = self.store_fetch_result(book, chapter, f"{book}_{chapter}_{self.version}",
+                                                             fetched[chapter])
+        return texts
+
+    def group_chapter_ranges(self, chapters, max_chapters):
+        """Split chapters into runs of consecutive chapters of one book, at most max_chapters long.
         
+        Runs are ordered by where their first chapter appears in chapters, so the
+        earliest feed items are fetched first.
+        """
+        position = {}
+        by_book = {}
+        for index, (book, chapter) in enumerate(chapters):
+            position.setdefault((book, chapter), index)
+            by_book.setdefault(book, set()).add(chapter)
+        runs = []
+        for book, numbers in by_book.items():
+            run = []
+            for chapter in sorted(numbers):
+                if run and (chapter != run[-1] + 1 or len(run) >= max_chapters):
+                    runs.append((book, run))
+                    run = []
+                run.append(chapter)
+            runs.append((book, run))
+        runs.sort(key=lambda run: min(position[(run[0], chapter)] for chapter in run[1]))
+        return runs
+
+    def is_cached(self, book, chapter):
+        """True if the chapter can be served without going upstream; only looks, never schedules a refresh"""
+        return bool(self.corpus.get(self.version, self.get_book_filename(book), chapter)
+                    or self.cache.get(f"{book}_{chapter}_{self.version}", refresh=False))
+
+    def submit_chapters(self, chapters):
+        """Start fetching chapters, sending cache misses to the bounded worker pool.
+        
+        Returns a dict mapping (book, chapter) to a Future; chapters that are already
+        available locally come back as completed futures.
+        """
+        futures = {}
+        uncached = []
+        for book, chapter in chapters:
+            key = (book, chapter)
+            if key in futures:
+                continue
+            cached_text = (self.corpus.get(self.version, self.get_book_filename(book), chapter)
+                           or self.cache.get(f"{book}_{chapter}_{self.version}"))
+            futures[key] = Future()
+            if cached_text:
+                futures[key].set_result(cached_text)
+            elif key in self.async_fetches:
+                # Already being fetched on the event loop; wait for that instead of fetching twice
+                futures[key] = self.async_fetches[key]
+            elif f"{book}_{chapter}_{self.version}" in self.negative_cache:
+                # Answered with the fallback straight away; no point batching it
+                futures[key] = self.prefetch_pool.submit(self.get_chapter_text, book, chapter)
+            else:
+                uncached.append(key)
+        
+        # Consecutive chapters of a book share one upstream request
+        runs = self.group_chapter_ranges(uncached, max(Config.BATCH_MAX_CHAPTERS, 1))
+        if uncached:
+            print(f"Fetching {len(uncached)} uncached chapters in {len(runs)} requests "
+                  f"with {Config.PREFETCH_WORKERS} workers...")
+        for book, run in runs:
+            if len(run) == 1:
+                futures[(book, run[0])] = self.prefetch_pool.submit(self.get_chapter_text, book, run[0])
+                continue
+            batch = self.prefetch_pool.submit(self.get_chapter_range, book, run)
+            for chapter in run:
+                batch.add_done_callback(partial(self._resolve_from_range, futures[(book, chapter)], book, chapter))
+        return futures
+
+    def _resolve_from_range(self, future, book, chapter, batch):
+        if batch.exception() is not None:
+            future.set_exception(batch.exception())
+        elif chapter in batch.result():
+            future.set_result(batch.result()[chapter])
+        else:
+            # Not in the range response: a separate task, so one worker doesn't walk the run chapter by chapter
+            single = self.prefetch_pool.submit(self.get_chapter_text, book, chapter)
+            single.add_done_callback(partial(self._copy_result, future))
+
+    @staticmethod
+    def _copy_result(future, source):
+        if source.exception() is not None:
+            future.set_exception(source.exception())
+        else:
+            future.set_result(source.result())
+
+    def collect_chapters(self, futures, chapters=None, deadline=None):
+        """Wait for the given chapters (default: all of them) from submit_chapters.
+        
+        Returns a dict mapping (book, chapter) to its text. Chapters whose fetch
+        raised are filled in with the fallback text. With a deadline (a time.monotonic()
+        value), chapters not ready by then are left out and keep fetching in the background.
+        """
+        fetched_data = {}
+        for book, chapter in (chapters if chapters is not None else futures):
+            try:
+                timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+                fetched_data[(book, chapter)] = futures[(book, chapter)].result(timeout=timeout)
+            except FutureTimeoutError:
+                continue
+            except Exception as e:
+                print(f"Failed to fetch {book} {chapter}: {e}")
+                fetched_data[(book, chapter)] = self.get_fallback_text(book, chapter)
+        return fetched_data
+
+    def prefetch_chapters(self, chapters):
+        """Fetch many chapters at once; returns a dict mapping (book, chapter) to its text"""
+        return self.collect_chapters(self.submit_chapters(chapters))
+
+class PlanIndex:
+    """Flattened chapter sequence for one reading plan, built once at startup.
+
+    Chapters are stored as two parallel integer arrays (book id + chapter number),
+    so a daily lookup only touches the few slots it hands back.
+    """
+
+    def __init__(self, books):
+        self.book_names = tuple(book_name for book_name, _ in books)
+        self.book_ids = array('B')
+        self.chapters = array('H')
+        for book_id, (_, chapter_count) in enumerate(books):
+            self.book_ids.extend([book_id] * chapter_count)
+            self.chapters.extend(range(1, chapter_count + 1))
+
+    def __len__(self):
+        return len(self.chapters)
+
+    def ref(self, idx):
+        """Return the (book, chapter) pair stored at idx"""
+        return (self.book_names[self.book_ids[idx]], self.chapters[idx])
+
+    def slice(self, start, stop):
+        """Return the (book, chapter) pairs in [start, stop), clipped to the plan length"""
+        return [self.ref(i) for i in range(start, min(stop, len(self.chapters)))]
+
+    def cycle(self, start, count):
+        """Return count (book, chapter) pairs from start, wrapping around the end of the plan"""
+        size = len(self.chapters)
+        return [self.ref((start + i) % size) for i in range(count)]
+
+# Bump whenever the chapter or reflection markup changes, so cached fragments are not reused
+FRAGMENT_TEMPLATE_VERSION = 1
+
+REFLECTION_FOOTER = """
+<div style="background-color: #f8f9fa; padding: 15px; border-left: 4px solid #3498db; margin-top: 20px;">
+    <h3 style="color: #2c3e50; margin-top: 0;">📝 Reflection Questions</h3>
+    <ul style="line-height: 1.6;">
+        <li>What stands out to you in today's reading?</li>
+        <li>How does this passage reveal God's character?</li>
+        <li>What is one thing you can apply from this reading?</li>
+        <li>How do these passages connect with each other?</li>
+    </ul>
+    <p style="margin-bottom: 0;"><strong>🙏 Prayer:</strong> "Lord, thank you for Your Word. Help me understand and apply what I've read today. Amen."</p>
+</div>
+                """
+
+class FeedWriter:
+    """Writes RSS markup straight to text chunks instead of building and re-parsing a tree.
+    
+    Every method returns a chunk of markup, so callers can join them into a document
+    or yield them to a streaming response as they go. indent=None gives compact output.
+    """
+    def __init__(self, indent="  "):
+        self.indent = indent
+        self.depth = 0
+    
+    @staticmethod
+    def escape(text, quote=False):
+        text = str(text).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+        if quote:
+            text = text.replace('"', '&quot;')
         return text
+    
+    @staticmethod
+    def cdata(text):
+        # "]]>" cannot appear inside a CDATA section, so split it across two sections
+        return f"<![CDATA[{text.replace(']]>', ']]]]><![CDATA[>')}]]>"
+    
+    def _line(self, markup):
+        if self.indent is None:
+            return markup
+        return f"{self.indent * self.depth}{markup}\n"
+    
+    def _attrs(self, attrs):
+        if not attrs:
+            return ''
+        return ''.join(f' {name}="{self.escape(value, quote=True)}"' for name, value in attrs.items())
+    
+    def declaration(self):
+        return self._line('<?xml version="1.0" encoding="utf-8"?>')
+    
+    def start(self, tag, attrs=None):
+        chunk = self._line(f"<{tag}{self._attrs(attrs)}>")
+        self.depth += 1
+        return chunk
+    
+    def end(self, tag):
+        self.depth -= 1
+        return self._line(f"</{tag}>")
+    
+    def element(self, tag, text, attrs=None):
+        return self._line(f"<{tag}{self._attrs(attrs)}>{self.escape(text)}</{tag}>")
+    
+    def cdata_element(self, tag, text, attrs=None):
+        return self._line(f"<{tag}{self._attrs(attrs)}>{self.cdata(text)}</{tag}>")
 
 class BibleRSSGenerator:
     BLB_BOOK_ABBR = {
@@ -300,6 +2369,21 @@ class BibleRSSGenerator:
 
     def _build_blb_url(self, chapters):
         """Build a Blue Letter Bible NIV URL for one or more chapters."""
+        if len(chapters) == 1:
+            url = self.blb_chapter_urls.get(chapters[0])
+            if url:
+                return url
+        else:
+            key = tuple(chapters)
+            url = self.blb_range_urls.get(key)
+            if url is None:
+                url = self._compose_blb_url(chapters)
+                if len(self.blb_range_urls) < 10000:
+                    self.blb_range_urls[key] = url
+            return url
+        return self._compose_blb_url(chapters)
+
+    def _compose_blb_url(self, chapters):
         if len(chapters) == 1:
             book, ch = chapters[0]
             abbr = self.BLB_BOOK_ABBR.get(book, book.lower()[:3])
@@ -320,6 +2404,9 @@ class BibleRSSGenerator:
 
     def __init__(self):
         self.text_provider = BibleTextProvider()
+        self.feed_flight = SingleFlight()
+        self.fragment_cache = LRUCache(Config.FRAGMENT_CACHE_MAX_BYTES)
+        self.description_cache = LRUCache(Config.FRAGMENT_CACHE_MAX_BYTES)
         self.bible_books = {
             'ot': [
                 ('Genesis', 50), ('Exodus', 40), ('Leviticus', 27), ('Numbers', 36),
@@ -344,6 +2431,39 @@ class BibleRSSGenerator:
             'psalms': [('Psalms', 150)],
             'proverbs': [('Proverbs', 31)]
         }
+        self.plan_indexes = {
+            plan_type: PlanIndex(self.get_bible_plan(plan_type))
+            for plan_type in ('ot', 'nt', 'full', 'psalms', 'proverbs')
+        }
+
+        # Labels and single-chapter links are computed once for every chapter
+        self.chapter_labels = {}
+        self.blb_chapter_urls = {}
+        self.blb_range_urls = {}
+        for plan_type in ('full', 'psalms', 'proverbs'):
+            index = self.plan_indexes[plan_type]
+            for idx in range(len(index)):
+                book, chapter = index.ref(idx)
+                if book == 'Psalms':
+                    short_label = f"Ps {chapter}"
+                elif book == 'Proverbs':
+                    short_label = f"Pr {chapter}"
+                else:
+                    short_label = f"{book} {chapter}"
+                self.chapter_labels[(book, chapter)] = (f"{book} {chapter}", short_label)
+                self.blb_chapter_urls[(book, chapter)] = self._compose_blb_url([(book, chapter)])
+
+    def get_plan_index(self, plan_type):
+        try:
+            return self.plan_indexes[plan_type]
+        except KeyError:
+            raise ValueError("Plan type must be 'ot', 'nt', 'full', 'psalms', or 'proverbs'")
+
+    def chapter_label(self, book, chapter, short=False):
+        labels = self.chapter_labels.get((book, chapter))
+        if labels is None:
+            return f"{book} {chapter}"
+        return labels[1] if short else labels[0]
 
     def get_bible_plan(self, plan_type):
         if plan_type == 'ot':
@@ -365,391 +2485,559 @@ class BibleRSSGenerator:
         
         chapters_today = []
         
-        # Old Testament chapters - NOW CYCLES INFINITELY
-        if ot_per_day > 0:
-            ot_plan = self.bible_books['ot']
-            ot_chapters = []
-            for book_name, chapter_count in ot_plan:
-                for chapter_num in range(1, chapter_count + 1):
-                    ot_chapters.append((book_name, chapter_num))
-            
-            ot_start = days_elapsed * ot_per_day
-            for i in range(ot_per_day):
-                chapter_idx = (ot_start + i) % len(ot_chapters)  # Modulo makes it cycle
-                chapters_today.append(ot_chapters[chapter_idx])
-        
-        # New Testament chapters - NOW CYCLES INFINITELY
-        if nt_per_day > 0:
-            nt_plan = self.bible_books['nt']
-            nt_chapters = []
-            for book_name, chapter_count in nt_plan:
-                for chapter_num in range(1, chapter_count + 1):
-                    nt_chapters.append((book_name, chapter_num))
-            
-            nt_start = days_elapsed * nt_per_day
-            for i in range(nt_per_day):
-                chapter_idx = (nt_start + i) % len(nt_chapters)  # Modulo makes it cycle
-                chapters_today.append(nt_chapters[chapter_idx])
-        
-        # Psalms (cycle through)
-        if psalms_per_day > 0:
-            psalms_start = days_elapsed * psalms_per_day
-            for i in range(psalms_per_day):
-                psalm_num = ((psalms_start + i) % 150) + 1  # Cycle through Psalms 1-150
-                chapters_today.append(('Psalms', psalm_num))
-        
-        # Proverbs (cycle through)
-        if proverbs_per_day > 0:
-            proverbs_start = days_elapsed * proverbs_per_day
-            for i in range(proverbs_per_day):
-                proverb_num = ((proverbs_start + i) % 31) + 1  # Cycle through Proverbs 1-31
-                chapters_today.append(('Proverbs', proverb_num))
+        # Each section cycles infinitely: the modulo wraps back to its first chapter
+        for section, per_day in (('ot', ot_per_day), ('nt', nt_per_day),
+                                 ('psalms', psalms_per_day), ('proverbs', proverbs_per_day)):
+            if per_day > 0:
+                chapters_today.extend(self.plan_indexes[section].cycle(days_elapsed * per_day, per_day))
         
         return chapters_today
 
     def get_chapter_for_day(self, plan_type, start_date, chapters_per_day, target_date):
-        plan = self.get_bible_plan(plan_type)
+        index = self.get_plan_index(plan_type)
         days_elapsed = (target_date - start_date).days
         chapter_start = days_elapsed * chapters_per_day
-        
-        all_chapters = []
-        for book_name, chapter_count in plan:
-            for chapter_num in range(1, chapter_count + 1):
-                all_chapters.append((book_name, chapter_num))
-        
-        chapters_today = []
-        for i in range(chapters_per_day):
-            chapter_idx = chapter_start + i
-            if chapter_idx < len(all_chapters):
-                chapters_today.append(all_chapters[chapter_idx])
-        
-        return chapters_today
+        return index.slice(chapter_start, chapter_start + chapters_per_day)
 
     def _generate_error_feed(self, error_message):
         """Generate a minimal valid RSS feed with error message"""
-        rss = Element('rss')
-        rss.set('version', '2.0')
-        
-        channel = SubElement(rss, 'channel')
-        
-        title = SubElement(channel, 'title')
-        title.text = "Bible RSS Feed - Error"
+        writer = FeedWriter()
+        return ''.join([
+            writer.declaration(),
+            writer.start('rss', {'version': '2.0'}),
+            writer.start('channel'),
+            writer.element('title', "Bible RSS Feed - Error"),
+            writer.element('description', f"Error generating feed: {error_message}"),
+            writer.element('link', request.host_url if request else "http://localhost:5000"),
+            writer.start('item'),
+            writer.element('title', "Feed Generation Error"),
+            writer.element('description', f"An error occurred while generating your Bible reading feed: {error_message}"),
+            writer.element('guid', f"error-{datetime.now().strftime('%Y%m%d%H%M%S')}"),
+            writer.end('item'),
+            writer.end('channel'),
+            writer.end('rss'),
+        ])
+
+    def generate_simple_rss_feed(self, plan_type, start_date_str, chapters_per_day=None):
+        """Generate a simple RSS feed without fetching Bible text"""
+        try:
+            return ''.join(self.iter_simple_rss_feed(plan_type, start_date_str, chapters_per_day))
+        except Exception as e:
+            print(f"Simple feed generation error: {e}")
+            return self._generate_error_feed(str(e))
+
+    def iter_simple_rss_feed(self, plan_type, start_date_str, chapters_per_day=None):
+        """Yield the simple (link-only) RSS feed as text chunks"""
+        start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
         
-        description = SubElement(channel, 'description')
-        description.text = f"Error generating feed: {error_message}"
+        # Calculate date range
+        days_elapsed_since_start = (today - start_date).days
         
-        link = SubElement(channel, 'link')
-        link.text = request.host_url if request else "http://localhost:5000"
+        if days_elapsed_since_start < 0:
+            feed_start_date = start_date
+            initial_day_number = 0
+        else:
+            days_to_show_before = 7
+            feed_start_date = today - timedelta(days=days_to_show_before)
+            if feed_start_date < start_date:
+                feed_start_date = start_date
+            initial_day_number = (feed_start_date - start_date).days
         
-        item = SubElement(channel, 'item')
-        item_title = SubElement(item, 'title')
-        item_title.text = "Feed Generation Error"
+        end_date = today + timedelta(days=14)
         
-        item_description = SubElement(item, 'description')
-        item_description.text = f"An error occurred while generating your Bible reading feed: {error_message}"
+        # Generate RSS structure
+        writer = FeedWriter()
+        yield writer.declaration()
+        yield writer.start('rss', {'version': '2.0'})
+        yield writer.start('channel')
+        yield writer.element('title', f"Daily Bible Reading - {plan_type.upper()} ({chapters_per_day} ch/day)")
+        yield writer.element('description', f"Simple Bible reading plan - {chapters_per_day} chapter{'s' if chapters_per_day > 1 else ''} per day")
+        yield writer.element('link', request.host_url if request else "http://localhost:5000")
         
-        item_guid = SubElement(item, 'guid')
-        item_guid.text = f"error-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        # Generate items
+        current_date = feed_start_date
+        current_day_number = initial_day_number
         
-        rough_string = tostring(rss, 'utf-8')
-        reparsed = minidom.parseString(rough_string)
-        return reparsed.toprettyxml(indent="  ", encoding='utf-8').decode('utf-8')
-
-    def generate_simple_rss_feed(self, plan_type, start_date_str, chapters_per_day=None):
-        """Generate a simple RSS feed without fetching Bible text"""
-        try:
-            start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
-            today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-            
-            # Calculate date range
-            days_elapsed_since_start = (today - start_date).days
-            
-            if days_elapsed_since_start < 0:
-                feed_start_date = start_date
-                initial_day_number = 0
-            else:
-                days_to_show_before = 7
-                feed_start_date = today - timedelta(days=days_to_show_before)
-                if feed_start_date < start_date:
-                    feed_start_date = start_date
-                initial_day_number = (feed_start_date - start_date).days
-            
-            end_date = today + timedelta(days=14)
-            
-            # Generate RSS structure
-            rss = Element('rss')
-            rss.set('version', '2.0')
-            
-            channel = SubElement(rss, 'channel')
-            
-            title = SubElement(channel, 'title')
-            title.text = f"Daily Bible Reading - {plan_type.upper()} ({chapters_per_day} ch/day)"
+        while current_date <= end_date:
+            chapters = self.get_chapter_for_day(plan_type, start_date, chapters_per_day, current_date)
             
-            description = SubElement(channel, 'description')
-            description.text = f"Simple Bible reading plan - {chapters_per_day} chapter{'s' if chapters_per_day > 1 else ''} per day"
-            
-            link = SubElement(channel, 'link')
-            link.text = request.host_url if request else "http://localhost:5000"
-            
-            # Generate items
-            current_date = feed_start_date
-            current_day_number = initial_day_number
-            
-            while current_date <= end_date:
-                chapters = self.get_chapter_for_day(plan_type, start_date, chapters_per_day, current_date)
-                
-                if not chapters:
-                    break
-                
-                item = SubElement(channel, 'item')
-                
-                # Title
-                item_title = SubElement(item, 'title')
-                chapters_text = ", ".join([f"{book} {ch}" for book, ch in chapters])
-                item_title.text = f"Day {current_day_number + 1}: {chapters_text} ({current_date.strftime('%b %d')})"
-                
-                # Simple description
-                item_description = SubElement(item, 'description')
-                desc_text = f"Today's reading: {chapters_text}\n\nClick the link to read online."
-                item_description.text = desc_text
-                
-                # Link
-                item_link = SubElement(item, 'link')
-                item_link.text = self._build_blb_url(chapters)
-                
-                # GUID
-                item_guid = SubElement(item, 'guid')
-                item_guid.text = f"bible-{plan_type}-{current_date.strftime('%Y%m%d')}-{chapters_per_day}ch"
-                item_guid.set('isPermaLink', 'false')
-                
-                # Publication date
-                item_pub_date = SubElement(item, 'pubDate')
-                pub_datetime = current_date.replace(hour=6, minute=0, second=0, microsecond=0)
-                item_pub_date.text = pub_datetime.strftime('%a, %d %b %Y %H:%M:%S GMT')
-                
-                current_date += timedelta(days=1)
-                current_day_number += 1
+            if not chapters:
+                break
             
-            # Convert to pretty XML
-            rough_string = tostring(rss, 'utf-8')
-            reparsed = minidom.parseString(rough_string)
-            return reparsed.toprettyxml(indent="  ", encoding='utf-8').decode('utf-8')
+            chapters_text = ", ".join([self.chapter_label(book, ch) for book, ch in chapters])
+            pub_datetime = current_date.replace(hour=6, minute=0, second=0, microsecond=0)
+            yield ''.join([
+                writer.start('item'),
+                writer.element('title', f"Day {current_day_number + 1}: {chapters_text} ({current_date.strftime('%b %d')})"),
+                writer.element('description', f"Today's reading: {chapters_text}\n\nClick the link to read online."),
+                writer.element('link', self._build_blb_url(chapters)),
+                writer.element('guid', f"bible-{plan_type}-{current_date.strftime('%Y%m%d')}-{chapters_per_day}ch",
+                               {'isPermaLink': 'false'}),
+                writer.element('pubDate', pub_datetime.strftime('%a, %d %b %Y %H:%M:%S GMT')),
+                writer.end('item'),
+            ])
             
-        except Exception as e:
-            print(f"Simple feed generation error: {e}")
-            return self._generate_error_feed(str(e))
+            current_date += timedelta(days=1)
+            current_day_number += 1
+        
+        yield writer.end('channel')
+        yield writer.end('rss')
 
     def generate_rss_feed(self, plan_type, start_date_str, chapters_per_day=None, days_to_generate=None, 
                           ot_per_day=0, nt_per_day=0, psalms_per_day=0, proverbs_per_day=0):
         if days_to_generate is None:
             days_to_generate = Config.MAX_DAYS_TO_GENERATE
-            
-        import time
-        generation_start = time.time()
         
+        # Identical feeds requested concurrently are built once and shared
+        feed_key = (plan_type, start_date_str, chapters_per_day, days_to_generate,
+                    ot_per_day, nt_per_day, psalms_per_day, proverbs_per_day,
+                    request.host_url if request else None, datetime.now().date())
+        return self.feed_flight.do(feed_key, self._build_rss_feed, plan_type, start_date_str,
+                                   chapters_per_day, days_to_generate,
+                                   ot_per_day, nt_per_day, psalms_per_day, proverbs_per_day)
+
+    def _build_rss_feed(self, plan_type, start_date_str, chapters_per_day, days_to_generate,
+                        ot_per_day, nt_per_day, psalms_per_day, proverbs_per_day):
         try:
-            start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
-            today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-            
-            # Calculate how many days have passed since start date
-            days_elapsed_since_start = (today - start_date).days
-            
-            print(f"Feed generation started - Start date: {start_date_str}, Today: {today.strftime('%Y-%m-%d')}, Days elapsed: {days_elapsed_since_start}")
+            return ''.join(self.iter_rss_feed(plan_type, start_date_str, chapters_per_day, days_to_generate,
+                                              ot_per_day, nt_per_day, psalms_per_day, proverbs_per_day))
+        except Exception as e:
+            print(f"Feed generation error: {e}")
+            return self._generate_error_feed(str(e))
+
+    def get_feed_schedule(self, plan_type, start_date_str, chapters_per_day, days_to_generate,
+                          ot_per_day=0, nt_per_day=0, psalms_per_day=0, proverbs_per_day=0, today=None):
+        """Return the (date, chapters, day_number) entries a full-text feed shows on the given day"""
+        start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
+        if today is None:
+            today = datetime.now()
+        today = today.replace(hour=0, minute=0, second=0, microsecond=0)
+        
+        # Calculate how many days have passed since start date
+        days_elapsed_since_start = (today - start_date).days
+        
+        print(f"Feed generation started - Start date: {start_date_str}, Today: {today.strftime('%Y-%m-%d')}, Days elapsed: {days_elapsed_since_start}")
+        
+        # Determine the date range for feed generation
+        if days_elapsed_since_start < 0:
+            # Start date is in the future, begin from start date
+            feed_start_date = start_date
+            initial_day_number = 0
+        else:
+            # Start date is in the past, show recent entries
+            # Show last 7 days of entries plus next 7 days
+            days_to_show_before = 30
+            feed_start_date = today - timedelta(days=days_to_show_before)
             
-            # Determine the date range for feed generation
-            if days_elapsed_since_start < 0:
-                # Start date is in the future, begin from start date
+            # Make sure we don't go before the original start date
+            if feed_start_date < start_date:
                 feed_start_date = start_date
-                initial_day_number = 0
-            else:
-                # Start date is in the past, show recent entries
-                # Show last 7 days of entries plus next 7 days
-                days_to_show_before = 30
-                feed_start_date = today - timedelta(days=days_to_show_before)
-                
-                # Make sure we don't go before the original start date
-                if feed_start_date < start_date:
-                    feed_start_date = start_date
-                
-                initial_day_number = (feed_start_date - start_date).days
-            
-            # Generate up to 14 days in the future from today
-            end_date = today + timedelta(days=2)
-            
-            print(f"Feed will cover: {feed_start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
-            
-            # Pre-fetch all chapters with error recovery
-            all_chapters_to_fetch = []
-            current_date = feed_start_date
-            current_day_number = initial_day_number
-            
-            while current_date <= end_date and len(all_chapters_to_fetch) < days_to_generate:
-                if plan_type == 'mixed':
-                    chapters = self.get_mixed_plan_chapters(ot_per_day, nt_per_day, psalms_per_day, 
-                                                          proverbs_per_day, start_date, current_date)
-                else:
-                    chapters = self.get_chapter_for_day(plan_type, start_date, chapters_per_day, current_date)
-                
-                if not chapters:
-                    break
-                    
-                all_chapters_to_fetch.append((current_date, chapters, current_day_number))
-                current_date += timedelta(days=1)
-                current_day_number += 1
-            
-            print(f"Will generate {len(all_chapters_to_fetch)} days of readings")
-            
-            # Pre-fetch with error recovery
-            fetched_data = {}
-            total_chapters = sum(len(chapters) for _, chapters, _ in all_chapters_to_fetch)
-            fetched_count = 0
-            
-            print(f"Pre-fetching {total_chapters} chapters for dates {feed_start_date.strftime('%Y-%m-%d')} to {current_date.strftime('%Y-%m-%d')}...")
-            
-            for date, chapters, day_num in all_chapters_to_fetch:
-                for book, chapter in chapters:
-                    key = (book, chapter)
-                    if key not in fetched_data:
-                        try:
-                            fetched_data[key] = self.text_provider.get_chapter_text(book, chapter)
-                            fetched_count += 1
-                            if fetched_count % 10 == 0:
-                                print(f"Fetched {fetched_count}/{total_chapters} chapters...")
-                        except Exception as e:
-                            print(f"Failed to fetch {book} {chapter}: {e}")
-                            fetched_data[key] = self.text_provider.get_fallback_text(book, chapter)
             
-            # Save cache after fetching
-            self.text_provider.cache.force_save()
-            
-            # Generate RSS
-            rss = Element('rss')
-            rss.set('version', '2.0')
-            rss.set('xmlns:atom', 'http://www.w3.org/2005/Atom')
-            rss.set('xmlns:content', 'http://purl.org/rss/1.0/modules/content/')
-            
-            channel = SubElement(rss, 'channel')
-            
-            title = SubElement(channel, 'title')
-            if plan_type == 'mixed':
-                parts = []
-                if ot_per_day > 0: parts.append(f"{ot_per_day} OT")
-                if nt_per_day > 0: parts.append(f"{nt_per_day} NT")
-                if psalms_per_day > 0: parts.append(f"{psalms_per_day} Ps")
-                if proverbs_per_day > 0: parts.append(f"{proverbs_per_day} Pr")
-                title.text = f"Daily Bible Reading - Mixed Plan ({', '.join(parts)})"
-            else:
-                title.text = f"Daily Bible Reading - {plan_type.upper()} ({chapters_per_day} ch/day)"
-            
-            description = SubElement(channel, 'description')
+            initial_day_number = (feed_start_date - start_date).days
+        
+        # Generate up to 14 days in the future from today
+        end_date = today + timedelta(days=2)
+        
+        print(f"Feed will cover: {feed_start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
+        
+        all_chapters_to_fetch = []
+        current_date = feed_start_date
+        current_day_number = initial_day_number
+        
+        while current_date <= end_date and len(all_chapters_to_fetch) < days_to_generate:
             if plan_type == 'mixed':
-                desc_parts = []
-                if ot_per_day > 0: desc_parts.append(f"{ot_per_day} Old Testament")
-                if nt_per_day > 0: desc_parts.append(f"{nt_per_day} New Testament")
-                if psalms_per_day > 0: desc_parts.append(f"{psalms_per_day} Psalm(s)")
-                if proverbs_per_day > 0: desc_parts.append(f"{proverbs_per_day} Proverb(s)")
-                description.text = f"Daily mixed Bible reading: {', '.join(desc_parts)} per day - all sections cycle infinitely"
+                chapters = self.get_mixed_plan_chapters(ot_per_day, nt_per_day, psalms_per_day, 
+                                                      proverbs_per_day, start_date, current_date)
             else:
-                description.text = f"Complete Bible text for daily reading - {chapters_per_day} chapter{'s' if chapters_per_day > 1 else ''} per day"
-            
-            link = SubElement(channel, 'link')
-            link.text = request.host_url if request else "http://localhost:5000"
-            
-            language = SubElement(channel, 'language')
-            language.text = "en-us"
-            
-            last_build_date = SubElement(channel, 'lastBuildDate')
-            last_build_date.text = datetime.now().strftime('%a, %d %b %Y %H:%M:%S +0000')
+                chapters = self.get_chapter_for_day(plan_type, start_date, chapters_per_day, current_date)
             
-            # Generate items using pre-fetched data
-            for date, chapters, day_num in all_chapters_to_fetch:
-                item = SubElement(channel, 'item')
+            if not chapters:
+                break
                 
-                # Title - use the calculated day number
-                item_title = SubElement(item, 'title')
-                if len(chapters) == 1:
-                    item_title.text = f"Day {day_num + 1}: {chapters[0][0]} {chapters[0][1]} ({date.strftime('%b %d')})"
+            all_chapters_to_fetch.append((current_date, chapters, current_day_number))
+            current_date += timedelta(days=1)
+            current_day_number += 1
+        
+        return all_chapters_to_fetch
+
+    def iter_rss_feed(self, plan_type, start_date_str, chapters_per_day, days_to_generate,
+                      ot_per_day=0, nt_per_day=0, psalms_per_day=0, proverbs_per_day=0):
+        """Yield the full-text RSS feed as text chunks"""
+        all_chapters_to_fetch = self.get_feed_schedule(plan_type, start_date_str, chapters_per_day, days_to_generate,
+                                                       ot_per_day, nt_per_day, psalms_per_day, proverbs_per_day)
+        
+        print(f"Will generate {len(all_chapters_to_fetch)} days of readings")
+        
+        # Start fetching every chapter in the window now; each item below only waits for its own
+        total_chapters = sum(len(chapters) for _, chapters, _ in all_chapters_to_fetch)
+        
+        print(f"Pre-fetching {total_chapters} chapters...")
+        
+        pending_chapters = self.text_provider.submit_chapters(
+            [key for _, chapters, _ in all_chapters_to_fetch for key in chapters]
+        )
+        
+        # Generate RSS
+        writer = FeedWriter()
+        yield writer.declaration()
+        yield writer.start('rss', {
+            'version': '2.0',
+            'xmlns:atom': 'http://www.w3.org/2005/Atom',
+            'xmlns:content': 'http://purl.org/rss/1.0/modules/content/',
+        })
+        yield writer.start('channel')
+        
+        if plan_type == 'mixed':
+            parts = []
+            if ot_per_day > 0: parts.append(f"{ot_per_day} OT")
+            if nt_per_day > 0: parts.append(f"{nt_per_day} NT")
+            if psalms_per_day > 0: parts.append(f"{psalms_per_day} Ps")
+            if proverbs_per_day > 0: parts.append(f"{proverbs_per_day} Pr")
+            yield writer.element('title', f"Daily Bible Reading - Mixed Plan ({', '.join(parts)})")
+        else:
+            yield writer.element('title', f"Daily Bible Reading - {plan_type.upper()} ({chapters_per_day} ch/day)")
+        
+        if plan_type == 'mixed':
+            desc_parts = []
+            if ot_per_day > 0: desc_parts.append(f"{ot_per_day} Old Testament")
+            if nt_per_day > 0: desc_parts.append(f"{nt_per_day} New Testament")
+            if psalms_per_day > 0: desc_parts.append(f"{psalms_per_day} Psalm(s)")
+            if proverbs_per_day > 0: desc_parts.append(f"{proverbs_per_day} Proverb(s)")
+            yield writer.element('description', f"Daily mixed Bible reading: {', '.join(desc_parts)} per day - all sections cycle infinitely")
+        else:
+            yield writer.element('description', f"Complete Bible text for daily reading - {chapters_per_day} chapter{'s' if chapters_per_day > 1 else ''} per day")
+        
+        yield writer.element('link', request.host_url if request else "http://localhost:5000")
+        yield writer.element('language', "en-us")
+        # The feed only changes when the reading day does, so a rebuild the same day keeps the same ETag
+        reading_day = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        yield writer.element('lastBuildDate', reading_day.strftime('%a, %d %b %Y %H:%M:%S +0000'))
+        
+        # Emit each item as soon as its chapters are ready; once the deadline passes,
+        # items still waiting on upstream go out link-only while their fetches finish
+        deadline = feed_deadline()
+        pending_items = 0
+        rendered = 0
+        depth = writer.depth
+        try:
+            for date, chapters, day_num in all_chapters_to_fetch:
+                fetched_data = self.text_provider.collect_chapters(pending_chapters, chapters, deadline)
+                if len(fetched_data) < len(chapters):
+                    pending_items += 1
+                    item = self._render_pending_item(writer, plan_type, date, chapters, day_num, chapters_per_day,
+                                                     ot_per_day, nt_per_day, psalms_per_day, proverbs_per_day)
                 else:
-                    # Group by book type for cleaner titles
-                    nt_books = ['Matthew', 'Mark', 'Luke', 'John', 'Acts', 'Romans', '1 Corinthians', '2 Corinthians', 
-                               'Galatians', 'Ephesians', 'Philippians', 'Colossians', '1 Thessalonians', '2 Thessalonians', 
-                               '1 Timothy', '2 Timothy', 'Titus', 'Philemon', 'Hebrews', 'James', '1 Peter', '2 Peter', 
-                               '1 John', '2 John', '3 John', 'Jude', 'Revelation']
-                    
-                    title_parts = []
-                    for book, ch in chapters:
-                        if book == 'Psalms':
-                            title_parts.append(f"Ps {ch}")
-                        elif book == 'Proverbs':
-                            title_parts.append(f"Pr {ch}")
-                        else:
-                            title_parts.append(f"{book} {ch}")
-                    
-                    item_title.text = f"Day {day_num + 1}: {', '.join(title_parts)} ({date.strftime('%b %d')})"
-                
-                # Description with full Bible text
-                item_description = SubElement(item, 'description')
-                content_parts = []
-                
-                for book, chapter in chapters:
-                    chapter_text = fetched_data.get((book, chapter), self.text_provider.get_fallback_text(book, chapter))
-                    book_display = "Psalm" if book == "Psalms" else book
-                    content_parts.append(f"""
+                    item = self._render_item(writer, plan_type, date, chapters, day_num, fetched_data,
+                                             chapters_per_day, ot_per_day, nt_per_day, psalms_per_day,
+                                             proverbs_per_day)
+                yield item
+                rendered += 1
+        except Exception as e:
+            # The channel header may already be on the wire, so finish a well-formed document
+            # with the remaining days link-only (which also keeps it out of the feed cache)
+            print(f"Feed generation error after {rendered} items, sending the rest link-only: {e}")
+            writer.depth = depth
+            for date, chapters, day_num in all_chapters_to_fetch[rendered:]:
+                pending_items += 1
+                yield self._render_pending_item(writer, plan_type, date, chapters, day_num, chapters_per_day,
+                                                ot_per_day, nt_per_day, psalms_per_day, proverbs_per_day)
+        if pending_items:
+            print(f"Feed deadline reached: {pending_items} items sent link-only")
+        
+        yield writer.end('channel')
+        yield writer.end('rss')
+
+    def _render_chapter_fragment(self, book, chapter, chapter_text):
+        """Return the styled, escaped HTML block for one chapter, shared across feeds"""
+        key = (book, chapter, self.text_provider.version, FRAGMENT_TEMPLATE_VERSION)
+        cached = self.fragment_cache.get(key)
+        # Only reuse a fragment rendered from the same text (a fallback may since have been replaced)
+        if cached is not None and cached[0] == chapter_text:
+            return cached[1]
+        book_display = "Psalm" if book == "Psalms" else book
+        fragment = f"""
 <div style="margin-bottom: 30px;">
     <h2 style="color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 10px;">
         📖 {book_display} {chapter}
     </h2>
     <div style="line-height: 1.6; font-family: 'Georgia', serif; white-space: pre-wrap; margin: 15px 0;">
-{chapter_text}
+{html.escape(chapter_text, quote=False)}
     </div>
 </div>
-                    """.strip())
-                
-                # Add reflection section
-                content_parts.append(f"""
-<div style="background-color: #f8f9fa; padding: 15px; border-left: 4px solid #3498db; margin-top: 20px;">
-    <h3 style="color: #2c3e50; margin-top: 0;">📝 Reflection Questions</h3>
-    <ul style="line-height: 1.6;">
-        <li>What stands out to you in today's reading?</li>
-        <li>How does this passage reveal God's character?</li>
-        <li>What is one thing you can apply from this reading?</li>
-        <li>How do these passages connect with each other?</li>
-    </ul>
-    <p style="margin-bottom: 0;"><strong>🙏 Prayer:</strong> "Lord, thank you for Your Word. Help me understand and apply what I've read today. Amen."</p>
-</div>
-                """)
-                
-                full_content = ''.join(content_parts)
-                item_description.text = f"<![CDATA[{full_content}]]>"
-                
-                # Link to online Bible
-                item_link = SubElement(item, 'link')
-                item_link.text = self._build_blb_url(chapters)
-                
-                # GUID
-                item_guid = SubElement(item, 'guid')
-                if plan_type == 'mixed':
-                    item_guid.text = f"bible-mixed-{date.strftime('%Y%m%d')}-{ot_per_day}ot-{nt_per_day}nt-{psalms_per_day}ps-{proverbs_per_day}pr"
-                else:
-                    item_guid.text = f"bible-{plan_type}-{date.strftime('%Y%m%d')}-{chapters_per_day}ch"
-                item_guid.set('isPermaLink', 'false')
-                
-                # Publication date (6 AM on reading day)
-                item_pub_date = SubElement(item, 'pubDate')
-                pub_datetime = date.replace(hour=6, minute=0, second=0, microsecond=0)
-                item_pub_date.text = pub_datetime.strftime('%a, %d %b %Y %H:%M:%S +0000')
-            
-            # Convert to pretty XML
-            rough_string = tostring(rss, 'utf-8')
-            reparsed = minidom.parseString(rough_string)
-            return reparsed.toprettyxml(indent="  ", encoding='utf-8').decode('utf-8')
-            
-        except Exception as e:
-            print(f"Feed generation error: {e}")
-            return self._generate_error_feed(str(e))
+        """.strip()
+        self.fragment_cache.put(key, (chapter_text, fragment), sys.getsizeof(chapter_text) + sys.getsizeof(fragment))
+        return fragment
+
+    def _render_description(self, chapters, fetched_data):
+        """Join the chapter fragments and reflection footer for one item, shared across feeds"""
+        texts = tuple(fetched_data.get((book, chapter)) or self.text_provider.get_fallback_text(book, chapter)
+                      for book, chapter in chapters)
+        key = (tuple(chapters), self.text_provider.version, FRAGMENT_TEMPLATE_VERSION)
+        cached = self.description_cache.get(key)
+        if cached is not None and cached[0] == texts:
+            return cached[1]
+        parts = [self._render_chapter_fragment(book, chapter, text) for (book, chapter), text in zip(chapters, texts)]
+        parts.append(REFLECTION_FOOTER)
+        description = ''.join(parts)
+        self.description_cache.put(key, (texts, description),
+                                   sys.getsizeof(description) + sum(sys.getsizeof(text) for text in texts))
+        return description
+
+    def _render_item(self, writer, plan_type, date, chapters, day_num, fetched_data, chapters_per_day,
+                     ot_per_day, nt_per_day, psalms_per_day, proverbs_per_day):
+        """Render one full-text <item> as a single chunk"""
+        return self._render_item_with_description(
+            writer, plan_type, date, chapters, day_num, chapters_per_day,
+            ot_per_day, nt_per_day, psalms_per_day, proverbs_per_day,
+            self._render_description(chapters, fetched_data), cdata=True)
+
+    def _render_pending_item(self, writer, plan_type, date, chapters, day_num, chapters_per_day,
+                             ot_per_day, nt_per_day, psalms_per_day, proverbs_per_day):
+        """Render a link-only <item>, like the simple feed's, for chapters that missed the deadline"""
+        chapters_text = ", ".join([self.chapter_label(book, ch) for book, ch in chapters])
+        return self._render_item_with_description(
+            writer, plan_type, date, chapters, day_num, chapters_per_day,
+            ot_per_day, nt_per_day, psalms_per_day, proverbs_per_day,
+            f"Today's reading: {chapters_text}\n\n{PENDING_MARKER} - click the link to read online, or refresh shortly.")
+
+    def _render_item_with_description(self, writer, plan_type, date, chapters, day_num, chapters_per_day,
+                                      ot_per_day, nt_per_day, psalms_per_day, proverbs_per_day, description,
+                                      cdata=False):
+        # Title - use the calculated day number
+        if len(chapters) == 1:
+            item_title = f"Day {day_num + 1}: {self.chapter_label(*chapters[0])} ({date.strftime('%b %d')})"
+        else:
+            title_parts = [self.chapter_label(book, ch, short=True) for book, ch in chapters]
+            item_title = f"Day {day_num + 1}: {', '.join(title_parts)} ({date.strftime('%b %d')})"
+        
+        # GUID (kept the same for pending items so readers update them in place)
+        if plan_type == 'mixed':
+            guid = f"bible-mixed-{date.strftime('%Y%m%d')}-{ot_per_day}ot-{nt_per_day}nt-{psalms_per_day}ps-{proverbs_per_day}pr"
+        else:
+            guid = f"bible-{plan_type}-{date.strftime('%Y%m%d')}-{chapters_per_day}ch"
+        
+        # Publication date (6 AM on reading day)
+        pub_datetime = date.replace(hour=6, minute=0, second=0, microsecond=0)
+        
+        return ''.join([
+            writer.start('item'),
+            writer.element('title', item_title),
+            writer.cdata_element('description', description) if cdata else writer.element('description', description),
+            writer.element('link', self._build_blb_url(chapters)),
+            writer.element('guid', guid, {'isPermaLink': 'false'}),
+            writer.element('pubDate', pub_datetime.strftime('%a, %d %b %Y %H:%M:%S +0000')),
+            writer.end('item'),
+        ])
+
+class CacheWarmer:
+    """Background scheduler that prefetches tomorrow's chapters for recently polled feeds.
+    
+    Shortly before each day boundary it works out what every active feed will show
+    tomorrow and fetches whatever is not cached yet, capped at request_budget
+    upstream fetches per run, so the first reader after midnight gets a warm cache.
+    Only feeds whose schedule computes are tracked, at most max_feeds of them.
+    """
+    def __init__(self, generator, lead_minutes=30, active_days=7, request_budget=300, max_feeds=1000):
+        self.generator = generator
+        self.lead = timedelta(minutes=lead_minutes)
+        self.active_delta = timedelta(days=active_days)
+        self.request_budget = request_budget
+        self.max_feeds = max_feeds
+        self.active_feeds = OrderedDict()
+        self.warmup_jobs = {}
+        # Shared active-feed registry (multi-process mode), see SharedFeedStore
+        self.store = None
+        self.leader_lock = None
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.last_run = None
+        self.last_fetched = 0
+        self.last_deferred = 0
+    
+    def record(self, plan_type, start_date_str, chapters_per_day=None,
+               ot_per_day=0, nt_per_day=0, psalms_per_day=0, proverbs_per_day=0):
+        """Note that a full-text feed was just requested.
+        
+        A feed seen for the first time is only tracked once its schedule computes and
+        has readings, so malformed URLs never reach the warmer. Returns the feed's key,
+        or None if it was not recorded.
+        """
+        key = (plan_type, start_date_str, chapters_per_day, ot_per_day, nt_per_day, psalms_per_day, proverbs_per_day)
+        with self.lock:
+            known = key in self.active_feeds
+        if not known:
+            try:
+                schedule = self.generator.get_feed_schedule(plan_type, start_date_str, chapters_per_day,
+                                                            Config.MAX_DAYS_TO_GENERATE, ot_per_day, nt_per_day,
+                                                            psalms_per_day, proverbs_per_day)
+            except Exception:
+                return None
+            if not schedule:
+                return None
+        self._touch(key)
+        return key
+    
+    def _touch(self, key):
+        now = datetime.now()
+        with self.lock:
+            last_seen = self.active_feeds.pop(key, None)
+            self.active_feeds[key] = now
+            while len(self.active_feeds) > self.max_feeds:
+                self.active_feeds.popitem(last=False)
+        # Tell the other workers at most hourly per feed; the warmer only needs day granularity
+        if self.store is not None and (last_seen is None or now - last_seen > timedelta(hours=1)):
+            self.store.touch_feed(key, now, self.max_feeds)
+    
+    def warm_feed(self, plan_type, start_date_str, chapters_per_day=None,
+                  ot_per_day=0, nt_per_day=0, psalms_per_day=0, proverbs_per_day=0):
+        """Queue a background fetch of a newly created feed's whole window and return immediately"""
+        key = (plan_type, start_date_str, chapters_per_day, ot_per_day, nt_per_day, psalms_per_day, proverbs_per_day)
+        schedule = self.generator.get_feed_schedule(plan_type, start_date_str, chapters_per_day,
+                                                    Config.MAX_DAYS_TO_GENERATE, ot_per_day, nt_per_day,
+                                                    psalms_per_day, proverbs_per_day)
+        if schedule:
+            self._touch(key)
+        futures = self.generator.text_provider.submit_chapters(
+            [chapter for _, chapters, _ in schedule for chapter in chapters]
+        )
+        job = {'total': len(futures), 'ready': 0, 'started': datetime.now().isoformat(), 'finished': None}
+        
+        def chapter_done(future):
+            with self.lock:
+                job['ready'] += 1
+                if job['ready'] == job['total']:
+                    job['finished'] = datetime.now().isoformat()
+        
+        with self.lock:
+            # Keep only today's jobs around for status lookups
+            today = datetime.now().date().isoformat()
+            for old_key in [k for k, old in self.warmup_jobs.items() if old['started'][:10] != today]:
+                del self.warmup_jobs[old_key]
+            self.warmup_jobs[key] = job
+            if not futures:
+                job['finished'] = job['started']
+        for future in futures.values():
+            future.add_done_callback(chapter_done)
+        return job
+    
+    def warmup_status(self, plan_type, start_date_str, chapters_per_day=None,
+                      ot_per_day=0, nt_per_day=0, psalms_per_day=0, proverbs_per_day=0):
+        key = (plan_type, start_date_str, chapters_per_day, ot_per_day, nt_per_day, psalms_per_day, proverbs_per_day)
+        with self.lock:
+            job = self.warmup_jobs.get(key)
+        if job:
+            return dict(job)
+        if self.store is None:
+            return None
+        # Warm-up may have been started by another worker; report progress from the shared cache
+        try:
+            schedule = self.generator.get_feed_schedule(plan_type, start_date_str, chapters_per_day,
+                                                        Config.MAX_DAYS_TO_GENERATE, ot_per_day, nt_per_day,
+                                                        psalms_per_day, proverbs_per_day)
+        except Exception:
+            return None
+        chapters = {chapter for _, day_chapters, _ in schedule for chapter in day_chapters}
+        ready = sum(1 for chapter in chapters if self.generator.text_provider.is_cached(*chapter))
+        return {'total': len(chapters), 'ready': ready, 'started': None,
+                'finished': datetime.now().isoformat() if ready == len(chapters) else None}
+    
+    def warm(self, target_day):
+        """Fetch the uncached chapters every active feed will show on target_day; returns the fetch count"""
+        cutoff = datetime.now() - self.active_delta
+        with self.lock:
+            for key, last_seen in list(self.active_feeds.items()):
+                if last_seen < cutoff:
+                    del self.active_feeds[key]
+            feeds = list(self.active_feeds)
+        if self.store is not None:
+            feeds = list(dict.fromkeys(feeds + list(self.store.active_feeds(cutoff))))
+        
+        provider = self.generator.text_provider
+        uncached = []
+        seen = set()
+        for plan_type, start_date_str, chapters_per_day, *mixed in feeds:
+            try:
+                schedule = self.generator.get_feed_schedule(plan_type, start_date_str, chapters_per_day,
+                                                            Config.MAX_DAYS_TO_GENERATE, *mixed, today=target_day)
+            except Exception as e:
+                print(f"Cache warmer skipping {plan_type} {start_date_str}: {e}")
+                continue
+            for _, chapters, _ in schedule:
+                for book, chapter in chapters:
+                    if (book, chapter) not in seen and not provider.is_cached(book, chapter):
+                        seen.add((book, chapter))
+                        uncached.append((book, chapter))
+        
+        to_fetch = uncached[:self.request_budget]
+        if to_fetch:
+            print(f"Cache warmer fetching {len(to_fetch)} chapters for {target_day.strftime('%Y-%m-%d')} "
+                  f"({len(feeds)} active feeds, {len(uncached) - len(to_fetch)} over budget)")
+            provider.prefetch_chapters(to_fetch)
+            provider.cache.force_save()
+        
+        self.last_run = datetime.now()
+        self.last_fetched = len(to_fetch)
+        self.last_deferred = len(uncached) - len(to_fetch)
+        return len(to_fetch)
+    
+    def seconds_until_next_run(self, now=None):
+        now = now or datetime.now()
+        next_midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        run_at = next_midnight - self.lead
+        if run_at <= now:
+            run_at += timedelta(days=1)
+        return (run_at - now).total_seconds()
+    
+    def _run(self):
+        while not self.stop_event.wait(self.seconds_until_next_run()):
+            tomorrow = (datetime.now() + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+            try:
+                self.warm(tomorrow)
+            except Exception as e:
+                print(f"Cache warmer error: {e}")
+    
+    def start(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name='cache-warmer', daemon=True)
+            self.thread.start()
+    
+    def start_if_leader(self, lock_file):
+        """Start the warmer only in the one worker process holding lock_file.
+        
+        The lock is released when its holder exits, so a replacement worker takes over.
+        """
+        import fcntl
+        handle = open(lock_file, 'w')
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            return False
+        self.leader_lock = handle
+        self.start()
+        return True
+    
+    def stop(self):
+        self.stop_event.set()
+    
+    def stats(self):
+        with self.lock:
+            active = len(self.active_feeds)
+        return {
+            'running': self.thread is not None and self.thread.is_alive(),
+            'active_feeds': active,
+            'last_run': self.last_run.isoformat() if self.last_run else None,
+            'last_fetched': self.last_fetched,
+            'last_deferred': self.last_deferred,
+        }
 
 # Initialize generator
 generator = BibleRSSGenerator()
+feed_cache = FeedCache(Config.FEED_CACHE_MAX_BYTES, precompress=Config.PRECOMPRESS_FEEDS)
+cache_warmer = CacheWarmer(generator, Config.WARMER_LEAD_MINUTES, Config.WARMER_ACTIVE_DAYS,
+                           Config.WARMER_REQUEST_BUDGET, Config.WARMER_MAX_FEEDS)
 
 # HTML Template with mixed plan improvements
 HTML_TEMPLATE = """
@@ -817,9 +3105,42 @@ HTML_TEMPLATE = """
             }
         }
         
+        // Poll the warm-up of a freshly generated feed until all chapters are cached,
+        // giving up after a few minutes or as soon as the server stops reporting progress
+        const WARMUP_MAX_POLLS = 90;
+        let warmupPolls = 0;
+        async function checkWarmup() {
+            const el = document.getElementById('warmup-status');
+            if (!el) return;
+            const stopped = '⏳ Your feed will finish preparing when your reader first fetches it';
+            try {
+                const response = await fetch(el.dataset.statusUrl);
+                const status = response.ok ? await response.json() : null;
+                if (status && status.status === 'ready') {
+                    el.textContent = `✅ Feed ready: ${status.chapters_total} chapters cached`;
+                    return;
+                }
+                if (!status || status.status !== 'warming') {
+                    el.textContent = stopped;
+                    return;
+                }
+                el.textContent = `⏳ Preparing your feed: ${status.chapters_ready}/${status.chapters_total} chapters ready`;
+            } catch (e) {
+                el.textContent = stopped;
+                return;
+            }
+            warmupPolls += 1;
+            if (warmupPolls >= WARMUP_MAX_POLLS) {
+                el.textContent = stopped;
+                return;
+            }
+            setTimeout(checkWarmup, 2000);
+        }
+        
         window.onload = function() {
             checkHealth();
             setInterval(checkHealth, 30000); // Check every 30 seconds
+            checkWarmup();
         }
     </script>
 </head>
@@ -914,6 +3235,9 @@ HTML_TEMPLATE = """
         <h3>✅ Your RSS Feed is Ready!</h3>
         <p><strong>Feed URL:</strong></p>
         <div class="feed-url">{{ feed_url }}</div>
+        {% if status_url %}
+        <p id="warmup-status" data-status-url="{{ status_url }}">⏳ Preparing your feed...</p>
+        {% endif %}
         <p><strong>What you get:</strong></p>
         <ul>
             <li>📖 Complete Bible text for each day's reading</li>
@@ -957,7 +3281,25 @@ def health_check():
     return {
         'status': 'healthy',
         'timestamp': datetime.now().isoformat(),
-        'cache_entries': len(generator.text_provider.cache.cache),
+        'cache_entries': len(generator.text_provider.cache),
+        'cache_loaded': generator.text_provider.cache.loaded.is_set(),
+        'cache_backend': Config.CACHE_BACKEND,
+        'chapter_memory': generator.text_provider.cache.memory.stats(),
+        'cache_refresh': generator.text_provider.cache.refresher.stats(),
+        'cache_persistence': generator.text_provider.cache.persistence_stats(),
+        'corpus_chapters': len(generator.text_provider.corpus),
+        'upstream_connections': {host: session.stats()
+                                 for host, session in generator.text_provider.sessions.items()},
+        'upstream_breakers': {host: breaker.stats()
+                              for host, breaker in generator.text_provider.breakers.items()},
+        'negative_cache': generator.text_provider.negative_cache.stats(),
+        'coalesced_fetches': generator.text_provider.fetch_flight.shared_calls,
+        'coalesced_feeds': generator.feed_flight.shared_calls,
+        'feed_cache': feed_cache.stats(),
+        'fragment_cache': generator.fragment_cache.stats(),
+        'description_cache': generator.description_cache.stats(),
+        'cache_warmer': cache_warmer.stats(),
+        'worker_pid': os.getpid(),
         'version': '1.1.0'
     }, 200
 
@@ -1042,13 +3384,206 @@ def generate_feed():
         proverb_chapters = int(request.args.get('proverb_chapters', 1))
         
         feed_url = f"{request.host_url}feed/mixed/{start_date}/{ot_chapters}-{nt_chapters}-{psalm_chapters}-{proverb_chapters}/feed.rss"
+        warmup_args = ('mixed', start_date, None, ot_chapters, nt_chapters, psalm_chapters, proverb_chapters)
     else:
         chapters = int(request.args.get('chapters', 1))
         feed_url = f"{request.host_url}feed/{plan}/{start_date}/{chapters}/feed.rss"
+        warmup_args = (plan, start_date, chapters)
+    
+    # Start fetching the feed's chapters now so the reader's first poll is served from cache
+    status_url = None
+    try:
+        cache_warmer.warm_feed(*warmup_args)
+        status_url = feed_url[:-len('feed.rss')] + 'status'
+    except Exception as e:
+        print(f"Could not start warm-up for {feed_url}: {e}")
     
     # Return the homepage with the feed URL displayed
     today = datetime.now().strftime('%Y-%m-%d')
-    return render_template_string(HTML_TEMPLATE, today=today, feed_url=feed_url)
+    return render_template_string(HTML_TEMPLATE, today=today, feed_url=feed_url, status_url=status_url)
+
+@app.route('/feed/<plan>/<start_date>/<int:chapters>/status')
+def feed_warmup_status(plan, start_date, chapters):
+    """Report how much of a feed's background warm-up has finished"""
+    return warmup_status_response(cache_warmer.warmup_status(plan, start_date, chapters))
+
+@app.route('/feed/mixed/<start_date>/<mixed_params>/status')
+def mixed_feed_warmup_status(start_date, mixed_params):
+    try:
+        ot_per_day, nt_per_day, psalms_per_day, proverbs_per_day = [int(p) for p in mixed_params.split('-')]
+    except ValueError:
+        return {'error': 'Invalid mixed plan parameters'}, 400
+    return warmup_status_response(cache_warmer.warmup_status('mixed', start_date, None, ot_per_day, nt_per_day,
+                                                             psalms_per_day, proverbs_per_day))
+
+def warmup_status_response(job):
+    if job is None:
+        return {'status': 'unknown'}, 404
+    return {
+        'status': 'ready' if job['finished'] else 'warming',
+        'chapters_ready': job['ready'],
+        'chapters_total': job['total'],
+        'started': job['started'],
+        'finished': job['finished'],
+    }
+
+def standard_feed_key(plan, start_date, chapters, simple_mode, host_url):
+    """Rendered-feed cache key; feeds change once per reading day"""
+    return ('feed', plan, start_date, chapters, simple_mode, host_url, datetime.now().date())
+
+def mixed_feed_key(start_date, ot_per_day, nt_per_day, psalms_per_day, proverbs_per_day, host_url):
+    return ('mixed', start_date, ot_per_day, nt_per_day, psalms_per_day, proverbs_per_day,
+            host_url, datetime.now().date())
+
+def incomplete_feed_max_age(document):
+    """Cache lifetime for a feed with fallback text or pending items, or None if it is complete.
+    
+    Incomplete feeds are not kept for the day; readers are asked to come back once
+    the background fetches or the upstream have had a chance to catch up.
+    """
+    if PENDING_MARKER.encode('utf-8') in document:
+        return Config.PARTIAL_FEED_MAX_AGE
+    if FALLBACK_MARKER.encode('utf-8') in document:
+        return Config.NEGATIVE_CACHE_SECONDS
+    return None
+
+FEED_DEADLINE_KEY = 'bible_rss.feed_deadline'
+
+def feed_deadline():
+    """time.monotonic() value by which a feed's items must be ready, or None without a deadline.
+    
+    The ASGI front end passes down whatever is left of the deadline it spent warming the
+    feed, so the render only waits for the remainder instead of starting a fresh one.
+    """
+    deadline = time.monotonic() + Config.FEED_DEADLINE_SECONDS if Config.FEED_DEADLINE_SECONDS > 0 else None
+    inherited = request.environ.get(FEED_DEADLINE_KEY) if request else None
+    if inherited is not None and (deadline is None or inherited < deadline):
+        return inherited
+    return deadline
+
+def gzip_stream(chunks):
+    """Gzip text chunks incrementally, flushing after each so readers get every item right away"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        yield compressor.compress(chunk.encode('utf-8')) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+# Feeds being streamed right now, by feed cache key. Only the first request for a feed streams
+# it; the others are built in full under the generator's feed_flight, sharing its chapter fetches.
+streaming_feeds = {}
+streaming_feeds_lock = threading.Lock()
+
+def join_stream(cache_key):
+    """Return (future, leader): a new future if nobody is streaming cache_key, else the leader's"""
+    with streaming_feeds_lock:
+        future = streaming_feeds.get(cache_key)
+        if future is not None:
+            return future, False
+        future = streaming_feeds[cache_key] = Future()
+        return future, True
+
+def finish_stream(cache_key, future, document):
+    """Let the next request stream cache_key again, resolving future with the document (None if cut short)"""
+    with streaming_feeds_lock:
+        if streaming_feeds.get(cache_key) is future:
+            del streaming_feeds[cache_key]
+        if future.done():
+            return
+        future.set_result(document)
+
+def stream_feed_response(cache_key, stream_feed, future):
+    """Stream a feed to the client item by item, caching the document once it completes.
+    
+    future comes from join_stream and receives the finished document.
+    """
+    try:
+        chunks = stream_feed()
+        # Validation happens before the first chunk, so bad parameters still get an error feed
+        first_chunk = next(chunks)
+    except Exception as e:
+        print(f"Feed generation error: {e}")
+        finish_stream(cache_key, future, None)
+        return Response(generator._generate_error_feed(str(e)), mimetype='application/rss+xml')
+    
+    def tee():
+        body = [first_chunk]
+        document = None
+        try:
+            yield first_chunk
+            for chunk in chunks:
+                body.append(chunk)
+                yield chunk
+            document = ''.join(body).encode('utf-8')
+            if incomplete_feed_max_age(document) is None:
+                feed_cache.put(cache_key, document)
+        except Exception as e:
+            # iter_rss_feed closes the document itself when rendering fails; this is a last resort
+            print(f"Feed streaming error: {e}")
+        finally:
+            finish_stream(cache_key, future, document)
+    
+    body = tee()
+    # Headers go out before we know whether every item made the deadline, so keep it short;
+    # the next request is answered from the feed cache with full validators
+    response_headers = {'Cache-Control': f'public, max-age={Config.PARTIAL_FEED_MAX_AGE}',
+                        'Vary': 'Accept-Encoding'}
+    if request.accept_encodings['gzip']:
+        body = gzip_stream(body)
+        response_headers['Content-Encoding'] = 'gzip'
+    response = Response(stream_with_context(body), mimetype='application/rss+xml')
+    response.headers.update(response_headers)
+    # Releases the waiting requests even if the body is never iterated
+    response.call_on_close(lambda: finish_stream(cache_key, future, None))
+    return response
+
+def serve_cached_feed(cache_key, build_feed, stream_feed=None):
+    """Serve a feed from the rendered-feed cache, answering conditional requests with 304.
+    
+    Feeds only change once per reading day, so cache_key must include today's date.
+    On a miss the feed is streamed when stream_feed is given and streaming is enabled.
+    """
+    entry = feed_cache.get(cache_key)
+    max_age = None
+    if entry is None and stream_feed is not None and Config.STREAM_FEEDS:
+        future, leader = join_stream(cache_key)
+        if leader:
+            return stream_feed_response(cache_key, stream_feed, future)
+        # The leader's stream only moves as fast as its client reads, so don't block a worker on
+        # it: build_feed below renders a copy from the same chapter fetches
+    if entry is None:
+        document = build_feed().encode('utf-8')
+        max_age = incomplete_feed_max_age(document)
+        if max_age is not None:
+            entry = RenderedFeed(document)
+        else:
+            entry = feed_cache.put(cache_key, document)
+    
+    # Flask-Compress appends the encoding to the ETag (e.g. "abc:gzip"), so accept those too
+    etags = [entry.etag] + [f"{entry.etag}:{encoding}" for encoding in ('gzip', 'br', 'deflate')]
+    not_modified = False
+    if request.if_none_match:
+        not_modified = any(request.if_none_match.contains(etag) for etag in etags)
+    elif request.if_modified_since:
+        not_modified = entry.last_modified <= request.if_modified_since.replace(tzinfo=None)
+    
+    # Pick a stored encoding; setting Content-Encoding keeps Flask-Compress from recompressing
+    encoding = request.accept_encodings.best_match([name for name in ('br', 'gzip') if name in entry.encodings])
+    
+    if not_modified:
+        response = Response(status=304)
+    elif encoding:
+        response = Response(entry.encodings[encoding], mimetype='application/rss+xml')
+        response.headers['Content-Encoding'] = encoding
+    else:
+        response = Response(entry.body, mimetype='application/rss+xml')
+    response.set_etag(f"{entry.etag}:{encoding}" if encoding else entry.etag)
+    response.last_modified = entry.last_modified
+    if max_age is not None:
+        response.headers['Cache-Control'] = f'public, max-age={max_age}'
+    else:
+        response.headers['Cache-Control'] = 'public, max-age=3600'  # Cache for 1 hour
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
 
 @app.route('/feed/<plan>/<start_date>/<int:chapters>/feed.rss')
 def serve_feed(plan, start_date, chapters):
@@ -1062,13 +3597,15 @@ def serve_feed(plan, start_date, chapters):
         if simple_mode:
             print("Using simple mode (no text fetching)")
             # Generate a simple feed without fetching text
-            feed_content = generator.generate_simple_rss_feed(plan, start_date, chapters_per_day=chapters)
+            build_feed = lambda: generator.generate_simple_rss_feed(plan, start_date, chapters_per_day=chapters)
+            stream_feed = None
         else:
-            feed_content = generator.generate_rss_feed(plan, start_date, chapters_per_day=chapters)
-            
-        response = Response(feed_content, mimetype='application/rss+xml')
-        response.headers['Cache-Control'] = 'public, max-age=3600'  # Cache for 1 hour
-        return response
+            cache_warmer.record(plan, start_date, chapters)
+            build_feed = lambda: generator.generate_rss_feed(plan, start_date, chapters_per_day=chapters)
+            stream_feed = lambda: generator.iter_rss_feed(plan, start_date, chapters, Config.MAX_DAYS_TO_GENERATE)
+        
+        cache_key = standard_feed_key(plan, start_date, chapters, simple_mode, request.host_url)
+        return serve_cached_feed(cache_key, build_feed, stream_feed)
     except Exception as e:
         print(f"Error: {e}")
         import traceback
@@ -1091,16 +3628,25 @@ def serve_mixed_feed(start_date, mixed_params):
         print(f"Generating mixed feed: start_date={start_date}, OT:{ot_per_day}, NT:{nt_per_day}, Ps:{psalms_per_day}, Pr:{proverbs_per_day}")
         print(f"Current date: {datetime.now().strftime('%Y-%m-%d')}")
         
-        feed_content = generator.generate_rss_feed(
+        cache_warmer.record('mixed', start_date, None, ot_per_day, nt_per_day, psalms_per_day, proverbs_per_day)
+        build_feed = lambda: generator.generate_rss_feed(
             'mixed', start_date, 
             ot_per_day=ot_per_day, 
             nt_per_day=nt_per_day, 
             psalms_per_day=psalms_per_day, 
             proverbs_per_day=proverbs_per_day
         )
-        response = Response(feed_content, mimetype='application/rss+xml')
-        response.headers['Cache-Control'] = 'public, max-age=3600'  # Cache for 1 hour
-        return response
+        stream_feed = lambda: generator.iter_rss_feed(
+            'mixed', start_date, None, Config.MAX_DAYS_TO_GENERATE,
+            ot_per_day=ot_per_day, 
+            nt_per_day=nt_per_day, 
+            psalms_per_day=psalms_per_day, 
+            proverbs_per_day=proverbs_per_day
+        )
+        
+        cache_key = mixed_feed_key(start_date, ot_per_day, nt_per_day, psalms_per_day, proverbs_per_day,
+                                   request.host_url)
+        return serve_cached_feed(cache_key, build_feed, stream_feed)
     except Exception as e:
         print(f"Error: {e}")
         import traceback
@@ -1111,19 +3657,222 @@ def serve_mixed_feed(start_date, mixed_params):
 @app.after_request
 def add_cache_headers(response):
     if response.mimetype == 'application/rss+xml':
-        response.headers['Cache-Control'] = 'public, max-age=3600'
+        response.headers.setdefault('Cache-Control', 'public, max-age=3600')
     return response
 
+class AsyncFeedServer:
+    """Optional ASGI front end (python app.py asgi).
+    
+    Cold full-text feeds have their missing chapters fetched concurrently on the
+    event loop with an async HTTP client, so slow upstream I/O no longer holds an
+    OS thread per request. Rendering, caching and headers are then delegated to the
+    regular Flask app. Only feeds already rendered in memory are answered inline on
+    the loop; every other request (and every cache lookup that may touch disk) runs
+    in the default executor. The WSGI app stays the default.
+    """
+    FEED_PATH_RE = re.compile(r'^/feed/(?P<plan>[^/]+)/(?P<start_date>[^/]+)/(?P<params>[^/]+)/feed\.rss$')
+    
+    def __init__(self, wsgi_app, generator):
+        self.wsgi_app = wsgi_app
+        self.generator = generator
+        self.client = None
+        self.semaphore = None
+        self.in_flight = {}
+    
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+        
+        body = b''
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get('body', b'')
+            more_body = message.get('more_body', False)
+        
+        feed = self._match_feed(scope)
+        if feed is not None and feed_cache.peek(feed['cache_key']):
+            # A feed rendered in memory is cheap enough to answer on the loop
+            status, headers, response_body = self._call_wsgi(scope, body)
+        else:
+            deadline = None
+            if feed is not None:
+                if Config.FEED_DEADLINE_SECONDS > 0:
+                    deadline = time.monotonic() + Config.FEED_DEADLINE_SECONDS
+                await self.warm_feed(feed, deadline)
+            loop = asyncio.get_running_loop()
+            status, headers, response_body = await loop.run_in_executor(None, self._call_wsgi, scope, body,
+                                                                        deadline)
+        
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers],
+        })
+        await send({'type': 'http.response.body', 'body': response_body})
+    
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                import httpx
+                self.client = httpx.AsyncClient(
+                    limits=httpx.Limits(max_connections=Config.HTTP_POOL_SIZE * 2,
+                                        max_keepalive_connections=Config.HTTP_POOL_SIZE,
+                                        keepalive_expiry=Config.HTTP_KEEPALIVE_SECONDS),
+                    timeout=httpx.Timeout(Config.BIBLE_GATEWAY_TIMEOUT, connect=Config.HTTP_CONNECT_TIMEOUT),
+                )
+                self.semaphore = asyncio.Semaphore(Config.ASYNC_FETCH_CONCURRENCY)
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                if self.client is not None:
+                    await self.client.aclose()
+                self.generator.text_provider.cache.force_save(timeout=Config.SHUTDOWN_FLUSH_SECONDS)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+    
+    def _host_url(self, scope):
+        headers = dict(scope['headers'])
+        host = headers.get(b'host', b'').decode('latin-1')
+        if not host and scope.get('server'):
+            host = f"{scope['server'][0]}:{scope['server'][1]}"
+        return f"{scope.get('scheme', 'http')}://{host}{scope.get('root_path', '')}/"
+    
+    def _match_feed(self, scope):
+        """Return the schedule arguments and cache key for a full-text feed request, else None"""
+        match = self.FEED_PATH_RE.match(scope['path'])
+        if not match or b'simple=true' in scope.get('query_string', b'').lower():
+            return None
+        plan, start_date, params = match.group('plan', 'start_date', 'params')
+        host_url = self._host_url(scope)
+        try:
+            if plan == 'mixed':
+                mixed = [int(p) for p in params.split('-')]
+                if len(mixed) != 4:
+                    return None
+                return {'args': ('mixed', start_date, None, Config.MAX_DAYS_TO_GENERATE, *mixed),
+                        'cache_key': mixed_feed_key(start_date, *mixed, host_url)}
+            chapters = int(params)
+        except ValueError:
+            return None
+        return {'args': (plan, start_date, chapters, Config.MAX_DAYS_TO_GENERATE),
+                'cache_key': standard_feed_key(plan, start_date, chapters, False, host_url)}
+    
+    async def warm_feed(self, feed, deadline=None):
+        """Fetch every uncached chapter of the feed's window concurrently, until deadline"""
+        loop = asyncio.get_running_loop()
+        missing = await loop.run_in_executor(None, self._missing_chapters, feed)
+        if missing:
+            # Stop waiting at the feed deadline; the shielded fetches carry on regardless
+            tasks = [asyncio.ensure_future(self.fetch_chapter(book, chapter)) for book, chapter in missing]
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            await asyncio.wait(tasks, timeout=timeout)
+    
+    def _missing_chapters(self, feed):
+        """Uncached chapters of the feed's window (cache lookups may hit disk, so not on the loop)"""
+        try:
+            schedule = self.generator.get_feed_schedule(*feed['args'])
+        except Exception:
+            # Invalid parameters; the Flask app renders the error feed
+            return set()
+        provider = self.generator.text_provider
+        return {chapter for _, chapters, _ in schedule for chapter in chapters
+                if not provider.is_cached(*chapter)}
+    
+    async def fetch_chapter(self, book, chapter):
+        # Concurrent requests for the same chapter share one upstream fetch
+        key = (book, chapter)
+        task = self.in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_chapter(book, chapter))
+            self.in_flight[key] = task
+            # The WSGI render waits on this instead of submitting its own fetch of the chapter
+            async_fetches = self.generator.text_provider.async_fetches
+            async_fetches[key] = future = Future()
+            task.add_done_callback(partial(self._fetch_done, key, future))
+        return await asyncio.shield(task)
+    
+    def _fetch_done(self, key, future, task):
+        self.in_flight.pop(key, None)
+        self.generator.text_provider.async_fetches.pop(key, None)
+        if task.cancelled():
+            future.cancel()
+        elif task.exception() is not None:
+            future.set_exception(task.exception())
+        else:
+            future.set_result(task.result())
+    
+    async def _fetch_chapter(self, book, chapter):
+        async with self.semaphore:
+            return await self.generator.text_provider.get_chapter_text_async(self.client, book, chapter)
+    
+    def _call_wsgi(self, scope, body, deadline=None):
+        server_name, server_port = scope.get('server') or ('localhost', 80)
+        environ = {
+            'REQUEST_METHOD': scope['method'],
+            'SCRIPT_NAME': scope.get('root_path', ''),
+            'PATH_INFO': scope['path'],
+            'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+            'SERVER_NAME': server_name,
+            'SERVER_PORT': str(server_port),
+            'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': scope.get('scheme', 'http'),
+            'wsgi.input': io.BytesIO(body),
+            'wsgi.errors': sys.stderr,
+            'wsgi.multithread': True,
+            'wsgi.multiprocess': False,
+            'wsgi.run_once': False,
+            FEED_DEADLINE_KEY: deadline,
+        }
+        if scope.get('client'):
+            environ['REMOTE_ADDR'] = scope['client'][0]
+        for name, value in scope['headers']:
+            name = name.decode('latin-1')
+            value = value.decode('latin-1')
+            if name == 'content-type':
+                environ['CONTENT_TYPE'] = value
+            elif name == 'content-length':
+                environ['CONTENT_LENGTH'] = value
+            else:
+                key = 'HTTP_' + name.upper().replace('-', '_')
+                environ[key] = f"{environ[key]},{value}" if key in environ else value
+        
+        response_start = {}
+        def start_response(status, headers, exc_info=None):
+            response_start['status'] = int(status.split(' ', 1)[0])
+            response_start['headers'] = headers
+        
+        result = self.wsgi_app(environ, start_response)
+        try:
+            response_body = b''.join(result)
+        finally:
+            if hasattr(result, 'close'):
+                result.close()
+        return response_start['status'], response_start['headers'], response_body
+
+asgi_app = AsyncFeedServer(app, generator)
+
 # Graceful shutdown handling
 def signal_handler(sig, frame):
     print('Shutting down gracefully...')
-    # Save cache before shutdown
-    generator.text_provider.cache.force_save()
+    # Flush pending cache changes, but don't let a slow disk hold up the exit
+    generator.text_provider.cache.force_save(timeout=Config.SHUTDOWN_FLUSH_SECONDS)
     sys.exit(0)
 
 signal.signal(signal.SIGINT, signal_handler)
 signal.signal(signal.SIGTERM, signal_handler)
 
+def report_cache_size():
+    cache = generator.text_provider.cache
+    if cache.loaded.is_set():
+        print(f"📊 Loaded {len(cache)} cached chapters")
+    else:
+        print("📊 Chapter cache is loading in the background")
+
 def run_bible_rss_server():
     """
     Run the Bible RSS server with full text
@@ -1131,13 +3880,15 @@ def run_bible_rss_server():
     For Railway deployment, this will use the PORT environment variable
     """
     print("🚀 Starting Bible RSS Feed Generator with Full Text...")
-    print(f"📁 Using cache file: {Config.CACHE_FILE}")
+    if Config.CACHE_BACKEND == 'pickle':
+        print(f"📁 Using cache file: {Config.CACHE_FILE}")
+    else:
+        print(f"📁 Using cache database: {Config.CACHE_DB_FILE}")
     print(f"⏰ Cache expiry: {Config.CACHE_EXPIRY_DAYS} days")
     print(f"📖 Default Bible version: {Config.DEFAULT_BIBLE_VERSION}")
     
     # Load existing cache stats
-    if hasattr(generator.text_provider.cache, 'cache'):
-        print(f"📊 Loaded {len(generator.text_provider.cache.cache)} cached chapters")
+    report_cache_size()
     
     print("\n📚 Features:")
     print("• Full Bible text in each RSS item")
@@ -1145,13 +3896,153 @@ def run_bible_rss_server():
     print("• Mixed plan with customizable OT/NT/Psalms/Proverbs")
     print("• All sections cycle infinitely in mixed plans!")
     print("• Persistent caching across restarts")
+    print("• Offline corpus import (python app.py import-corpus <files>)")
+    print(f"• Warm start from cache snapshots ({Config.CACHE_SNAPSHOT_FILE}, python app.py export-snapshot)")
     print("• Health check endpoint at /health")
+    print("• Async serving mode (python app.py asgi)")
+    print("• Multi-process production mode (python app.py production)")
+    if Config.WARMER_ENABLED:
+        print(f"• Daily cache warmer ({Config.WARMER_LEAD_MINUTES} min before midnight)")
     print("• Graceful shutdown with cache saving")
     
+    if Config.WARMER_ENABLED:
+        cache_warmer.start()
+    
     # Start the server
     port = Config.PORT
     print(f"\n🌐 Starting server on port {port}")
     app.run(host='0.0.0.0', port=port, debug=False, threaded=True)
 
+def prepare_for_fork():
+    """Close the master's SQLite handles so forked workers open their own connections"""
+    provider = generator.text_provider
+    # The loader thread won't exist in the workers; let it finish in the master
+    provider.cache.loaded.wait()
+    provider.cache.close()
+    provider.corpus.close()
+    if feed_cache.shared is not None:
+        feed_cache.shared.close()
+
+def run_production_server(workers=None):
+    """
+    Run the app under gunicorn with several worker processes sharing one cache
+    
+    The app is imported once in the master and forked into workers. Chapters live in
+    the SQLite cache and rendered feeds in a SQLite feed store, so every worker sees
+    what the others fetched or rendered, and WAL mode makes their concurrent writes safe.
+    """
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        print("Production mode needs gunicorn: pip install gunicorn")
+        sys.exit(1)
+    
+    workers = workers or Config.WEB_WORKERS
+    if workers > 1 and Config.CACHE_BACKEND == 'pickle':
+        # Each worker would hold its own dict and overwrite the others' pickle file
+        print("The pickle cache cannot be shared between processes; set CACHE_BACKEND=sqlite or use one worker")
+        sys.exit(1)
+    
+    print("🚀 Starting Bible RSS Feed Generator (production mode)...")
+    print(f"📁 Using cache database: {Config.CACHE_DB_FILE}, feed store: {Config.FEED_DB_FILE}")
+    report_cache_size()
+    print(f"👷 {workers} workers x {Config.WEB_THREADS} threads")
+    # Rate limiters live in each process; split the budget so the total stays polite
+    rate, burst = generator.text_provider.split_rate_limits(workers)
+    print(f"🚦 Upstream budget per worker: {rate:g} requests/s, burst {burst}")
+    
+    feed_cache.shared = SharedFeedStore(Config.FEED_DB_FILE, Config.SHARED_FEED_CACHE_MAX_BYTES)
+    cache_warmer.store = feed_cache.shared
+    prepare_for_fork()
+    
+    def post_fork(server, worker):
+        if Config.WARMER_ENABLED and cache_warmer.start_if_leader(f"{Config.FEED_DB_FILE}.warmer.lock"):
+            print(f"Worker {worker.pid} runs the cache warmer")
+    
+    def worker_exit(server, worker):
+        # Replaces signal_handler, which gunicorn overrides in its workers
+        cache_warmer.stop()
+        generator.text_provider.cache.force_save(timeout=Config.SHUTDOWN_FLUSH_SECONDS)
+    
+    options = {
+        'bind': f"0.0.0.0:{Config.PORT}",
+        'workers': workers,
+        'worker_class': 'gthread',
+        'threads': Config.WEB_THREADS,
+        'timeout': Config.WEB_TIMEOUT,
+        'preload_app': True,
+        'post_fork': post_fork,
+        'worker_exit': worker_exit,
+    }
+    
+    class FeedServerApplication(BaseApplication):
+        def load_config(self):
+            for key, value in options.items():
+                self.cfg.set(key, value)
+        
+        def load(self):
+            return app
+    
+    FeedServerApplication().run()
+
+def run_asgi_server():
+    """Serve the app from one asyncio event loop with uvicorn (needs uvicorn and httpx)"""
+    try:
+        import uvicorn
+        import httpx  # noqa: F401 - used by AsyncFeedServer
+    except ImportError:
+        print("ASGI mode needs extra packages: pip install uvicorn httpx")
+        sys.exit(1)
+    
+    print("🚀 Starting Bible RSS Feed Generator (async ASGI mode)...")
+    report_cache_size()
+    if Config.WARMER_ENABLED:
+        cache_warmer.start()
+    
+    port = Config.PORT
+    print(f"\n🌐 Starting server on port {port}")
+    uvicorn.run(asgi_app, host='0.0.0.0', port=port, lifespan='on')
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bible RSS Feed Generator with Full Text")
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.add_parser('serve', help="Run the feed server (default)")
+    subparsers.add_parser('asgi', help="Run the async ASGI server (needs uvicorn and httpx)")
+    production_parser = subparsers.add_parser('production', help="Run several gunicorn worker processes")
+    production_parser.add_argument('--workers', type=int,
+                                   help=f"Worker processes (default: WEB_WORKERS, {Config.WEB_WORKERS})")
+    
+    import_parser = subparsers.add_parser('import-corpus', help="Load a translation from local files")
+    import_parser.add_argument('paths', nargs='+', help="USFM, OSIS/Zefania XML or JSON files, or directories")
+    import_parser.add_argument('--version',
+                               help="Translation the files contain (default: read from OSIS/Zefania "
+                                    "metadata; required for USFM and JSON). Feeds only use it when "
+                                    "DEFAULT_BIBLE_VERSION is set to the same version")
+    import_parser.add_argument('--format', choices=['usfm', 'osis', 'zefania', 'json'],
+                               help="Force a format instead of detecting it per file")
+    
+    export_parser = subparsers.add_parser('export-snapshot', help="Write the chapter cache to a snapshot file")
+    export_parser.add_argument('--output', default=Config.CACHE_SNAPSHOT_FILE,
+                               help="Snapshot to write (default: %(default)s, loaded at startup)")
+    snapshot_parser = subparsers.add_parser('import-snapshot', help="Merge snapshot files into the chapter cache")
+    snapshot_parser.add_argument('paths', nargs='+', help="Snapshots written by export-snapshot")
+    
+    args = parser.parse_args(argv)
+    if args.command == 'import-corpus':
+        try:
+            import_corpus(args.paths, args.version, args.format)
+        except ValueError as e:
+            parser.error(str(e))
+    elif args.command == 'export-snapshot':
+        export_snapshot(args.output, generator.text_provider.cache)
+    elif args.command == 'import-snapshot':
+        import_snapshot(args.paths, generator.text_provider.cache)
+    elif args.command == 'asgi':
+        run_asgi_server()
+    elif args.command == 'production':
+        run_production_server(args.workers)
+    else:
+        run_bible_rss_server()
+
 if __name__ == "__main__":
-    run_bible_rss_server()
+    main()
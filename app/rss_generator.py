@@ -1,3 +1,4 @@
+from array import array
 from datetime import datetime, timedelta
 from xml.etree.ElementTree import Element, SubElement, tostring
 from xml.dom import minidom
@@ -30,6 +31,18 @@ class BibleRSSGenerator:
                 ('2 John', 1), ('3 John', 1), ('Jude', 1), ('Revelation', 22)
             ]
         }
+        # Flattened plans are built once; daily lookups just index into them
+        self.plan_indexes = {plan_type: self._build_plan_index(self.get_plan(plan_type))
+                             for plan_type in ('ot', 'nt', 'full')}
+
+    def _build_plan_index(self, plan):
+        book_names = tuple(book for book, _ in plan)
+        book_ids = array('B')
+        chapter_numbers = array('H')
+        for book_id, (_, count) in enumerate(plan):
+            book_ids.extend([book_id] * count)
+            chapter_numbers.extend(range(1, count + 1))
+        return book_names, book_ids, chapter_numbers
 
     def get_plan(self, plan_type):
         if plan_type == 'ot':
@@ -42,16 +55,14 @@ class BibleRSSGenerator:
             raise ValueError("Invalid plan")
 
     def get_chapters_for_day(self, plan_type, start_date, chapters_per_day, current_date):
-        plan = self.get_plan(plan_type)
+        if plan_type not in self.plan_indexes:
+            raise ValueError("Invalid plan")
+        book_names, book_ids, chapter_numbers = self.plan_indexes[plan_type]
         days_elapsed = (current_date - start_date).days
         chapter_index = days_elapsed * chapters_per_day
 
-        all_chapters = []
-        for book, count in plan:
-            for ch in range(1, count + 1):
-                all_chapters.append((book, ch))
-
-        return all_chapters[chapter_index:chapter_index + chapters_per_day]
+        return [(book_names[book_ids[i]], chapter_numbers[i])
+                for i in range(len(chapter_numbers))[chapter_index:chapter_index + chapters_per_day]]
 
     def generate_rss_feed(self, plan_type, start_date_str, chapters_per_day=1, days_to_generate=30):
         start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
@@ -1,12 +1,100 @@
+import os
+import threading
+import zlib
+from collections import OrderedDict
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 from urllib.parse import quote
 import time
 
+HTTP_POOL_SIZE = int(os.environ.get('HTTP_POOL_SIZE', 8))
+HTTP_CONNECT_TIMEOUT = float(os.environ.get('HTTP_CONNECT_TIMEOUT', 5))
+BIBLE_GATEWAY_TIMEOUT = float(os.environ.get('BIBLE_GATEWAY_TIMEOUT', 15))
+BIBLE_API_TIMEOUT = float(os.environ.get('BIBLE_API_TIMEOUT', 10))
+CHAPTER_MEMORY_MAX_BYTES = int(os.environ.get('CHAPTER_MEMORY_MAX_BYTES', 32 * 1024 * 1024))
+UPSTREAM_REQUESTS_PER_SECOND = float(os.environ.get('UPSTREAM_REQUESTS_PER_SECOND', 2))
+UPSTREAM_BURST = int(os.environ.get('UPSTREAM_BURST', 4))
+
+def _pooled_session(host, pool_size):
+    # One keep-alive pool per upstream host, shared by all request threads
+    session = requests.Session()
+    session.mount(f"https://{host}/", HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=True))
+    return session
+
+class TokenBucket:
+    """Thread-safe token bucket pacing requests to one upstream host"""
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+class ChapterCache:
+    """LRU of zlib-compressed chapter text, bounded by the compressed size"""
+    def __init__(self, max_bytes=CHAPTER_MEMORY_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self.lock:
+            data = self.entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+        return zlib.decompress(data).decode('utf-8')
+
+    def set(self, key, text):
+        data = zlib.compress(text.encode('utf-8'))
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self.entries[key] = data
+            self.size += len(data)
+            while self.size > self.max_bytes and len(self.entries) > 1:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= len(evicted)
+                self.evictions += 1
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {'entries': len(self.entries), 'bytes': self.size, 'max_bytes': self.max_bytes,
+                    'hit_ratio': round(self.hits / lookups, 3) if lookups else None,
+                    'evictions': self.evictions}
+
 class BibleTextProvider:
-    def __init__(self):
-        self.cache = {}
+    def __init__(self, pool_size=HTTP_POOL_SIZE):
+        self.cache = ChapterCache()
         self.version = 'web'
+        self.sessions = {
+            'labs.bible.org': _pooled_session('labs.bible.org', pool_size),
+            'www.biblegateway.com': _pooled_session('www.biblegateway.com', pool_size),
+        }
+        # Only requests that actually go upstream wait, instead of sleeping after every fetch
+        self.rate_limiters = {host: TokenBucket(UPSTREAM_REQUESTS_PER_SECOND, UPSTREAM_BURST)
+                              for host in self.sessions}
 
     def fetch_chapter_text_api(self, book, chapter):
         try:
@@ -16,7 +104,9 @@ class BibleTextProvider:
                 'type': 'json',
                 'formatting': 'plain'
             }
-            response = requests.get(api_url, params=params, timeout=10)
+            self.rate_limiters['labs.bible.org'].acquire()
+            response = self.sessions['labs.bible.org'].get(
+                api_url, params=params, timeout=(HTTP_CONNECT_TIMEOUT, BIBLE_API_TIMEOUT))
             if response.status_code == 200:
                 data = response.json()
                 if data:
@@ -30,7 +120,9 @@ class BibleTextProvider:
         try:
             url = f"https://www.biblegateway.com/passage/?search={quote(book)}+{chapter}&version=WEB&interface=print"
             headers = {'User-Agent': 'Mozilla/5.0'}
-            response = requests.get(url, headers=headers, timeout=15)
+            self.rate_limiters['www.biblegateway.com'].acquire()
+            response = self.sessions['www.biblegateway.com'].get(
+                url, headers=headers, timeout=(HTTP_CONNECT_TIMEOUT, BIBLE_GATEWAY_TIMEOUT))
             if response.status_code == 200:
                 soup = BeautifulSoup(response.content, 'html.parser')
                 div = soup.find('div', class_='passage-text')
@@ -52,9 +144,9 @@ class BibleTextProvider:
 
     def get_chapter_text(self, book, chapter):
         cache_key = f"{book}_{chapter}_{self.version}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        cached_text = self.cache.get(cache_key)
+        if cached_text is not None:
+            return cached_text
         text = self.fetch_chapter_text_api(book, chapter) or                self.fetch_chapter_text_web(book, chapter) or                self.get_fallback_text(book, chapter)
-        self.cache[cache_key] = text
-        time.sleep(0.5)
+        self.cache.set(cache_key, text)
         return text
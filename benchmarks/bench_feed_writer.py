@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Compare FeedWriter against the old ElementTree + minidom pretty-print round trip.
+
+Both renderers get the same channel and items, taken from a full-text feed built
+from the canned corpus. The outputs are checked for equivalence (the old path
+stored CDATA as escaped text, so its descriptions are unwrapped first), then
+timed and measured for peak memory.
+
+    python benchmarks/bench_feed_writer.py [--days N] [--chapters N]
+"""
+
+import argparse
+import os
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+from xml.dom import minidom
+from xml.etree.ElementTree import Element, SubElement, fromstring, tostring
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from common import bench, load_app, report  # noqa: E402
+
+ITEM_FIELDS = ('title', 'description', 'link', 'guid', 'pubDate')
+
+
+def extract_feed(xml_text):
+    """Pull channel fields and item fields back out of a rendered feed"""
+    root = fromstring(xml_text.encode('utf-8'))
+    channel = root.find('channel')
+    fields = [(child.tag, child.text or '') for child in channel if child.tag != 'item']
+    items = [[(tag, item.findtext(tag) or '') for tag in ITEM_FIELDS] for item in channel.iter('item')]
+    return dict(root.attrib), fields, items
+
+
+def render_legacy(rss_attrs, fields, items):
+    rss = Element('rss')
+    for name, value in rss_attrs.items():
+        rss.set(name, value)
+    channel = SubElement(rss, 'channel')
+    for tag, text in fields:
+        SubElement(channel, tag).text = text
+    for item_fields in items:
+        item = SubElement(channel, 'item')
+        for tag, text in item_fields:
+            element = SubElement(item, tag)
+            element.text = f"<![CDATA[{text}]]>" if tag == 'description' else text
+            if tag == 'guid':
+                element.set('isPermaLink', 'false')
+    return minidom.parseString(tostring(rss, 'utf-8')).toprettyxml(indent="  ", encoding='utf-8').decode('utf-8')
+
+
+def render_writer(app_module, rss_attrs, fields, items, indent="  "):
+    writer = app_module.FeedWriter(indent)
+    chunks = [writer.declaration(), writer.start('rss', rss_attrs), writer.start('channel')]
+    chunks.extend(writer.element(tag, text) for tag, text in fields)
+    for item_fields in items:
+        chunks.append(writer.start('item'))
+        for tag, text in item_fields:
+            if tag == 'description':
+                chunks.append(writer.cdata_element(tag, text))
+            elif tag == 'guid':
+                chunks.append(writer.element(tag, text, {'isPermaLink': 'false'}))
+            else:
+                chunks.append(writer.element(tag, text))
+        chunks.append(writer.end('item'))
+    chunks.extend([writer.end('channel'), writer.end('rss')])
+    return ''.join(chunks)
+
+
+def normalized(xml_text):
+    _, fields, items = extract_feed(xml_text)
+    unwrap = lambda text: text[9:-3] if text.startswith('<![CDATA[') and text.endswith(']]>') else text
+    return fields, [[(tag, unwrap(text)) for tag, text in item] for item in items]
+
+
+def peak_memory(fn):
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--days', type=int, default=33)
+    parser.add_argument('--chapters', type=int, default=3)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    app_module = load_app()
+    start_date = (datetime.now() - timedelta(days=20)).strftime('%Y-%m-%d')
+    feed = app_module.generator.generate_rss_feed('full', start_date, chapters_per_day=args.chapters,
+                                                  days_to_generate=args.days)
+    rss_attrs, fields, items = extract_feed(feed)
+
+    legacy = render_legacy(rss_attrs, fields, items)
+    streamed = render_writer(app_module, rss_attrs, fields, items)
+    if normalized(legacy) != normalized(streamed):
+        sys.exit("FeedWriter output does not match the minidom output")
+    print(f"{len(items)} items, {len(streamed.encode('utf-8')) / 1024:.1f} KB; outputs are equivalent")
+
+    report("minidom round trip", *bench(lambda: render_legacy(rss_attrs, fields, items), args.repeat))
+    report("FeedWriter (indented)", *bench(lambda: render_writer(app_module, rss_attrs, fields, items), args.repeat))
+    report("FeedWriter (compact)",
+           *bench(lambda: render_writer(app_module, rss_attrs, fields, items, indent=None), args.repeat))
+    print(f"peak memory: minidom {peak_memory(lambda: render_legacy(rss_attrs, fields, items)) / 1024:.0f} KB, "
+          f"FeedWriter {peak_memory(lambda: render_writer(app_module, rss_attrs, fields, items)) / 1024:.0f} KB")
+
+
+if __name__ == '__main__':
+    main()
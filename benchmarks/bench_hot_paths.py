@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""Offline microbenchmarks for the feed generation hot paths, checked against a baseline.
+
+Covers reading-plan lookups over several window sizes, full-text and simple feed
+generation for every plan, FeedWriter serialization, Blue Letter Bible URL
+building, PersistentCache load/save/get at several sizes and passage extraction
+on the saved pages in benchmarks/fixtures. Chapter text comes from the canned
+corpus in common.py, so nothing touches the network.
+
+Every case is warmed up untimed, with the app's background threads idle, before
+its median time is compared with benchmarks/baselines/hot_paths.json. A case that
+is slower than the baseline by more than --threshold is measured again, and the
+script exits non-zero only when the slowdown shows up both times. Baselines only
+really mean something on the machine that recorded them; the committed one is an
+example from a development VM, and comparing against a baseline from another host
+or CPU prints a warning. Run with --save on your own machine first, and again
+after an intended change in speed.
+
+    python benchmarks/bench_hot_paths.py [--save] [--threshold 0.25] [--only TEXT] [--quick]
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import platform
+import random
+import socket
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_feed_writer import extract_feed, render_writer  # noqa: E402
+from common import bench, canned_chapter_text, load_app, report  # noqa: E402
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, 'baselines', 'hot_paths.json')
+PLANS = ('ot', 'nt', 'full', 'psalms', 'proverbs')
+MIXED = {'ot_per_day': 2, 'nt_per_day': 1, 'psalms_per_day': 1, 'proverbs_per_day': 1}
+WINDOWS = (7, 30, 365)
+CACHE_SIZES = (1000, 10000, 50000)
+LOOKUPS = 1000
+
+
+@contextlib.contextmanager
+def quiet():
+    """Swallow the app's progress prints (from every thread) while timing"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def machine_id():
+    """Host, CPU model and Python version; a baseline is only comparable on the same one"""
+    cpu = platform.processor() or platform.machine()
+    try:
+        with open('/proc/cpuinfo') as f:
+            cpu = next(line.split(':', 1)[1].strip() for line in f if line.startswith('model name'))
+    except (OSError, StopIteration):
+        pass
+    return f"{socket.gethostname()}, {cpu}, Python {platform.python_version()}"
+
+
+def settle(app_module, timeout=30):
+    """Wait for the chapter cache's loader, saver and refresh threads to go idle"""
+    cache = app_module.generator.text_provider.cache
+    loaded = getattr(cache, 'loaded', None)
+    if loaded is not None:
+        loaded.wait(timeout)
+    cache.force_save()
+    deadline = time.monotonic() + timeout
+    while cache.refresher.stats()['in_flight'] and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def warm_up(fn, seconds=0.1):
+    """Run fn untimed for a while so caches, allocators and lazy imports are settled"""
+    deadline = time.perf_counter() + seconds
+    fn()
+    while time.perf_counter() < deadline:
+        fn()
+
+
+def calibrate(fn, min_seconds=0.2):
+    """Calls per round so that a round takes at least min_seconds, keeping timer noise small"""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        if time.perf_counter() - start >= min_seconds:
+            return number
+        number *= 2
+
+
+def plan_cases(generator, start_date):
+    for days in WINDOWS:
+        dates = [start_date + timedelta(days=day) for day in range(days)]
+        yield (f"get_chapter_for_day full x3, {days} days",
+               lambda dates=dates: [generator.get_chapter_for_day('full', start_date, 3, date) for date in dates])
+        yield (f"get_mixed_plan_chapters 2-1-1-1, {days} days",
+               lambda dates=dates: [generator.get_mixed_plan_chapters(2, 1, 1, 1, start_date, date)
+                                    for date in dates])
+
+
+def blb_cases(generator, start_date):
+    days = [generator.get_chapter_for_day('full', start_date, 3, start_date + timedelta(days=day))
+            for day in range(365)]
+    singles = [[chapter] for chapters in days for chapter in chapters]
+    yield "_build_blb_url single chapters, 1095 calls", lambda: [generator._build_blb_url(c) for c in singles]
+    yield "_build_blb_url 3-chapter ranges, 365 calls", lambda: [generator._build_blb_url(c) for c in days]
+
+
+def feed_cases(app_module, start_date_str):
+    generator = app_module.generator
+    for plan in PLANS:
+        yield (f"generate_rss_feed {plan}",
+               lambda plan=plan: generator.generate_rss_feed(plan, start_date_str, chapters_per_day=3))
+    yield "generate_rss_feed mixed 2-1-1-1", lambda: generator.generate_rss_feed('mixed', start_date_str, **MIXED)
+    for plan in PLANS:
+        yield (f"generate_simple_rss_feed {plan}",
+               lambda plan=plan: generator.generate_simple_rss_feed(plan, start_date_str, chapters_per_day=3))
+
+    with quiet():
+        feed = generator.generate_rss_feed('full', start_date_str, chapters_per_day=3, days_to_generate=33)
+    rss_attrs, fields, items = extract_feed(feed)
+    yield (f"FeedWriter serialization, {len(items)} items",
+           lambda: render_writer(app_module, rss_attrs, fields, items))
+
+
+def cache_cases(app_module, scratch, sizes, selected):
+    for size in sizes:
+        names = [f"PersistentCache load, {size} entries", f"PersistentCache save, {size} entries",
+                 f"PersistentCache get x{LOOKUPS}, {size} entries"]
+        if not any(map(selected, names)):
+            continue  # seeding the larger caches takes a while
+        path = os.path.join(scratch, f"cache_{size}.pkl")
+        open_cache = lambda path=path: app_module.PersistentCache(path, save_debounce=3600, max_delay=3600)
+        with quiet():
+            cache = open_cache()
+            for n in range(size):
+                cache.set(f"Book{n // 150}_{n % 150 + 1}_web", canned_chapter_text(f"Book{n // 150}", n % 150 + 1))
+            cache.force_save()
+        keys = random.Random(size).choices([key for key, *_ in cache.memory.entries()], k=LOOKUPS)
+
+        def save(cache=cache):
+            cache._mark_dirty()
+            cache.force_save()
+
+        yield names[0], lambda open_cache=open_cache: open_cache().loaded.wait()
+        yield names[1], save
+        yield names[2], lambda cache=cache, keys=keys: [cache.get(key) for key in keys]
+
+
+def extraction_cases(provider):
+    for path in sorted(glob.glob(os.path.join(BENCH_DIR, 'fixtures', 'biblegateway_*.html'))):
+        content = open(path, 'rb').read()
+        name = os.path.basename(path)[len('biblegateway_'):-len('.html')]
+        yield f"extract_passage_text {name}", lambda content=content: provider.extract_passage_text(content)
+
+
+def run_cases(app_module, args):
+    start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=7)
+    start_date_str = start.strftime('%Y-%m-%d')
+    scratch = tempfile.mkdtemp(prefix='bible-bench-cache-')
+    generator = app_module.generator
+    sizes = CACHE_SIZES[:1] if args.quick else CACHE_SIZES
+    selected = lambda name: not args.only or args.only in name
+
+    # Fill the chapter cache once so feed timings measure rendering, not canned fetches
+    with quiet():
+        for plan in PLANS:
+            generator.generate_rss_feed(plan, start_date_str, chapters_per_day=3)
+        generator.generate_rss_feed('mixed', start_date_str, **MIXED)
+
+    groups = (plan_cases(generator, start), blb_cases(generator, start), feed_cases(app_module, start_date_str),
+              cache_cases(app_module, scratch, sizes, selected), extraction_cases(generator.text_provider))
+    cases = {}
+    results = {}
+    for group in groups:
+        for name, fn in group:
+            if not selected(name):
+                continue
+            cases[name] = fn
+            results[name] = measure(app_module, name, fn, args.repeat)
+    return cases, results
+
+
+def measure(app_module, name, fn, repeat):
+    with quiet():
+        settle(app_module)
+        warm_up(fn)
+        best, median = bench(fn, repeat, calibrate(fn))
+    report(name, best, median)
+    return {'best': best, 'median': median}
+
+
+def compare(results, baseline, threshold):
+    """Print each case's median against the baseline's; returns the names that regressed"""
+    regressions = []
+    print(f"\nAgainst baseline from {baseline['meta']['created']} ({baseline['meta']['machine']}), "
+          f"threshold {threshold:.0%}")
+    for name, result in results.items():
+        previous = baseline['results'].get(name)
+        if previous is None:
+            print(f"  {name:<55} new case")
+            continue
+        ratio = result['median'] / previous['median']
+        if ratio > 1 + threshold:
+            flag = 'REGRESSION'
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            flag = 'faster'
+        else:
+            flag = 'ok'
+        print(f"  {name:<55} {ratio:6.2f}x  {flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="Baseline file (default: %(default)s)")
+    parser.add_argument('--save', action='store_true', help="Record these results as the new baseline")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="Slowdown that counts as a regression, as a fraction (default: %(default)s)")
+    parser.add_argument('--only', help="Run only cases whose name contains this text")
+    parser.add_argument('--quick', action='store_true', help=f"Only the {CACHE_SIZES[0]}-entry cache cases")
+    parser.add_argument('--repeat', type=int, default=11)
+    args = parser.parse_args()
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    if not args.save:
+        if baseline is None:
+            sys.exit(f"No baseline at {args.baseline}; record one with --save")
+        if baseline['meta']['machine'] != machine_id():
+            print(f"Warning: baseline {args.baseline} was recorded on {baseline['meta']['machine']}, "
+                  f"not {machine_id()}; differences may just be the hardware. "
+                  f"Record one on this machine with --save.\n")
+
+    with quiet():
+        app_module = load_app()
+    cases, results = run_cases(app_module, args)
+
+    if args.save:
+        # A partial run (--only, --quick) only replaces the cases it ran, unless the
+        # old baseline came from another machine
+        if baseline is None or baseline['meta']['machine'] != machine_id():
+            baseline = {'results': {}}
+        baseline['results'].update(results)
+        baseline['meta'] = {'created': datetime.now().isoformat(timespec='seconds'), 'machine': machine_id()}
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"\nSaved {len(results)} results to {args.baseline}")
+        return
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        # A one-off slowdown is usually noise from elsewhere on the machine; only fail on a repeat
+        print(f"\nMeasuring {len(regressions)} slower case(s) again")
+        retried = {name: measure(app_module, name, cases[name], args.repeat) for name in regressions}
+        regressions = compare(retried, baseline, args.threshold)
+    if regressions:
+        sys.exit(f"\n{len(regressions)} case(s) regressed by more than {args.threshold:.0%} twice")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Check and time the fast passage extractor against the full-page reference.
+
+Every saved page in benchmarks/fixtures is run through extract_passage_text (strained
+parse of the passage container, single-pass footnote stripping) and through
+extract_passage_text_full (whole-page parse and decompose, the original extractor).
+With html.parser (the default) the outputs must match; the script exits non-zero
+on the first mismatch, so it doubles as the equivalence check for the fast path.
+lxml nests unclosed <p> elements differently (see the nested_paragraphs fixture),
+so its mismatches are listed but do not fail the run.
+
+The fixtures mimic Bible Gateway's print markup (footnotes, cross-references,
+poetry, page chrome) around public-domain World English Bible text, plus pages
+that exercise the fallback selectors.
+
+    python benchmarks/bench_passage_extraction.py [--repeat N] [--number N]
+"""
+
+import argparse
+import glob
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from common import bench, load_app, report  # noqa: E402
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def available_parsers(app_module):
+    return ['html.parser'] + (['lxml'] if app_module.lxml is not None else [])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--number', type=int, default=10)
+    args = parser.parse_args()
+
+    app_module = load_app()
+    provider = app_module.generator.text_provider
+    pages = {os.path.basename(path): open(path, 'rb').read()
+             for path in sorted(glob.glob(os.path.join(FIXTURES, 'biblegateway_*.html')))}
+    if not pages:
+        sys.exit(f"No fixtures found in {FIXTURES}")
+
+    for parser_name in available_parsers(app_module):
+        app_module.Config.PASSAGE_PARSER = parser_name
+        for name, content in pages.items():
+            expected = provider.extract_passage_text_full(content)
+            if provider.extract_passage_text(content) == expected:
+                continue
+            if parser_name == 'html.parser':
+                sys.exit(f"{name}: fast extractor ({parser_name}) does not match the reference")
+            print(f"{name}: fast extractor ({parser_name}) differs from the reference")
+    app_module.Config.PASSAGE_PARSER = 'html.parser'
+    print(f"{len(pages)} fixtures; html.parser output is equivalent to the reference")
+
+    for name, content in pages.items():
+        print(f"\n{name} ({len(content) / 1024:.1f} KB)")
+        report("  reference (full page, html.parser)",
+               *bench(lambda: provider.extract_passage_text_full(content), args.repeat, args.number))
+        for parser_name in available_parsers(app_module):
+            app_module.Config.PASSAGE_PARSER = parser_name
+            report(f"  fast ({parser_name})",
+                   *bench(lambda: provider.extract_passage_text(content), args.repeat, args.number))
+
+
+if __name__ == '__main__':
+    main()
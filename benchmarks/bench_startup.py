@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Time how long app.py takes to import and to answer its first cache lookup.
+
+A chapter cache of --chapters entries is seeded for each backend, then a fresh
+interpreter running under ``python -X importtime`` imports app.py against it and
+reports three times: the import itself (what a health check waits for before the
+port is bound), the first lookup of a seeded chapter, and the point where the
+cache has finished loading. The slowest top-level imports from the importtime
+log are listed after each run.
+
+    python benchmarks/bench_startup.py [--chapters N] [--repeat N] [--top N]
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from common import ROOT, canned_chapter_text, load_app  # noqa: E402
+
+SEED_KEY = 'Genesis_1_web'
+
+
+def child():
+    """Runs in the measured interpreter: import app.py and time the first lookup"""
+    start = time.perf_counter()
+    spec = importlib.util.spec_from_file_location('bible_app', os.path.join(ROOT, 'app.py'))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['bible_app'] = module
+    spec.loader.exec_module(module)
+    imported = time.perf_counter()
+    cache = module.generator.text_provider.cache
+    found = cache.get(SEED_KEY) is not None
+    looked_up = time.perf_counter()
+    loaded = getattr(cache, 'loaded', None)
+    if loaded is not None:
+        loaded.wait()
+    ready = time.perf_counter()
+    print(json.dumps({
+        'import': imported - start,
+        'first_lookup': looked_up - imported,
+        'ready': ready - start,
+        'found': found,
+        'modules': sorted(name for name in ('bs4', 'requests') if name in sys.modules),
+    }))
+
+
+def seed(app_module, scratch, chapters):
+    """Write a pickle cache and a SQLite cache holding the same chapters"""
+    keys = [SEED_KEY] + [f"Book{n // 50}_{n % 50 + 1}_web" for n in range(1, chapters)]
+    pickle_cache = app_module.PersistentCache(os.path.join(scratch, 'seed_cache.pkl'))
+    sqlite_cache = app_module.SQLiteCache(os.path.join(scratch, 'seed_cache.db'))
+    for key in keys:
+        book, chapter, _ = key.rsplit('_', 2)
+        text = canned_chapter_text(book, int(chapter))
+        pickle_cache.set(key, text)
+        sqlite_cache.set(key, text)
+    pickle_cache.force_save()
+    sqlite_cache.force_save()
+
+
+def top_imports(log, limit):
+    """(cumulative seconds, package) for the slowest top-level imports in a -X importtime log"""
+    timings = []
+    for line in log.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if not name[1:].startswith(' '):  # nested imports are indented
+            timings.append((int(cumulative) / 1e6, name.strip()))
+    return sorted(timings, reverse=True)[:limit]
+
+
+def run(backend, scratch, repeat):
+    env = dict(os.environ,
+               CACHE_BACKEND=backend,
+               CACHE_FILE=os.path.join(scratch, 'seed_cache.pkl'),
+               CACHE_DB_FILE=os.path.join(scratch, 'seed_cache.db'),
+               CORPUS_DB_FILE=os.path.join(scratch, 'no_corpus.db'),
+               WARMER_ENABLED='false')
+    results, log = [], ''
+    for _ in range(repeat):
+        proc = subprocess.run([sys.executable, '-X', 'importtime', os.path.abspath(__file__), '--child'],
+                              env=env, capture_output=True, text=True, check=True)
+        results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+        log = proc.stderr
+    return results, log
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--chapters', type=int, default=1189)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--top', type=int, default=8)
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        return child()
+
+    app_module = load_app()
+    scratch = os.path.dirname(app_module.Config.CACHE_FILE)
+    seed(app_module, scratch, args.chapters)
+
+    for backend in ('sqlite', 'pickle'):
+        results, log = run(backend, scratch, args.repeat)
+        print(f"\n{backend} backend, {args.chapters} cached chapters, {args.repeat} runs")
+        for field, label in (('import', 'import app.py'), ('first_lookup', 'first cache lookup'),
+                             ('ready', 'cache fully loaded')):
+            timings = [result[field] for result in results]
+            print(f"  {label:<25} best {min(timings) * 1000:8.1f} ms   "
+                  f"median {statistics.median(timings) * 1000:8.1f} ms")
+        if not all(result['found'] for result in results):
+            sys.exit(f"{backend}: first lookup missed the seeded chapter")
+        print(f"  scraping modules imported at startup: {', '.join(results[-1]['modules']) or 'none'}")
+        if args.top:
+            print("  slowest top-level imports (last run):")
+        for seconds, name in top_imports(log, args.top):
+            print(f"    {seconds * 1000:8.1f} ms  {name}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""Shared helpers for the offline benchmarks.
+
+The benchmarks import app.py directly (the app/ package shadows it for a plain
+``import app``), point every cache at a scratch directory and swap the upstream
+fetchers for a canned corpus so nothing touches the network.
+"""
+
+import gc
+import importlib.util
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_app_module = None
+
+
+def load_app():
+    """Import app.py once, with caches in a scratch directory and canned chapter text"""
+    global _app_module
+    if _app_module is not None:
+        return _app_module
+
+    scratch = tempfile.mkdtemp(prefix='bible-bench-')
+    os.environ['CACHE_FILE'] = os.path.join(scratch, 'bible_cache.pkl')
+    os.environ['CACHE_DB_FILE'] = os.path.join(scratch, 'bible_cache.db')
+    os.environ['CORPUS_DB_FILE'] = os.path.join(scratch, 'bible_corpus.db')
+
+    spec = importlib.util.spec_from_file_location('bible_app', os.path.join(ROOT, 'app.py'))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['bible_app'] = module
+    spec.loader.exec_module(module)
+
+    provider = module.generator.text_provider
+    provider.fetch_chapter_text_web = canned_chapter_text
+    provider.fetch_chapter_text_api = canned_chapter_text
+    provider.fetch_chapter_range_web = canned_chapter_range
+    provider.fetch_chapter_range_api = canned_chapter_range
+    _app_module = module
+    return module
+
+
+def canned_chapter_text(book, chapter, verses=30):
+    """Deterministic stand-in for a scraped chapter (about 4 KB, with markup-sensitive characters)"""
+    return "\n\n".join(
+        f"{verse} {book} {chapter}:{verse} — \"Grace & peace\" to you <from> the one who is, "
+        f"who was and who is to come; verse text padded to a realistic length."
+        for verse in range(1, verses + 1)
+    )
+
+
+def canned_chapter_range(book, first, last):
+    return {chapter: canned_chapter_text(book, chapter) for chapter in range(first, last + 1)}
+
+
+def bench(fn, repeat=5, number=1):
+    """Return (best, median) seconds per call of fn over repeat rounds of number calls.
+
+    The garbage collector is paused while timing, as timeit does, so a collection
+    triggered by earlier work does not land in a random round.
+    """
+    timings = []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                fn()
+            timings.append((time.perf_counter() - start) / number)
+    finally:
+        gc.enable()
+    return min(timings), statistics.median(timings)
+
+
+def report(name, best, median):
+    print(f"{name:<55} best {best * 1000:9.3f} ms   median {median * 1000:9.3f} ms")